@@ -70,5 +70,18 @@ napps.createUser(
     roles: [ { role: "dbAdmin", db: "napps" } ]
   }
 );
+// one database per shard when running the tests in parallel (pytest-xdist),
+// named <MONGO_DBNAME>_gwN as in tests/helpers.py
+for (let i = 0; i < Number(process.env["MONGO_SHARDS"] || 8); i++) {
+  shardName = (process.env["MONGO_DBNAME"] || "napps") + "_gw" + i;
+  shard = db.getSiblingDB(shardName);
+  shard.createUser(
+    {
+      user: process.env["MONGO_USERNAME"],
+      pwd: process.env["MONGO_PASSWORD"],
+      roles: [ { role: "dbAdmin", db: shardName } ]
+    }
+  );
+}
 print("done all users have been created.");
 EOF
@@ -0,0 +1,144 @@
+"""Support for the benchmark suites (tests/test_bench_NN_<napp>.py).
+
+The benchmarks are marked with ``@pytest.mark.benchmark`` and only run
+with ``--benchmark`` (or BENCHMARK=1). Their parameters come from
+environment variables (see bench_param) and each benchmark stores its
+result as JSON in the ``--benchmark-output`` directory (BENCHMARK_OUTPUT,
+``benchmarks`` by default), with the git commit and switch class, so
+the results of different releases can be compared.
+"""
+import json
+import math
+import os
+import platform
+import statistics
+import time
+
+from tests.duration_history import git_commit
+
+BENCHMARK_OUTPUT = os.environ.get("BENCHMARK_OUTPUT", "benchmarks")
+
+
+def bench_param(name, default):
+    """Return the BENCH_<NAME> environment variable converted to the type
+    of default (a list of ints for comma separated values)."""
+    value = os.environ.get(f"BENCH_{name.upper()}")
+    if value is None:
+        return default
+    if isinstance(default, (list, tuple)):
+        return [int(item) for item in value.split(",") if item]
+    return type(default)(value)
+
+
+def percentile(values, pct):
+    """Percentile of the values with linear interpolation."""
+    values = sorted(values)
+    if not values:
+        return None
+    rank = (len(values) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def distribution(values):
+    """Return the count, min, mean, p50, p95, p99 and max of the values."""
+    values = [value for value in values if value is not None]
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "min": min(values),
+        "mean": statistics.fmean(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values),
+    }
+
+
+def histogram(values, bins=20):
+    """Return [(bin start, bin end, count)] of the values in equal bins."""
+    values = [value for value in values if value is not None]
+    if not values:
+        return []
+    low, high = min(values), max(values)
+    width = (high - low) / bins or 1
+    counts = [0] * bins
+    for value in values:
+        counts[min(int((value - low) / width), bins - 1)] += 1
+    return [
+        (low + i * width, low + (i + 1) * width, count)
+        for i, count in enumerate(counts)
+    ]
+
+
+def scaling_exponent(points):
+    """Return the slope of the least squares line of log(y) against
+    log(x) for the (x, y) points: about 1 when y grows linearly with x,
+    more when it grows super-linearly. None with less than two points."""
+    points = [(math.log(x), math.log(y)) for x, y in points if x and y]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sum(
+        (x - mean_x) ** 2 for x, _ in points
+    )
+
+
+def chunks(items, size):
+    """Split the items in lists of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def evc_payloads(pairs, count, first_vlan=100):
+    """EVC payloads spread over the UNI pairs, with one VLAN per EVC."""
+    max_count = len(pairs) * (4095 - first_vlan)
+    assert count <= max_count, f"at most {max_count} EVCs with {len(pairs)} UNI pairs"
+    payloads = []
+    for index in range(count):
+        uni_a, uni_z = pairs[index % len(pairs)]
+        vlan = first_vlan + index // len(pairs)
+        payloads.append({
+            "name": f"bench_{index}",
+            "enabled": True,
+            "dynamic_backup_path": True,
+            "uni_a": {"interface_id": uni_a, "tag": {"tag_type": "vlan", "value": vlan}},
+            "uni_z": {"interface_id": uni_z, "tag": {"tag_type": "vlan", "value": vlan}},
+        })
+    return payloads
+
+
+class BenchmarkResult:
+    """Result of a benchmark run, saved as JSON by save()."""
+
+    def __init__(self, name, **params):
+        self.name = name
+        self.params = params
+        self.metrics = {}
+        self.created = time.time()
+
+    def add(self, **metrics):
+        self.metrics.update(metrics)
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "created": self.created,
+            "git_commit": git_commit(),
+            "switch_class": os.environ.get("SWITCH_CLASS") or "OVSSwitch",
+            "host": platform.node(),
+            "params": self.params,
+            "metrics": self.metrics,
+        }
+
+    def save(self, directory=None):
+        """Write the result to <directory>/<name>-<timestamp>.json and
+        return the path."""
+        directory = directory or BENCHMARK_OUTPUT
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.created))
+        path = os.path.join(directory, f"{self.name}-{stamp}.json")
+        with open(path, "w") as f:
+            json.dump(self.as_dict(), f, indent=2)
+        return path
@@ -1,15 +1,165 @@
+import os
+import sys
 import pytest
+from collections import defaultdict
 from datetime import datetime
 
+from tests import benchmark
+from tests.duration_history import DurationHistory
+from tests.scheduling import schedule
+from tests.wait_accounting import WaitAccounting
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--wait-accounting", metavar="path",
+        default=os.environ.get("WAIT_ACCOUNTING"),
+        help="account the time spent sleeping, waiting for the API and for "
+             "the switches in each test, and write it as JSON to path",
+    )
+    parser.addoption(
+        "--duration-history", metavar="path",
+        default=os.environ.get("DURATION_HISTORY"),
+        help="store the tests durations in the SQLite database at path and "
+             "report the tests slower than in their previous runs",
+    )
+    parser.addoption(
+        "--benchmark", action="store_true",
+        default=os.environ.get("BENCHMARK", "0") != "0",
+        help="run the benchmarks (tests marked with benchmark), which are "
+             "skipped otherwise",
+    )
+    parser.addoption(
+        "--benchmark-output", metavar="dir",
+        default=benchmark.BENCHMARK_OUTPUT,
+        help="directory where the benchmarks store their JSON results",
+    )
+    parser.addoption(
+        "--keep-test-order", action="store_true", default=False,
+        help="don't group the test classes by topology, run them in the "
+             "collection order",
+    )
+
+
+def pytest_configure(config):
+    path = config.getoption("--wait-accounting")
+    if path:
+        plugin = WaitAccounting(path)
+        plugin.install()
+        config.pluginmanager.register(plugin, "wait_accounting")
+    benchmark.BENCHMARK_OUTPUT = config.getoption("--benchmark-output")
+    path = config.getoption("--duration-history")
+    # with pytest-xdist, only the controller process stores the durations
+    if path and not os.environ.get("PYTEST_XDIST_WORKER"):
+        config.pluginmanager.register(DurationHistory(path), "duration_history")
+
+
+def pop_net_timings(item):
+    """Get the timings recorded by the NetworkTest used by the test class."""
+    net = getattr(item.cls, "net", None)
+    if net is None or not hasattr(net, "pop_timings"):
+        return []
+    return net.pop_timings()
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--benchmark"):
+        skip = pytest.mark.skip(reason="benchmarks only run with --benchmark")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip)
+    if config.getoption("--keep-test-order"):
+        return
+    items[:], config.schedule_stats = schedule(items)
+
+
+def pytest_report_collectionfinish(config):
+    stats = getattr(config, "schedule_stats", None)
+    if not stats:
+        return []
+    return [
+        "topology scheduler: {rebuilds_after} network rebuilds (saved"
+        " {saved_rebuilds})".format(
+            saved_rebuilds=stats["rebuilds_before"] - stats["rebuilds_after"],
+            **stats,
+        )
+    ]
+
+
+# {endpoint: [count, total, max]} of the Kytos API calls made by the
+# pytest-xdist workers, merged by the controller process
+worker_api_latencies = defaultdict(lambda: [0, 0.0, 0.0])
+
+
+def merge_latencies(latencies, other):
+    for endpoint, (count, total, max_) in other.items():
+        stats = latencies[endpoint]
+        stats[0] += count
+        stats[1] += total
+        stats[2] = max(stats[2], max_)
+
+
+def pytest_sessionfinish(session):
+    # stop the networks kept alive between the test classes, if any
+    helpers = sys.modules.get("tests.helpers")
+    if helpers is not None:
+        helpers.network_pool.close()
+    # with pytest-xdist, the workers send their API latencies to the controller
+    if helpers is not None and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["api_latencies"] = dict(helpers.kytos_api.latencies)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+    merge_latencies(worker_api_latencies, output.get("api_latencies", {}))
+
+
+@pytest.fixture(scope="class")
+def db_snapshot(request):
+    """Make restart_kytos_clean() of the class NetworkTest restore a
+    snapshot of the database with the discovered topology, instead of
+    dropping it (the snapshot is taken once per topology)."""
+    net = request.cls.net
+    net.use_db_snapshot = True
+    yield net
+    net.use_db_snapshot = False
+
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
+    item.user_properties.extend(pop_net_timings(item))
     outcome = yield
     report = outcome.get_result()
     report.start = call.start
     report.stop = call.stop
 
 
+def write_api_latency(terminalreporter, limit=20):
+    """Write the latency of the slowest Kytos API endpoints, called from
+    this process or from the pytest-xdist workers."""
+    latencies = defaultdict(lambda: [0, 0.0, 0.0])
+    helpers = sys.modules.get("tests.helpers")
+    if helpers is not None:
+        merge_latencies(latencies, helpers.kytos_api.latencies)
+    merge_latencies(latencies, worker_api_latencies)
+    stats = sorted(
+        (
+            (endpoint, count, total, total / count, max_)
+            for endpoint, (count, total, max_) in latencies.items()
+        ),
+        key=lambda stat: stat[2], reverse=True,
+    )
+    if not stats:
+        return
+    terminalreporter.section('Kytos API latency', sep='-', bold=True)
+    for endpoint, count, total, mean, max_ in stats[:limit]:
+        terminalreporter.write_line(
+            f"{total:8.2f}s {count:6d} calls  mean {mean * 1000:7.1f}ms"
+            f"  max {max_ * 1000:7.1f}ms  {endpoint}"
+        )
+
+
 def pytest_terminal_summary(terminalreporter):
     terminalreporter.ensure_newline()
     terminalreporter.section('start/stop times', sep='-', bold=True)
@@ -27,3 +177,34 @@ def pytest_terminal_summary(terminalreporter):
                 start = datetime.fromtimestamp(report.start)
                 stop = datetime.fromtimestamp(report.stop)
                 terminalreporter.write_line('{id:20}: {start:%Y-%m-%d,%H:%M:%S.%f} - {stop:%Y-%m-%d,%H:%M:%S.%f}'.format(id=report.nodeid, start=start, stop=stop))
+
+    write_api_latency(terminalreporter)
+
+    # user_properties accumulate over the test phases, so the teardown
+    # report has all the timings recorded by the NetworkTest for each test
+    totals = defaultdict(list)
+    lines = []
+    for stat in terminalreporter.stats.values():
+        for report in stat:
+            if getattr(report, "when", None) != "teardown":
+                continue
+            per_test = defaultdict(float)
+            for name, seconds in report.user_properties:
+                if not isinstance(seconds, (int, float)):
+                    continue
+                per_test[name] += seconds
+                totals[name].append(seconds)
+            if not per_test:
+                continue
+            timings = " ".join(f"{name}={seconds:.2f}s" for name, seconds in per_test.items())
+            lines.append(f"{report.nodeid}: {timings}")
+    if not lines:
+        return
+    terminalreporter.section('controller timings', sep='-', bold=True)
+    for line in lines:
+        terminalreporter.write_line(line)
+    for name, values in totals.items():
+        terminalreporter.write_line(
+            f"total {name}: {sum(values):.2f}s over {len(values)} measurements"
+            f" (max {max(values):.2f}s)"
+        )
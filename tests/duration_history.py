@@ -0,0 +1,144 @@
+"""Pytest plugin keeping a history of the tests durations.
+
+The setup, call and teardown durations (from the start/stop recorded by
+conftest), the number of reruns and the outcome of each test are stored
+in a SQLite database, keyed by the git commit and the switch class. At
+the end of the run, the tests that took much longer than the median of
+their previous runs are reported as regressions.
+
+Enable it with ``--duration-history=<file.sqlite>`` (or the
+DURATION_HISTORY environment variable). The commit is taken from
+GIT_COMMIT or from the repository the tests run from.
+"""
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+import uuid
+from collections import defaultdict
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    run_id TEXT NOT NULL,
+    created REAL NOT NULL,
+    git_commit TEXT NOT NULL,
+    switch_class TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    reruns INTEGER NOT NULL,
+    setup REAL NOT NULL,
+    call REAL NOT NULL,
+    teardown REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS durations_nodeid
+    ON durations (nodeid, switch_class, created);
+"""
+
+
+def git_commit():
+    """Return the commit under test."""
+    commit = os.environ.get("GIT_COMMIT")
+    if commit:
+        return commit
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=False
+    )
+    return result.stdout.strip() or "unknown"
+
+
+class DurationHistory:
+    """Store the durations of the tests and detect regressions.
+
+    A test regressed when it passed and its total duration is more than
+    threshold (relative) and min_delta seconds above the median of its
+    last baseline_runs passing runs with the same switch class (at least
+    min_runs of them are needed).
+    """
+
+    def __init__(self, path, baseline_runs=10, min_runs=3, threshold=0.5,
+                 min_delta=2.0):
+        self.path = path
+        self.baseline_runs = baseline_runs
+        self.min_runs = min_runs
+        self.threshold = threshold
+        self.min_delta = min_delta
+        self.run_id = uuid.uuid4().hex
+        self.git_commit = git_commit()
+        self.switch_class = os.environ.get("SWITCH_CLASS") or "OVSSwitch"
+        self.tests = defaultdict(lambda: {
+            "outcome": None, "reruns": 0,
+            "setup": 0.0, "call": 0.0, "teardown": 0.0,
+        })
+        self.regressions = []
+
+    def pytest_runtest_logreport(self, report):
+        test = self.tests[report.nodeid]
+        start = getattr(report, "start", None)
+        stop = getattr(report, "stop", None)
+        duration = stop - start if start is not None and stop is not None \
+            else report.duration
+        if report.outcome == "rerun":
+            test["reruns"] += 1
+            return
+        test[report.when] = duration
+        if report.when == "call" or report.outcome != "passed":
+            test["outcome"] = report.outcome
+        elif test["outcome"] is None:
+            test["outcome"] = report.outcome
+
+    def pytest_sessionfinish(self, session):
+        if not self.tests:
+            return
+        with sqlite3.connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+            self.regressions = self.find_regressions(conn)
+            created = time.time()
+            conn.executemany(
+                "INSERT INTO durations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (self.run_id, created, self.git_commit, self.switch_class,
+                     nodeid, test["outcome"] or "unknown", test["reruns"],
+                     test["setup"], test["call"], test["teardown"])
+                    for nodeid, test in self.tests.items()
+                ],
+            )
+        conn.close()
+
+    def find_regressions(self, conn):
+        """Compare the current run with the previous ones."""
+        regressions = []
+        for nodeid, test in self.tests.items():
+            if test["outcome"] != "passed":
+                continue
+            rows = conn.execute(
+                "SELECT setup + call + teardown FROM durations"
+                " WHERE nodeid = ? AND switch_class = ? AND outcome = 'passed'"
+                " ORDER BY created DESC LIMIT ?",
+                (nodeid, self.switch_class, self.baseline_runs),
+            ).fetchall()
+            if len(rows) < self.min_runs:
+                continue
+            baseline = statistics.median(row[0] for row in rows)
+            total = test["setup"] + test["call"] + test["teardown"]
+            if total - baseline > max(self.min_delta, baseline * self.threshold):
+                regressions.append((nodeid, baseline, total, len(rows)))
+        return sorted(regressions, key=lambda r: r[2] - r[1], reverse=True)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.section("duration history", sep="-", bold=True)
+        terminalreporter.write_line(
+            f"{len(self.tests)} tests stored in {self.path}"
+            f" (commit {self.git_commit[:12]}, {self.switch_class})"
+        )
+        if not self.regressions:
+            return
+        terminalreporter.write_line(
+            f"{len(self.regressions)} tests regressed compared with the median"
+            f" of their last {self.baseline_runs} passing runs:"
+        )
+        for nodeid, baseline, total, runs in self.regressions:
+            terminalreporter.write_line(
+                f"{total:8.2f}s (+{total - baseline:.2f}s, median {baseline:.2f}s"
+                f" over {runs} runs)  {nodeid}"
+            )
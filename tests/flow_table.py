@@ -0,0 +1,151 @@
+"""Parse the dump-flows output of the switches into indexed flow records.
+
+FlowTable.parse takes the text of ``sw.dpctl('dump-flows')`` (ovs-ofctl
+format, as printed for OVSSwitch, NoviSwitch and P4OfSwitch through
+dpctl_wrapper) and returns the flows indexed by cookie, cookie prefix
+(its highest byte, which identifies the NApp), table and priority, so
+the lookups don't scan the whole table:
+
+    table = FlowTable.parse(s1.dpctl('dump-flows'))
+    evc_flows = table.find(cookie=0xaa00000000000000 | evc_id, table=0)
+    assert table.find(priority=20000, dl_vlan="100")
+"""
+from collections import defaultdict
+
+OFP_DEFAULT_PRIORITY = 32768
+
+# fields printed before the match that are not part of it
+FLOW_FIELDS = {
+    "cookie", "duration", "table", "n_packets", "n_bytes", "idle_age",
+    "hard_age", "idle_timeout", "hard_timeout", "priority", "importance",
+    "reset_counts", "send_flow_rem", "check_overlap", "no_packet_counts",
+    "no_byte_counts", "out_port", "out_group",
+}
+COUNTERS = ("duration", "n_packets", "n_bytes", "idle_age", "hard_age")
+
+
+class Flow:
+    """A flow of a switch, as printed by dump-flows."""
+
+    __slots__ = ("table", "cookie", "priority", "match", "actions",
+                 "counters", "text")
+
+    def __init__(self, table, cookie, priority, match, actions, counters, text):
+        self.table = table
+        self.cookie = cookie
+        self.priority = priority
+        self.match = match
+        self.actions = actions
+        self.counters = counters
+        self.text = text
+
+    @classmethod
+    def parse(cls, line):
+        """Parse a dump-flows line. Match fields without a value (e.g. ip
+        or arp) are stored with a None value."""
+        text = line.strip()
+        head, sep, actions = text.partition(" actions=")
+        if not sep:
+            raise ValueError(f"Invalid flow: {line!r}")
+        table = 0
+        cookie = 0
+        priority = OFP_DEFAULT_PRIORITY
+        match = {}
+        counters = {}
+        # flags like send_flow_rem are followed by a space, not a comma
+        for field in head.replace(",", " ").split():
+            key, _, value = field.partition("=")
+            if key not in FLOW_FIELDS:
+                match[key] = value or None
+            elif key == "cookie":
+                cookie = int(value.split("/")[0], 16)
+            elif key == "table":
+                table = int(value)
+            elif key == "priority":
+                priority = int(value)
+            elif key == "duration":
+                counters[key] = float(value.rstrip("s"))
+            elif key in COUNTERS:
+                counters[key] = int(value)
+        return cls(table, cookie, priority, match, actions, counters, text)
+
+    def __repr__(self):
+        return f"Flow({self.text!r})"
+
+    def __str__(self):
+        return self.text
+
+
+class FlowTable:
+    """The flows of a switch, indexed by cookie, cookie prefix, table
+    and priority."""
+
+    def __init__(self, flows=()):
+        self.flows = []
+        self.by_cookie = defaultdict(list)
+        self.by_cookie_prefix = defaultdict(list)
+        self.by_table = defaultdict(list)
+        self.by_priority = defaultdict(list)
+        for flow in flows:
+            self.add(flow)
+
+    @classmethod
+    def parse(cls, text):
+        """Parse the output of dump-flows (the OFPST_FLOW header lines, if
+        any, are ignored)."""
+        return cls(
+            Flow.parse(line) for line in text.splitlines()
+            if " actions=" in line
+        )
+
+    def add(self, flow):
+        self.flows.append(flow)
+        self.by_cookie[flow.cookie].append(flow)
+        self.by_cookie_prefix[flow.cookie >> 56].append(flow)
+        self.by_table[flow.table].append(flow)
+        self.by_priority[flow.priority].append(flow)
+
+    def find(self, cookie=None, cookie_prefix=None, table=None, priority=None,
+             actions=None, **match):
+        """Return the flows with the given cookie, cookie prefix (highest
+        byte), table, priority and actions whose match has the given
+        fields (with a value, or None for fields without value).
+
+        The candidates come from the smallest of the indexes matching the
+        arguments, and only those are filtered.
+        """
+        candidates = [
+            index.get(key, []) for index, key in (
+                (self.by_cookie, cookie),
+                (self.by_cookie_prefix, cookie_prefix),
+                (self.by_table, table),
+                (self.by_priority, priority),
+            )
+            if key is not None
+        ]
+        flows = min(candidates, key=len) if candidates else self.flows
+        return [
+            flow for flow in flows
+            if (cookie is None or flow.cookie == cookie)
+            and (cookie_prefix is None or flow.cookie >> 56 == cookie_prefix)
+            and (table is None or flow.table == table)
+            and (priority is None or flow.priority == priority)
+            and (actions is None or flow.actions == actions)
+            and all(
+                field in flow.match and flow.match[field] == value
+                for field, value in match.items()
+            )
+        ]
+
+    def cookies(self):
+        """Return {cookie: number of flows}."""
+        return {cookie: len(flows) for cookie, flows in self.by_cookie.items()}
+
+    def __len__(self):
+        return len(self.flows)
+
+    def __iter__(self):
+        return iter(self.flows)
+
+    def __str__(self):
+        return "\n".join(flow.text for flow in self.flows)
@@ -4,16 +4,34 @@ from mininet.node import RemoteController, OVSSwitch
 import mininet.clean
 from mininet.log import error
 from mock import patch
+import asyncio
 import time
 import os
+import random
+import re
+import select
+import signal
+import string
+import subprocess
 import requests
+import httpx
 import hashlib
+import itertools
+import json
+import configparser
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from pymongo import MongoClient
 from pymongo.errors import ServerSelectionTimeoutError
 
+from tests.flow_table import FlowTable
+from tests.openflow import OPENFLOW_NATIVE_STATS, OpenFlowClient
+from tests.ovsdb_monitor import OvsdbMonitor, ovsdb_uuids
+
 HAS_NOVISWITCH = False
 if os.environ.get('SWITCH_CLASS') == "NoviSwitch":
     from tests.noviswitch import NoviSwitch
@@ -26,9 +44,79 @@ DOCKER_NETWORK = os.environ.get("MININET_DOCKER_NETWORK")
 
 BASE_ENV = os.environ.get('VIRTUAL_ENV', None) or '/'
 
+# When running in parallel with pytest-xdist, each worker (gw0, gw1, ...) is
+# a shard with its own kytosd (API and OpenFlow ports, pid file), Mongo
+# database and Mininet switches (name prefix and listenPort range)
+SHARD_ID = os.environ.get("PYTEST_XDIST_WORKER", "")
+SHARD = int(SHARD_ID[2:]) if SHARD_ID else 0
+if SHARD >= len(string.ascii_lowercase):
+    raise Exception(
+        f"at most {len(string.ascii_lowercase)} pytest-xdist workers are"
+        f" supported, {SHARD_ID} has no switch name prefix"
+    )
+# switch names must not have digits (Mininet takes the dpid from the first
+# number in the name) nor start like the topologies switches (e.g. s1)
+SHARD_PREFIX = f"w{string.ascii_lowercase[SHARD]}" if SHARD_ID else ""
+# Mongo database of the tests and of the kytosd they start, the shards use
+# <MONGO_DBNAME>_gwN (created by scripts/rs-init.sh)
+MONGO_DBNAME = os.environ.get("MONGO_DBNAME")
+if SHARD_ID:
+    MONGO_DBNAME = f"{MONGO_DBNAME or 'napps'}_{SHARD_ID}"
+
+KYTOS_API_PORT = 8181 + SHARD
+# the port right after the OpenFlow one is used by reconnect_switches
+KYTOS_OF_PORT = 6653 + 2 * SHARD
+# OpenFlow port no switch connects to, to run kytosd without switches
+KYTOS_UNUSED_OF_PORT = 9999 - SHARD
+# the topologies use listenPort from 6601, each shard gets its own range
+SHARD_LISTEN_PORT_OFFSET = 100 * SHARD
+
+KYTOS_API = f'http://127.0.0.1:{KYTOS_API_PORT}/api'
+
+# REST endpoints used to tell when an enabled NApp finished loading: the routes
+# are registered only after the NApp is loaded, so any answer other than 404
+# means the NApp is ready (e.g. pathfinder only accepts POST, thus a GET is 405)
+NAPPS_READY_ENDPOINTS = {
+    ("kytos", "topology"): "/kytos/topology/v3/",
+    ("kytos", "mef_eline"): "/kytos/mef_eline/v2/evc/",
+    ("kytos", "flow_manager"): "/kytos/flow_manager/v2/flows",
+    ("kytos", "of_lldp"): "/kytos/of_lldp/v1/polling_time",
+    ("kytos", "maintenance"): "/kytos/maintenance/v1",
+    ("kytos", "pathfinder"): "/kytos/pathfinder/v3/",
+    ("kytos", "of_multi_table"): "/kytos/of_multi_table/v1/pipeline",
+    ("kytos", "telemetry_int"): "/kytos/telemetry_int/v1/evc",
+    ("amlight", "sdntrace"): "/amlight/sdntrace/v1/trace",
+    ("amlight", "sdntrace_cp"): "/amlight/sdntrace_cp/v1/traces",
+    ("amlight", "kytos_stats"): "/amlight/kytos_stats/v1/flow/stats",
+}
+
+# snapshots of the database with the "clean discovered topology" state,
+# taken once per topology name by NetworkTest.restart_kytos_clean()
+DB_SNAPSHOTS = {}
+
+# volatile fields of the dump-flows output, ignored when comparing flow tables
+FLOW_COUNTERS = re.compile(r"\s*\b(duration|n_packets|n_bytes|idle_age|hard_age)=[^,\s]*,?")
+# documents that don't count as leftover state after a soft reset
+SOFT_RESET_IGNORED_DOCS = {
+    "flows": {"state": "deleted"},
+}
+
+# keep the Mininet network alive between test classes (see NetworkPool)
+REUSE_NETWORKS = os.environ.get("REUSE_NETWORKS", "1") != "0"
+
+KYTOSD_PID_PATH = os.path.join(
+    BASE_ENV, f'var/run/kytos/kytosd{"-" + SHARD_ID if SHARD_ID else ""}.pid'
+)
+KYTOSD_CONF_PATH = os.path.join(BASE_ENV, 'etc/kytos/kytos.conf')
+# how long to wait for kytosd to exit after SIGTERM before sending SIGKILL
+KYTOSD_STOP_TIMEOUT = float(os.environ.get("KYTOSD_STOP_TIMEOUT", 10))
+
+DUMP_FLOWS_ARGS = ("--no-names", "--protocols=OpenFlow13")
+
+
 def dpctl_wrapper(obj, *args):
     if args[0] == "dump-flows":
-        return obj.orig_dpctl(*args, "--no-names", "--protocols=OpenFlow13", "|grep -v OFPST_FLOW")
+        return obj.orig_dpctl(*args, *DUMP_FLOWS_ARGS, "|grep -v OFPST_FLOW")
     return obj.orig_dpctl(*args)
 
 OVSSwitch.orig_dpctl = OVSSwitch.dpctl
@@ -40,6 +128,58 @@ if os.environ.get('SWITCH_CLASS') == "P4OfSwitch":
     P4OfSwitch.orig_dpctl = P4OfSwitch.dpctl
     P4OfSwitch.dpctl = dpctl_wrapper
 
+OVS_RUNDIR = os.environ.get("OVS_RUNDIR", "/var/run/openvswitch")
+# switch name -> OpenFlowClient (None if it is not available)
+OF_CLIENTS = {}
+
+
+def openflow_address(switch):
+    """Return the address of the switch passive OpenFlow listener, or None
+    if the switch is not reachable from here (P4OfSwitch containers)."""
+    if isinstance(switch, OVSSwitch):
+        return os.path.join(OVS_RUNDIR, f"{switch.name}.mgmt")
+    return None
+
+
+def of_client(switch):
+    """Return the persistent OpenFlowClient of the switch, or None if the
+    CLI has to be used."""
+    if not OPENFLOW_NATIVE_STATS:
+        return None
+    if switch.name not in OF_CLIENTS:
+        if callable(getattr(switch, "openflow_client", None)):
+            OF_CLIENTS[switch.name] = switch.openflow_client()
+        else:
+            address = openflow_address(switch)
+            OF_CLIENTS[switch.name] = OpenFlowClient(address) if address else None
+    return OF_CLIENTS[switch.name]
+
+
+def close_of_clients():
+    for client in OF_CLIENTS.values():
+        if client is not None:
+            client.close()
+    OF_CLIENTS.clear()
+
+
+def dump_flow_table(switch, *args):
+    """Return the flows of the switch parsed into an indexed FlowTable.
+
+    Without dump-flows arguments the flows are read with the OpenFlow
+    client of the switch. Otherwise, or if it fails (the switch then
+    falls back to the CLI for good), ovs-ofctl is used (the OFPST_FLOW
+    lines are skipped by the parser, so no grep is run)."""
+    client = of_client(switch) if not args else None
+    if client is not None:
+        try:
+            return FlowTable(client.flow_stats())
+        except Exception as exc:
+            error(f"OpenFlow flow stats failed on {switch.name}, using ovs-ofctl: {exc}\n")
+            client.close()
+            OF_CLIENTS[switch.name] = None
+    return FlowTable.parse(switch.orig_dpctl('dump-flows', *args, *DUMP_FLOWS_ARGS))
+
+
 class SwitchFactory:
     def __new__(cls, *args, **kwargs):
         cls_name = os.environ.get('SWITCH_CLASS')
@@ -282,8 +422,53 @@ class MultiConnectedTopo(Topo):
         self.addLink(s4, s6)
 
 
+class RingNTopo(Topo):
+    """Ring of n switches without hosts, for the scaling benchmarks."""
+
+    def build(self, n=10):
+        switches = [self.addSwitch(f's{i}') for i in range(1, n + 1)]
+        for i, switch in enumerate(switches):
+            self.addLink(switch, switches[(i + 1) % n])
+
+
+class GridTopo(Topo):
+    """Grid of rows x cols switches without hosts, each one linked to its
+    right and bottom neighbors."""
+
+    def build(self, rows=3, cols=3):
+        grid = [
+            [self.addSwitch(f's{row * cols + col + 1}') for col in range(cols)]
+            for row in range(rows)
+        ]
+        for row in range(rows):
+            for col in range(cols):
+                if col + 1 < cols:
+                    self.addLink(grid[row][col], grid[row][col + 1])
+                if row + 1 < rows:
+                    self.addLink(grid[row][col], grid[row + 1][col])
+
+
+class FatTreeTopo(Topo):
+    """k-ary fat-tree of 5k^2/4 switches without hosts: (k/2)^2 core
+    switches and k pods of k/2 aggregation and k/2 edge switches."""
+
+    def build(self, k=4):
+        half = k // 2
+        names = (f's{i}' for i in itertools.count(1))
+        core = [self.addSwitch(next(names)) for _ in range(half * half)]
+        for _ in range(k):
+            aggregation = [self.addSwitch(next(names)) for _ in range(half)]
+            edge = [self.addSwitch(next(names)) for _ in range(half)]
+            for i, agg in enumerate(aggregation):
+                for core_switch in core[i * half:(i + 1) * half]:
+                    self.addLink(core_switch, agg)
+                for edge_switch in edge:
+                    self.addLink(agg, edge_switch)
+
+
 # You can run any of the topologies above by doing:
 # mn --custom tests/helpers.py --topo ring --controller=remote,ip=127.0.0.1
+# (or, for the generated ones, e.g. --topo grid,10,10)
 topos = {
     'ring': (lambda: RingTopo()),
     'ring4': (lambda: Ring4Topo()),
@@ -293,14 +478,26 @@ topos = {
     'linear10': (lambda: LinearTopo(10)),
     'multi': (lambda: MultiConnectedTopo()),
     'looped': (lambda: Looped()),
+    'ring_n': RingNTopo,
+    'grid': GridTopo,
+    'fattree': FatTreeTopo,
 }
 
 
+def make_topo(topo_name):
+    """Build the topology of topo_name. The generated topologies take
+    their size after a colon, e.g. ring_n:50, grid:10x10 or fattree:4
+    (ring is used for unknown names)."""
+    name, _, size = topo_name.partition(":")
+    args = [int(arg) for arg in size.split("x")] if size else []
+    return topos.get(name, RingTopo)(*args)
+
+
 def mongo_client(
     host_seeds=os.environ.get("MONGO_HOST_SEEDS"),
     username=os.environ.get("MONGO_USERNAME"),
     password=os.environ.get("MONGO_PASSWORD"),
-    database=os.environ.get("MONGO_DBNAME"),
+    database=MONGO_DBNAME,
     connect=False,
     retrywrites=True,
     retryreads=True,
@@ -325,6 +522,884 @@ def mongo_client(
     )
 
 
+# ids in the API paths, replaced by {id} in the latency counters
+API_PATH_IDS = re.compile(
+    r"/(?:[0-9a-fA-F]{2}(?::[0-9a-fA-F]{2}){7}(?::\d+)?|[0-9a-fA-F]{12,}|\d+)(?=/|$)"
+)
+# methods retried by default on connection errors, the others could be
+# applied twice (e.g. a POST creating two EVCs, a PUT starting two traces)
+RETRIED_METHODS = {"GET", "HEAD"}
+
+
+class KytosClient:
+    """Client of the Kytos REST API shared by the test suites.
+
+    All the requests go through one requests.Session, so the connections
+    to kytosd are kept alive and reused. Requests get a default timeout,
+    the GET and HEAD ones are retried when the connection fails (e.g.
+    reset by the server), the others only when retries is passed, and
+    their latency is accounted per endpoint (see latency_stats).
+
+    The typed helpers take the path parameters and payload of each
+    endpoint, assert the expected status code and return the JSON data.
+    """
+
+    def __init__(self, api=KYTOS_API, timeout=10, retries=2, backoff=0.1,
+                 pool_size=32):
+        self.api = api
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.latencies = defaultdict(lambda: [0, 0.0, 0.0])  # count, total, max
+
+    def url(self, path):
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.api}/{path.lstrip('/')}"
+
+    def endpoint(self, method, url):
+        path = url.split("?", 1)[0]
+        if path.startswith(self.api):
+            path = path[len(self.api):]
+        return f"{method} {API_PATH_IDS.sub('/{id}', path)}"
+
+    def request(self, method, path, retries=None, **kwargs):
+        """Send a request to path (relative to the API or a full URL).
+        Only the GET and HEAD requests are retried, unless retries is
+        given."""
+        url = self.url(path)
+        if retries is None:
+            retries = self.retries if method.upper() in RETRIED_METHODS else 0
+        kwargs.setdefault("timeout", self.timeout)
+        endpoint = self.endpoint(method.upper(), url)
+        attempt = 0
+        while True:
+            begin = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+                break
+            except requests.ConnectionError:
+                if attempt >= retries:
+                    raise
+            finally:
+                elapsed = time.monotonic() - begin
+                stats = self.latencies[endpoint]
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+            attempt += 1
+            time.sleep(self.backoff * 2 ** (attempt - 1))
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def call(self, method, path, expect=200, **kwargs):
+        """Send a request, assert its status code and return its JSON."""
+        response = self.request(method, path, **kwargs)
+        assert response.status_code == expect, \
+            f"{method} {path}: {response.status_code} {response.text}"
+        return response.json()
+
+    def latency_stats(self):
+        """Return (endpoint, count, total, mean, max) sorted by total time."""
+        return sorted(
+            (
+                (endpoint, count, total, total / count, max_)
+                for endpoint, (count, total, max_) in self.latencies.items()
+            ),
+            key=lambda stat: stat[2], reverse=True,
+        )
+
+    def reset_latencies(self):
+        self.latencies.clear()
+
+    # mef_eline
+    def list_evcs(self, **params):
+        return self.call("GET", "kytos/mef_eline/v2/evc/", params=params)
+
+    def get_evc(self, evc_id):
+        return self.call("GET", f"kytos/mef_eline/v2/evc/{evc_id}")
+
+    def create_evc(self, payload):
+        """Create an EVC and return the response data (circuit_id and
+        deployed)."""
+        return self.call("POST", "kytos/mef_eline/v2/evc/", expect=201, json=payload)
+
+    def update_evc(self, evc_id, payload):
+        return self.call("PATCH", f"kytos/mef_eline/v2/evc/{evc_id}", json=payload)
+
+    def delete_evc(self, evc_id):
+        return self.call("DELETE", f"kytos/mef_eline/v2/evc/{evc_id}")
+
+    def redeploy_evc(self, evc_id, try_avoid_same_s_vlan=True):
+        return self.call(
+            "PATCH", f"kytos/mef_eline/v2/evc/{evc_id}/redeploy", expect=202,
+            params={"try_avoid_same_s_vlan": str(try_avoid_same_s_vlan).lower()},
+        )
+
+    # flow_manager
+    def get_flows(self, dpid=None):
+        path = f"kytos/flow_manager/v2/flows/{dpid}" if dpid else "kytos/flow_manager/v2/flows"
+        return self.call("GET", path)
+
+    def get_stored_flows(self, **params):
+        return self.call("GET", "kytos/flow_manager/v2/stored_flows", params=params)
+
+    def install_flows(self, flows, dpid=None, **payload):
+        path = f"kytos/flow_manager/v2/flows/{dpid}" if dpid else "kytos/flow_manager/v2/flows"
+        return self.call("POST", path, expect=202, json={"flows": flows, **payload})
+
+    def delete_flows(self, flows, dpid=None, **payload):
+        path = f"kytos/flow_manager/v2/flows/{dpid}" if dpid else "kytos/flow_manager/v2/flows"
+        return self.call("DELETE", path, expect=202, json={"flows": flows, **payload})
+
+    # topology
+    def get_topology(self):
+        return self.call("GET", "kytos/topology/v3/")["topology"]
+
+    def get_switches(self):
+        return self.call("GET", "kytos/topology/v3/switches")["switches"]
+
+    def get_links(self):
+        return self.call("GET", "kytos/topology/v3/links")["links"]
+
+    def get_interfaces(self):
+        return self.call("GET", "kytos/topology/v3/interfaces")["interfaces"]
+
+    def set_enabled(self, kind, obj_id, enabled=True):
+        """Enable or disable a switch, interface or link (kind is
+        "switches", "interfaces" or "links")."""
+        action = "enable" if enabled else "disable"
+        return self.call("POST", f"kytos/topology/v3/{kind}/{obj_id}/{action}", expect=201)
+
+    def get_metadata(self, kind, obj_id):
+        return self.call("GET", f"kytos/topology/v3/{kind}/{obj_id}/metadata")["metadata"]
+
+    def add_metadata(self, kind, obj_id, metadata):
+        return self.call(
+            "POST", f"kytos/topology/v3/{kind}/{obj_id}/metadata", expect=201,
+            json=metadata,
+        )
+
+    # of_lldp
+    def get_lldp_interfaces(self):
+        return self.call("GET", "kytos/of_lldp/v1/interfaces/")["interfaces"]
+
+    def get_lldp_polling_time(self):
+        return self.call("GET", "kytos/of_lldp/v1/polling_time")["polling_time"]
+
+    def set_lldp_polling_time(self, seconds):
+        return self.call(
+            "POST", "kytos/of_lldp/v1/polling_time", json={"polling_time": seconds}
+        )
+
+    # maintenance
+    def list_mws(self):
+        return self.call("GET", "kytos/maintenance/v1/")
+
+    def get_mw(self, mw_id):
+        return self.call("GET", f"kytos/maintenance/v1/{mw_id}")
+
+    def create_mw(self, payload):
+        return self.call("POST", "kytos/maintenance/v1/", expect=201, json=payload)
+
+    def update_mw(self, mw_id, payload):
+        return self.call("PATCH", f"kytos/maintenance/v1/{mw_id}", json=payload)
+
+    def delete_mw(self, mw_id):
+        return self.call("DELETE", f"kytos/maintenance/v1/{mw_id}")
+
+    def end_mw(self, mw_id):
+        return self.call("PATCH", f"kytos/maintenance/v1/{mw_id}/end")
+
+    # sdntrace and sdntrace_cp
+    def trace(self, payload):
+        """Start a data plane trace and return its trace_id."""
+        return self.call("PUT", "amlight/sdntrace/v1/trace", json=payload)["result"]["trace_id"]
+
+    def get_trace(self, trace_id):
+        return self.call("GET", f"amlight/sdntrace/v1/trace/{trace_id}")["result"]
+
+    def trace_cp(self, payload):
+        return self.call("PUT", "amlight/sdntrace_cp/v1/trace", json=payload)["result"]
+
+    def traces_cp(self, payloads):
+        return self.call("PUT", "amlight/sdntrace_cp/v1/traces", json=payloads)["result"]
+
+    # kytos_stats
+    def flow_stats(self, dpids=()):
+        return self.call("GET", "amlight/kytos_stats/v1/flow/stats", params={"dpid": list(dpids)})
+
+    def table_stats(self, dpids=(), tables=()):
+        return self.call(
+            "GET", "amlight/kytos_stats/v1/table/stats",
+            params={"dpid": list(dpids), "table": list(tables)},
+        )
+
+    # pathfinder
+    def find_paths(self, payload):
+        return self.call("POST", "kytos/pathfinder/v3/", json=payload)["paths"]
+
+    # kytos core auth
+    def login(self, username, password):
+        """Return an authentication token."""
+        return self.call("GET", "kytos/core/auth/login/", auth=(username, password))["token"]
+
+    def list_users(self, token):
+        return self.call(
+            "GET", "kytos/core/auth/users/",
+            headers={"Authorization": f"Bearer {token}"},
+        )["users"]
+
+    def create_user(self, token, user):
+        return self.call(
+            "POST", "kytos/core/auth/users/", expect=201, json=user,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    def delete_user(self, token, username):
+        return self.call(
+            "DELETE", f"kytos/core/auth/users/{username}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+
+kytos_api = KytosClient()
+
+
+class AsyncKytosClient:
+    """asyncio client of the Kytos REST API to fan out many requests.
+
+    At most concurrency requests are in flight (the httpx connection pool
+    has the same size) and the batch methods keep at most that many tasks
+    alive, so thousands of calls don't pile up. It must be used as an
+    async context manager from a coroutine (e.g. an async test, which
+    pytest-asyncio runs with asyncio_mode = auto):
+
+        async with AsyncKytosClient() as api:
+            evcs = await api.get_evcs(evc_ids)
+
+    Connection errors are retried as in KytosClient and the latencies are
+    accounted with the ones of kytos_api (see KytosClient.latency_stats).
+    """
+
+    def __init__(self, api=KYTOS_API, timeout=10, retries=2, backoff=0.1,
+                 concurrency=32, latencies=None):
+        self.api = api
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.concurrency = concurrency
+        self.latencies = kytos_api.latencies if latencies is None else latencies
+        self.client = None
+        self.semaphore = None
+
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+        )
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        self.client = None
+
+    url = KytosClient.url
+    endpoint = KytosClient.endpoint
+
+    async def request(self, method, path, retries=None, **kwargs):
+        """Send a request to path (relative to the API or a full URL).
+        Only the GET and HEAD requests are retried, unless retries is
+        given."""
+        url = self.url(path)
+        if retries is None:
+            retries = self.retries if method.upper() in RETRIED_METHODS else 0
+        endpoint = self.endpoint(method.upper(), url)
+        attempt = 0
+        async with self.semaphore:
+            while True:
+                begin = time.monotonic()
+                try:
+                    response = await self.client.request(method, url, **kwargs)
+                    break
+                except (httpx.NetworkError, httpx.RemoteProtocolError):
+                    if attempt >= retries:
+                        raise
+                finally:
+                    elapsed = time.monotonic() - begin
+                    stats = self.latencies[endpoint]
+                    stats[0] += 1
+                    stats[1] += elapsed
+                    stats[2] = max(stats[2], elapsed)
+                attempt += 1
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+        return response
+
+    async def call(self, method, path, expect=200, **kwargs):
+        """Send a request, assert its status code and return its JSON."""
+        response = await self.request(method, path, **kwargs)
+        assert response.status_code == expect, \
+            f"{method} {path}: {response.status_code} {response.text}"
+        return response.json()
+
+    async def map(self, func, items):
+        """Return [await func(item) for item in items], running them
+        concurrently with at most concurrency tasks alive."""
+        items = list(items)
+        results = [None] * len(items)
+        pending = set()
+        try:
+            for index, item in enumerate(items):
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                pending.add(asyncio.ensure_future(
+                    self._store(results, index, func(item))
+                ))
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        return results
+
+    @staticmethod
+    async def _store(results, index, coro):
+        results[index] = await coro
+
+    # mef_eline
+    async def get_evcs(self, evc_ids):
+        """Return {evc_id: EVC data}."""
+        evc_ids = list(evc_ids)
+        evcs = await self.map(
+            lambda evc_id: self.call("GET", f"kytos/mef_eline/v2/evc/{evc_id}"), evc_ids
+        )
+        return dict(zip(evc_ids, evcs))
+
+    async def create_evcs(self, payloads):
+        """Create the EVCs and return their response data (circuit_id and
+        deployed), in the same order."""
+        return await self.map(
+            lambda payload: self.call(
+                "POST", "kytos/mef_eline/v2/evc/", expect=201, json=payload
+            ),
+            payloads,
+        )
+
+    async def delete_evcs(self, evc_ids):
+        return await self.map(
+            lambda evc_id: self.call("DELETE", f"kytos/mef_eline/v2/evc/{evc_id}"), evc_ids
+        )
+
+    # flow_manager
+    async def get_flows(self, dpids):
+        """Return {dpid: flows of the switch}, as given by flow_manager."""
+        dpids = list(dpids)
+        results = await self.map(
+            lambda dpid: self.call("GET", f"kytos/flow_manager/v2/flows/{dpid}"), dpids
+        )
+        return {
+            dpid: result.get(dpid, {}).get("flows", [])
+            for dpid, result in zip(dpids, results)
+        }
+
+    # topology
+    async def get_metadata(self, kind, obj_ids):
+        """Return {id: metadata} of topology switches, interfaces or links."""
+        obj_ids = list(obj_ids)
+        results = await self.map(
+            lambda obj_id: self.call("GET", f"kytos/topology/v3/{kind}/{obj_id}/metadata"),
+            obj_ids,
+        )
+        return {obj_id: result["metadata"] for obj_id, result in zip(obj_ids, results)}
+
+
+class WaitTimeout(Exception):
+    """Condition not met before its timeout."""
+
+
+# called with the seconds spent in each wait_until, whatever module it was
+# imported in (set by the wait accounting plugin)
+wait_until_hook = None
+
+
+def wait_until(condition, timeout=60, description=None, interval=0.1,
+               max_interval=2, backoff=2, jitter=0.2):
+    """Wait until condition() returns a truthy value, and return that value.
+
+    The condition is polled with exponential backoff (starting at interval
+    and limited to max_interval seconds) plus some random jitter. It can
+    raise an exception (usually AssertionError) to tell why it is not met
+    yet, which is reported by the WaitTimeout raised after timeout seconds.
+    """
+    description = description or getattr(condition, "description", None) \
+        or getattr(condition, "__name__", repr(condition))
+    begin = time.monotonic()
+    deadline = begin + timeout
+    attempts = 0
+    try:
+        while True:
+            attempts += 1
+            try:
+                result = condition()
+                if result:
+                    return result
+                last_error = f"condition returned {result!r}"
+            except Exception as exc:
+                last_error = f"{type(exc).__name__}: {exc}"
+            now = time.monotonic()
+            if now >= deadline:
+                raise WaitTimeout(
+                    f"Timeout after {now - begin:.1f}s ({attempts} attempts) waiting"
+                    f" for {description}. Last error: {last_error}"
+                )
+            delay = min(interval * backoff ** (attempts - 1), max_interval)
+            delay *= 1 + random.uniform(-jitter, jitter)
+            time.sleep(max(min(delay, deadline - now), 0))
+    finally:
+        if wait_until_hook is not None:
+            wait_until_hook(time.monotonic() - begin)
+
+
+def all_of(*conditions):
+    """Condition met when all the given conditions are met."""
+    def condition():
+        return [cond() or _fail(cond) for cond in conditions]
+    condition.description = " and ".join(
+        getattr(cond, "description", repr(cond)) for cond in conditions
+    )
+    return condition
+
+
+def _fail(condition):
+    description = getattr(condition, "description", repr(condition))
+    raise AssertionError(f"{description} not met")
+
+
+def evc_active(evc_id, active=True):
+    """Condition met when the EVC active status is the expected one.
+    Returns the EVC data."""
+    def condition():
+        data = kytos_api.get_evc(evc_id)
+        assert data["active"] is active, f"active={data['active']} {data}"
+        return data
+    condition.description = f"EVC {evc_id} active={active}"
+    return condition
+
+
+def evc_current_path_changed(evc_id, old_path):
+    """Condition met when the EVC current_path is different from old_path
+    and not empty. Returns the EVC data."""
+    def condition():
+        data = kytos_api.get_evc(evc_id)
+        assert data["current_path"], f"current_path is empty {data}"
+        assert data["current_path"] != old_path, f"current_path {old_path}"
+        return data
+    condition.description = f"EVC {evc_id} current_path to change"
+    return condition
+
+
+def flows_count(switch, count, pattern=None):
+    """Condition met when the switch has exactly count flows (matching the
+    regex pattern if provided). Returns the matched flows."""
+    def condition():
+        flows = switch.dpctl('dump-flows').splitlines()
+        if pattern is not None:
+            flows = [flow for flow in flows if re.search(pattern, flow)]
+        assert len(flows) == count, f"{len(flows)} flows: {flows}"
+        return flows or True
+    condition.description = f"{count} flows on {switch.name}"
+    if pattern is not None:
+        condition.description += f" matching {pattern!r}"
+    return condition
+
+
+def flows_with_cookie(switch, cookie, count):
+    """Condition met when the switch has count flows with the given cookie,
+    either an int or a regex for the hex value (e.g. "0xaa.*" or "0xa.{evc_id}")."""
+    if not isinstance(cookie, int):
+        return flows_count(switch, count, pattern=rf"cookie={cookie},")
+
+    def condition():
+        flows = dump_flow_table(switch).find(cookie=cookie)
+        assert len(flows) == count, f"{len(flows)} flows: {flows}"
+        return flows or True
+    condition.description = f"{count} flows on {switch.name} with cookie {cookie:#x}"
+    return condition
+
+
+def link_status(link_id, status="UP"):
+    """Condition met when the Kytos link has the given status.
+    Returns the link data."""
+    def condition():
+        links = kytos_api.get_links()
+        assert link_id in links, f"link {link_id} not found"
+        assert links[link_id]["status"] == status, links[link_id]
+        return links[link_id]
+    condition.description = f"link {link_id} status={status}"
+    return condition
+
+
+def mw_status(mw_id, status="running"):
+    """Condition met when the maintenance window has the given status.
+    Returns the maintenance window data."""
+    def condition():
+        data = kytos_api.get_mw(mw_id)
+        assert data["status"] == status, data
+        return data
+    condition.description = f"maintenance {mw_id} status={status}"
+    return condition
+
+
+def mw_running(mw_id):
+    """Condition met when the maintenance window is running."""
+    return mw_status(mw_id, "running")
+
+
+class KytosdProcess:
+    """Manage the kytosd daemon process through its pid file."""
+
+    def __init__(self, pid_path=KYTOSD_PID_PATH,
+                 stop_timeout=KYTOSD_STOP_TIMEOUT, poll_interval=0.05,
+                 find_by_name=not SHARD_ID):
+        self.pid_path = pid_path
+        self.stop_timeout = stop_timeout
+        self.poll_interval = poll_interval
+        # look for kytosd processes by name when the pid file is missing,
+        # which can't be done when other shards run their own kytosd
+        self.find_by_name = find_by_name
+
+    def read_pid(self):
+        """Return the pid from the pid file or None if it is not available."""
+        try:
+            with open(self.pid_path) as pid_file:
+                return int(pid_file.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def get_pids(self):
+        """Return the pids of the running kytosd processes.
+
+        The pid file is the source of truth, but if it is missing or stale we
+        still look for kytosd processes by name (same as pkill would do)."""
+        pid = self.read_pid()
+        if pid and self.is_alive(pid):
+            return [pid]
+        if not self.find_by_name:
+            return []
+        result = subprocess.run(
+            ["pgrep", "kytosd"], capture_output=True, text=True, check=False
+        )
+        return [int(pid) for pid in result.stdout.split()]
+
+    @staticmethod
+    def is_alive(pid):
+        """Check if the process is still running (zombies are not)."""
+        try:
+            with open(f"/proc/{pid}/stat") as stat_file:
+                # the state comes right after the command name in parenthesis
+                state = stat_file.read().rsplit(")", 1)[1].split()[0]
+        except (OSError, IndexError):
+            return False
+        return state not in ("Z", "X")
+
+    def wait_exit(self, pid, timeout):
+        """Wait for the process to exit. Return False on timeout."""
+        try:
+            pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):
+            pidfd = None
+        if pidfd is not None:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                return bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(pidfd)
+        deadline = time.monotonic() + timeout
+        while self.is_alive(pid):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
+        return True
+
+    def signal(self, pid, signum):
+        """Send signal to the process, ignoring it if it already exited."""
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def stop(self):
+        """Stop kytosd gracefully, killing it after stop_timeout seconds.
+
+        Return how long (in seconds) it took to stop the process."""
+        begin = time.monotonic()
+        pids = self.get_pids()
+        for pid in pids:
+            self.signal(pid, signal.SIGTERM)
+        deadline = begin + self.stop_timeout
+        for pid in pids:
+            if self.wait_exit(pid, max(deadline - time.monotonic(), 0)):
+                continue
+            print(f"FAIL to stop kytos (pid={pid}) after {self.stop_timeout}"
+                  " seconds. Force stop!")
+            self.signal(pid, signal.SIGKILL)
+            self.wait_exit(pid, self.stop_timeout)
+        # kytosd removes its pid file on shutdown, unless it was killed
+        if os.path.exists(self.pid_path):
+            os.remove(self.pid_path)
+        return time.monotonic() - begin
+
+
+def ovs_vsctl(*args):
+    """Run ovs-vsctl with the given arguments and return its output."""
+    result = subprocess.run(
+        ["ovs-vsctl", "--timeout=10", *args],
+        capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        raise Exception(f"ovs-vsctl {' '.join(args)} failed: {result.stderr}")
+    return result.stdout
+
+
+def bridges_controller_uuids():
+    """Return the controller UUIDs of every OvS bridge by bridge name."""
+    output = ovs_vsctl("--format=json", "--columns=name,controller", "list", "Bridge")
+    return {
+        name: ovsdb_uuids(controllers)
+        for name, controllers in json.loads(output)["data"]
+    }
+
+
+def shard_topo(topo):
+    """Return a copy of topo with the switches renamed with SHARD_PREFIX
+    and their listenPort moved to the shard range.
+
+    Hosts keep their names, their interfaces live in their own network
+    namespace and don't clash with the ones of other shards."""
+    names = {
+        name: SHARD_PREFIX + name if topo.isSwitch(name) else name
+        for name in topo.nodes(sort=False)
+    }
+    new_topo = Topo()
+    for name in topo.nodes(sort=False):
+        info = dict(topo.nodeInfo(name))
+        if info.get("listenPort"):
+            info["listenPort"] += SHARD_LISTEN_PORT_OFFSET
+        new_topo.addNode(names[name], **info)
+    for src, dst, key, info in topo.links(sort=False, withKeys=True, withInfo=True):
+        opts = {k: v for k, v in info.items() if k not in ("node1", "node2")}
+        new_topo.addLink(names[info["node1"]], names[info["node2"]], key=key, **opts)
+    return new_topo
+
+
+def cleanup_mininet():
+    """Clean up Mininet leftovers. In a shard, only its own switches and
+    interfaces are removed, since other shards are still running."""
+    if not SHARD_PREFIX:
+        mininet.clean.cleanup()
+        return
+    bridges = subprocess.run(
+        ["ovs-vsctl", "--timeout=5", "list-br"], capture_output=True, text=True
+    ).stdout.split()
+    for bridge in bridges:
+        if bridge.startswith(SHARD_PREFIX):
+            subprocess.run(["ovs-vsctl", "--timeout=5", "--if-exists", "del-br", bridge])
+    links = subprocess.run(
+        ["ip", "-o", "link", "show"], capture_output=True, text=True
+    ).stdout.splitlines()
+    for line in links:
+        name = line.split(":")[1].strip().split("@")[0]
+        if name.startswith(SHARD_PREFIX):
+            subprocess.run(["ip", "link", "del", name], capture_output=True)
+
+
+def kytosd_shard_conf():
+    """Write the kytos.conf of the shard (API port and pid file) and
+    return its path."""
+    config = configparser.ConfigParser()
+    config.read(KYTOSD_CONF_PATH)
+    if not config.has_section("daemon"):
+        config.add_section("daemon")
+    config.set("daemon", "api_port", str(KYTOS_API_PORT))
+    config.set("daemon", "pidfile", KYTOSD_PID_PATH)
+    path = os.path.join(BASE_ENV, f"etc/kytos/kytos-{SHARD_ID}.conf")
+    with open(path, "w") as conf_file:
+        config.write(conf_file)
+    return path
+
+
+def colon_dpid(dpid):
+    """Return the dpid of a Mininet switch as given by Kytos
+    (00:00:00:00:00:00:00:01)."""
+    return ":".join(dpid[i:i+2] for i in range(0, len(dpid), 2))
+
+
+def host_unis(net):
+    """Return the (switch name, interface id) of the ports facing hosts."""
+    unis = []
+    for host in net.hosts:
+        for intf in host.intfList():
+            link = intf.link
+            if not link:
+                continue
+            sw_intf = link.intf2 if link.intf1 == intf else link.intf1
+            switch = sw_intf.node
+            unis.append(
+                (switch.name, f"{colon_dpid(switch.dpid)}:{switch.ports[sw_intf]}")
+            )
+    return unis
+
+
+def uni_pairs(net):
+    """Return disjoint (uni_a, uni_z) pairs of host ports on different
+    switches."""
+    pairs = []
+    pending = []
+    for switch, uni in host_unis(net):
+        for index, (other_switch, other_uni) in enumerate(pending):
+            if other_switch != switch:
+                pairs.append((other_uni, uni))
+                del pending[index]
+                break
+        else:
+            pending.append((switch, uni))
+    return pairs
+
+
+def kytos_link_id(link):
+    """Return the id given by Kytos to the link between two switches, or
+    None if a port number is not known."""
+    dpid1 = colon_dpid(link.intf1.node.dpid)
+    dpid2 = colon_dpid(link.intf2.node.dpid)
+    port1 = link.intf1.node.ports.get(link.intf1)
+    port2 = link.intf2.node.ports.get(link.intf2)
+    if not port1 or not port2:
+        return
+    intf1 = f"{dpid1}:{port1}"
+    intf2 = f"{dpid2}:{port2}"
+    if dpid1 == dpid2:
+        port1, port2 = sorted((port1, port2))
+        raw_str = f"{dpid1}:{port1}:{dpid2}:{port2}"
+    else:
+        raw_str = ":".join(sorted((intf1, intf2)))
+    return hashlib.sha256(raw_str.encode('utf-8')).hexdigest()
+
+
+class LinkEntry:
+    """A link between switches: Mininet link, Kytos link id and the
+    (node name, interface name, port number) of both endpoints."""
+
+    __slots__ = ("link", "link_id", "endpoints")
+
+    def __init__(self, link, link_id):
+        self.link = link
+        self.link_id = link_id
+        self.endpoints = tuple(
+            (intf.node.name, intf.name, intf.node.ports.get(intf))
+            for intf in (link.intf1, link.intf2)
+        )
+
+    def __str__(self):
+        (_, name1, _), (_, name2, _) = self.endpoints
+        return f"{name1}<->{name2} ({self.link_id[:8]})"
+
+
+class LinkIndex:
+    """Kytos link ids of the links between the switches of a network,
+    computed once and indexed by Mininet link and by node name."""
+
+    def __init__(self, net):
+        self.net = net
+        self.links = []
+        self.entries = {}   # link id -> LinkEntry
+        self.by_link = {}   # mininet link -> link id
+        self.by_node = defaultdict(list)  # node name -> link ids
+
+    def refresh(self):
+        """Rebuild the index if links were added or removed."""
+        if self.links != self.net.links:
+            self.build()
+        return self
+
+    def build(self):
+        self.links = list(self.net.links)
+        self.entries.clear()
+        self.by_link.clear()
+        self.by_node.clear()
+        switches = set(self.net.switches)
+        for link in self.links:
+            if link.intf1.node not in switches or link.intf2.node not in switches:
+                continue
+            link_id = kytos_link_id(link)
+            if not link_id:
+                continue
+            entry = LinkEntry(link, link_id)
+            self.entries[link_id] = entry
+            self.by_link[link] = link_id
+            for node in {link.intf1.node.name, link.intf2.node.name}:
+                self.by_node[node].append(link_id)
+
+    def select(self, a=None, b=None, port1=None, port2=None):
+        """Return the ids of all the links, or of the links of node a (to
+        node b and with port1 on a and port2 on b, if provided)."""
+        if a is None:
+            return list(self.entries)
+        node_a = self.net.nameToNode.get(a)
+        if not node_a:
+            raise ValueError(f"Invalid node {a}")
+        node_b = None
+        if b is not None:
+            node_b = self.net.nameToNode.get(b)
+            if not node_b:
+                raise ValueError(f"Invalid node {b}")
+        selected = []
+        for link_id in self.by_node.get(node_a.name, []):
+            ep1, ep2 = self.entries[link_id].endpoints
+            for local, remote in ((ep1, ep2), (ep2, ep1)):
+                if any([
+                    local[0] != node_a.name,
+                    node_b is not None and remote[0] != node_b.name,
+                    port1 is not None and not local[1].endswith(f"eth{port1}"),
+                    port2 is not None and not remote[1].endswith(f"eth{port2}"),
+                ]):
+                    continue
+                selected.append(link_id)
+                break
+        return selected
+
+
 class NetworkTest:
     def __init__(
         self,
@@ -334,22 +1409,50 @@ class NetworkTest:
         db_client_options=None,
     ):
         # Create an instance of our topology
-        mininet.clean.cleanup()
+        cleanup_mininet()
+        self.topo_name = topo_name
+        topo = make_topo(topo_name)
+        if SHARD_PREFIX:
+            topo = shard_topo(topo)
 
         # Create a network based on the topology using
         # OVS and controlled by a remote controller
         patch('mininet.util.fixLimits', side_effect=None)
         self.net = Mininet(
-            topo=topos.get(topo_name, (lambda: RingTopo()))(),
+            topo=topo,
             controller=lambda name: RemoteController(
-                name, ip=controller_ip, port=6653),
+                name, ip=controller_ip, port=KYTOS_OF_PORT),
             switch=SwitchFactory,
             autoSetMacs=True)
+        if SHARD_PREFIX:
+            # let the tests keep using the names from the topology
+            for node in list(self.net.nameToNode.values()):
+                if node.name.startswith(SHARD_PREFIX):
+                    self.net.nameToNode[node.name[len(SHARD_PREFIX):]] = node
         db_client_kwargs = db_client_options or {}
-        db_name = db_client_kwargs.get("database") or os.environ.get("MONGO_DBNAME")
+        db_name = db_client_kwargs.get("database") or MONGO_DBNAME
         self.db_client = db_client(**db_client_kwargs)
         self.db_name = db_name
         self.db = self.db_client[self.db_name]
+        self.kytosd = KytosdProcess()
+        self.timings = []
+        # keep-alive Kytos API client
+        self.api = kytos_api
+        self.controller_ready_at = None
+        # restore the database from a snapshot instead of dropping it and
+        # waiting for the topology discovery (see restart_kytos_clean)
+        self.use_db_snapshot = False
+        # controller state right after a clean restart (see soft_reset)
+        self.soft_reset_baseline = None
+        # OVSDB session following the switches connection (None until the
+        # first wait_switches_connect, False if it is not available)
+        self.ovsdb_monitor = None
+        # Kytos link ids of the network links (see link_index)
+        self._link_index = None
+        # arguments and wiring of the network when it was built, to reuse
+        # it only if they didn't change (see NetworkPool.acquire)
+        self.build_kwargs = None
+        self.wiring = None
         # setup a wrapper for configLinkStatus
         self.net.orig_configLinkStatus = self.net.configLinkStatus
         self.net.configLinkStatus = self.configLinkStatus
@@ -363,40 +1466,54 @@ class NetworkTest:
         """Drop database."""
         self.db_client.drop_database(self.db_name)
 
+    def snapshot_database(self):
+        """Return a copy of all the collections of the database, with the
+        documents kept as raw BSON."""
+        db = self.db.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
+        return {
+            name: list(db[name].find())
+            for name in db.list_collection_names()
+        }
+
+    def restore_database(self, snapshot):
+        """Replace the database content with a snapshot."""
+        begin = time.monotonic()
+        self.drop_database()
+        for name, docs in snapshot.items():
+            if docs:
+                self.db[name].insert_many(docs, ordered=False)
+            else:
+                self.db.create_collection(name)
+        self.record_timing("db_restore", time.monotonic() - begin)
+
     def stop_kytosd(self):
         """Stop kytosd process."""
-        try:
-            os.system('pkill kytosd')
-            time.sleep(5)
-            pid_path = os.path.join(BASE_ENV, 'var/run/kytos/kytosd.pid')
-            if os.path.exists(pid_path):
-                raise Exception("kytos pid still exists.")
-        except Exception as e:
-            print(f"FAIL to stop kytos after 5 seconds -- {e}. Force stop!")
-            os.system('pkill -9 kytosd')
-            os.system(f"rm -f {pid_path}")
+        self.record_timing("kytosd_stop", self.kytosd.stop())
+
+    def record_timing(self, name, seconds):
+        """Record a timing measurement to be reported for the current test."""
+        self.timings.append((name, seconds))
+
+    def pop_timings(self):
+        """Return and clear the timing measurements recorded so far."""
+        timings, self.timings = self.timings, []
+        return timings
 
     def start_controller(self, clean_config=False, enable_all=False,
                          del_flows=False, port=None, database='mongodb',
-                         extra_args=os.environ.get("KYTOSD_EXTRA_ARGS", "")):
+                         extra_args=os.environ.get("KYTOSD_EXTRA_ARGS", ""),
+                         db_snapshot=None):
         # Restart kytos and check if the napp is still disabled
-        try:
-            os.system('pkill kytosd')
-            # with open('/var/run/kytos/kytosd.pid', "r") as f:
-            #    pid = int(f.read())
-            #    os.kill(pid, signal.SIGTERM)
-            time.sleep(5)
-            pid_path = os.path.join(BASE_ENV, 'var/run/kytos/kytosd.pid')
-            if os.path.exists(pid_path):
-                raise Exception("Kytos pid still exists.")
-        except Exception as e:
-            print("FAIL to stop kytos after 5 seconds -- %s. Force stop!" % e)
-            os.system('pkill -9 kytosd')
-            os.system(f'rm -f {pid_path}')
+        self.stop_kytosd()
 
         if clean_config and database:
             try:
-                self.drop_database()
+                if db_snapshot is not None:
+                    self.restore_database(db_snapshot)
+                else:
+                    self.drop_database()
             except ServerSelectionTimeoutError as exc:
                 print(f"FAIL to drop database. {str(exc)}")
 
@@ -406,6 +1523,11 @@ class NetworkTest:
                 sw.dpctl('del-flows')
 
         daemon = 'kytosd'
+        if SHARD_ID:
+            # kytosd reads the database name from its environment
+            daemon = f'MONGO_DBNAME={MONGO_DBNAME} {daemon}'
+            daemon += f' --conf {kytosd_shard_conf()} --pidfile {KYTOSD_PID_PATH}'
+            port = port or KYTOS_OF_PORT
         if database:
             daemon += f' --database {database}'
         if port:
@@ -414,120 +1536,193 @@ class NetworkTest:
             daemon += ' -E'
         if extra_args:
             daemon += ' ' + extra_args
+        begin = time.monotonic()
         os.system(daemon)
+        self.record_timing("kytosd_spawn", time.monotonic() - begin)
 
         self.wait_controller_start()
 
         # make sure switches will reconnect
         self.reconnect_switches(wait=False)
 
-    def wait_controller_start(self):
-        """Wait until controller starts according to core/status API."""
-        wait_count = 0
+    def wait_controller_start(self, timeout=60, interval=0.1):
+        """Wait until controller starts according to core/status API and
+        all the enabled NApps are loaded.
+
+        The time spent on each phase is recorded as kytosd_api_up and
+        kytosd_napps_loaded (and later switches_connected, if the test
+        waits for the switches to connect)."""
+        begin = time.monotonic()
+        deadline = begin + timeout
         last_error = ""
-        while wait_count < 60:
+        while True:
             try:
-                response = requests.get('http://127.0.0.1:8181/api/kytos/core/status/', timeout=3)
+                response = self.api.get(
+                    "kytos/core/status/", retries=0, timeout=3
+                )
                 assert response.json()['response'] == 'running', response.text
                 break
             except Exception as exc:
                 last_error = str(exc)
-                time.sleep(0.5)
-                wait_count += 0.5
-        else:
-            msg = f"Timeout while starting Kytos controller. Last error: {last_error}"
-            raise Exception(msg)
+            if time.monotonic() > deadline:
+                msg = f"Timeout while starting Kytos controller. Last error: {last_error}"
+                raise Exception(msg)
+            time.sleep(interval)
+        api_up = time.monotonic()
+        self.record_timing("kytosd_api_up", api_up - begin)
+
+        pending = self.get_napps_ready_endpoints()
+        while pending:
+            for napp, endpoint in list(pending.items()):
+                try:
+                    response = self.api.get(endpoint, retries=0, timeout=3)
+                    if response.status_code != 404:
+                        del pending[napp]
+                except requests.RequestException as exc:
+                    last_error = str(exc)
+            if not pending:
+                break
+            if time.monotonic() > deadline:
+                msg = (
+                    f"Timeout waiting for NApps to load: {sorted(pending)}."
+                    f" Last error: {last_error}"
+                )
+                raise Exception(msg)
+            time.sleep(interval)
+        self.controller_ready_at = time.monotonic()
+        self.record_timing("kytosd_napps_loaded", self.controller_ready_at - api_up)
 
-    def wait_switches_connect(self):
-        max_wait = 0
+    def get_napps_ready_endpoints(self):
+        """Return the readiness endpoint of each enabled NApp."""
+        response = self.api.get("kytos/core/napps_enabled/", timeout=3)
+        napps = {tuple(napp) for napp in response.json()['napps']}
+        return {
+            napp: endpoint
+            for napp, endpoint in NAPPS_READY_ENDPOINTS.items()
+            if napp in napps
+        }
+
+    def get_ovsdb_monitor(self):
+        """Return the OVSDB monitor of the OvS switches, if available."""
+        if self.ovsdb_monitor is None:
+            self.ovsdb_monitor = False
+            if self.ovs_switches():
+                monitor = OvsdbMonitor()
+                try:
+                    monitor.start()
+                    self.ovsdb_monitor = monitor
+                except Exception as exc:
+                    monitor.stop()
+                    print(f"FAIL to monitor OVSDB, polling the switches. {exc}")
+        return self.ovsdb_monitor
+
+    def wait_switches_connect(self, timeout=30, interval=0.2):
+        """Wait until all switches are connected to the controller.
+
+        The OvS switches are followed through the OVSDB monitor when it is
+        running (the time they took to reconnect is recorded as
+        of_reconnect), the other ones are polled."""
         # update controller UUIDs for OVSSwitch to avoid errors while changing
         # the controller: no row "xyz" in table Controller
-        for sw in self.net.switches:
-            sw.controllerUUIDs(update=True)
-        while any(not sw.connected() for sw in self.net.switches):
-            time.sleep(1)
-            max_wait += 1
-            if max_wait > 30:
-                status = [(sw.name, sw.connected()) for sw in self.net.switches]
+        self.update_controller_uuids()
+        deadline = time.monotonic() + timeout
+        polled = self.net.switches
+        monitor = self.get_ovsdb_monitor()
+        if monitor and not monitor.thread.is_alive():
+            # the session with ovsdb-server was lost: poll this time and
+            # start a new monitor in the next wait
+            print(f"FAIL OVSDB monitor stopped, polling the switches. {monitor.error}")
+            monitor.stop()
+            self.ovsdb_monitor = monitor = None
+        if monitor:
+            names = [sw.name for sw in self.ovs_switches()]
+            if not monitor.wait_connected(names, timeout):
+                raise Exception(
+                    'Timeout: timed out waiting switches reconnect. Status %s'
+                    % monitor.status(names)
+                )
+            reconnections = monitor.pop_reconnections()
+            if reconnections:
+                self.record_timing(
+                    "of_reconnect", max(seconds for _, seconds in reconnections)
+                )
+            polled = [sw for sw in self.net.switches if sw.name not in names]
+        while any(not sw.connected() for sw in polled):
+            if time.monotonic() > deadline:
+                status = [(sw.name, sw.connected()) for sw in polled]
                 raise Exception('Timeout: timed out waiting switches reconnect. Status %s' % status)
+            time.sleep(interval)
+        # the first wait after a controller start completes the startup breakdown
+        if self.controller_ready_at is not None:
+            self.record_timing(
+                "switches_connected", time.monotonic() - self.controller_ready_at
+            )
+            self.controller_ready_at = None
 
+    @property
+    def link_index(self):
+        """Index of the links between switches, rebuilt when they change."""
+        if self._link_index is None:
+            self._link_index = LinkIndex(self.net)
+        return self._link_index.refresh()
 
-    def wait_kytos_links(self, a=None, b=None, port1=None, port2=None, status=None):
-        wait_count = 0
-        last_error = ""
-        topo_links = []
-        links = self.net.links
-        if a is not None:
-            node_a = self.net.nameToNode.get(a)
-            if not node_a:
-                raise ValueError(f"Invalid node {a}")
-            node_b = None
-            if b is not None:
-                node_b = self.net.nameToNode.get(b)
-                if not node_b:
-                    raise ValueError(f"Invalid node {b}")
-            node_a_links = set()
-            for intf in node_a.intfs.values():
-                if not intf.link:
-                    continue
-                intf2 = intf.link.intf2 if intf.link.intf1 == intf else intf.link.intf1
-                if node_b and intf2.node != node_b:
-                    continue
-                if any([
-                    port1 is not None and not intf.name.endswith(f"eth{port1}"),
-                    port2 is not None and not intf2.name.endswith(f"eth{port2}"),
-                ]):
-                    continue
-                node_a_links.add(intf.link)
-            links = list(node_a_links)
-        for link in links:
-            if link.intf1.node in self.net.switches and link.intf2.node in self.net.switches:
-                link_id = self.create_link_id(link)
-                if link_id:
-                    topo_links.append(link_id)
-        while wait_count < 60:
-            try:
-                response = requests.get("http://127.0.0.1:8181/api/kytos/topology/v3/links/", timeout=3)
-                links = response.json()["links"]
-                if a is not None:
-                    links = {lid: links[lid] for lid in topo_links if lid in links}
-                assert len(topo_links) == len(links), f"{topo_links=} {links=}"
-                assert all(link_id in links for link_id in topo_links), f"{topo_links=} {links=}"
-                if status is not None:
-                    assert all(links[lid]["status"] == status for lid in topo_links), f"{topo_links} {links=} {status=}"
-                break
-            except Exception as exc:
-                last_error = str(exc)
-            time.sleep(1)
-            wait_count += 1
-        else:
-            msg = f"Timeout waiting for links. Last error: {last_error}"
-            raise Exception(msg)
+    def wait_kytos_links(self, a=None, b=None, port1=None, port2=None,
+                         status=None, timeout=60):
+        """Wait until Kytos has the links between switches of the network
+        (or only the ones of node a, to node b and with the given ports),
+        with the given status if provided. Without a, Kytos must not have
+        any other link.
+
+        Each poll only checks the links still missing or with a different
+        status, and the timeout error lists them.
+        """
+        index = self.link_index
+        pending = {
+            link_id: index.entries[link_id]
+            for link_id in index.select(a, b, port1, port2)
+        }
+        unexpected = []
+
+        def condition():
+            response = self.api.get(
+                f"{KYTOS_API}/kytos/topology/v3/links/", timeout=3
+            )
+            links = response.json()["links"]
+            late = []
+            for link_id, entry in list(pending.items()):
+                link = links.get(link_id)
+                if link is None:
+                    late.append(f"{entry} missing")
+                elif status is not None and link["status"] != status:
+                    late.append(f"{entry} {link['status']}")
+                else:
+                    del pending[link_id]
+            if a is None:
+                unexpected[:] = [
+                    link_id for link_id in links if link_id not in index.entries
+                ]
+                if unexpected:
+                    late.append(f"unexpected links {unexpected}")
+            assert not late, ", ".join(late)
+            return True
+
+        expected = f" {status}" if status is not None else ""
+        nodes = f" of {a}" + (f" to {b}" if b is not None else "") \
+            if a is not None else ""
+        wait_until(
+            condition, timeout=timeout, interval=0.1, max_interval=0.5,
+            description=f"{len(pending)} Kytos links{nodes}{expected}",
+        )
 
     def create_link_id(self, link):
-        dpid1 = link.intf1.node.dpid
-        dpid2 = link.intf2.node.dpid
-        dpid1 = ":".join(dpid1[i:i+2] for i in range(0, len(dpid1), 2))
-        dpid2 = ":".join(dpid2[i:i+2] for i in range(0, len(dpid2), 2))
-        port1 = link.intf1.node.ports.get(link.intf1)
-        port2 = link.intf2.node.ports.get(link.intf2)
-        if not port1 or not port2:
-            return
-        intf1 = f"{dpid1}:{port1}"
-        intf2 = f"{dpid2}:{port2}"
-        if dpid1 == dpid2:
-            port1, port2 = sorted((port1, port2))
-            raw_str = f"{dpid1}:{port1}:{dpid2}:{port2}"
-        else:
-            raw_str = ":".join(sorted((intf1, intf2)))
-        return hashlib.sha256(raw_str.encode('utf-8')).hexdigest()
+        return kytos_link_id(link)
 
     def wait_kytos_buff_low_usage(self, max_wait=60, usage_limit=50, period=5):
         wait_count = 0
         q_usage = defaultdict(list)
         while wait_count < max_wait+period:
             try:
-                response = requests.get("http://127.0.0.1:8181/api/kytos/core/status/", timeout=3)
+                response = self.api.get("kytos/core/status/", timeout=3)
                 buf_usage = response.json()["buffers_qsize"]
                 moving_avg = {}
                 for name, size in buf_usage.items():
@@ -547,39 +1742,273 @@ class NetworkTest:
             raise Exception(msg)
 
     def restart_kytos_clean(self):
-        self.start_controller(clean_config=True, enable_all=True)
+        """Restart kytosd with a clean database and all elements enabled.
+
+        If use_db_snapshot is set, the database is captured once per
+        topology after all links are discovered and UP, and later restarts
+        restore that snapshot instead of starting from an empty database.
+        """
+        snapshot = None
+        if self.use_db_snapshot:
+            snapshot = DB_SNAPSHOTS.get(self.topo_name)
+        self.start_controller(clean_config=True, enable_all=True,
+                              db_snapshot=snapshot)
         self.wait_switches_connect()
         self.wait_kytos_links()
+        if self.use_db_snapshot and snapshot is None:
+            self.wait_kytos_links(status="UP")
+            DB_SNAPSHOTS[self.topo_name] = self.snapshot_database()
+
+    def wait_kytos_converged(self, timeout=60, stable_for=1):
+        """Wait for the controller to converge after a (re)start: all links
+        UP and the basic flows (of_lldp, coloring, etc) installed on every
+        switch and unchanged for stable_for seconds."""
+        self.wait_kytos_links(status="UP")
+        last = {"counts": None, "since": None}
+
+        def condition():
+            counts = {
+                sw.name: len(sw.dpctl('dump-flows').splitlines())
+                for sw in self.net.switches
+            }
+            now = time.monotonic()
+            if counts != last["counts"]:
+                last["counts"], last["since"] = counts, now
+            missing = [name for name, count in counts.items() if not count]
+            assert not missing, f"switches without flows: {missing}"
+            elapsed = now - last["since"]
+            assert elapsed >= stable_for, f"flows changed {elapsed:.1f}s ago: {counts}"
+            return counts
+
+        wait_until(
+            condition, timeout=timeout, max_interval=stable_for / 2,
+            description="basic flows installed on every switch",
+        )
+
+    def soft_reset(self, timeout=10):
+        """Return the controller to the state of a clean restart without
+        restarting kytosd nor reconnecting the switches.
+
+        EVCs, maintenance windows, pipelines, flows, metadata and users
+        created since the clean restart are deleted (through the REST API
+        whenever there is one), disabled elements are enabled again and
+        then the switches and the database are compared with the state
+        recorded right after the clean restart. If there is no such state
+        yet, or if some leftover state is found, this falls back to
+        restart_kytos_clean(). Return True if the soft reset was enough.
+        """
+        if self.soft_reset_baseline is None:
+            self.restart_kytos_baseline()
+            return False
+        begin = time.monotonic()
+        try:
+            self.config_all_links_up()
+            self.delete_controller_state()
+            wait_until(
+                lambda: self.get_controller_state() == self.soft_reset_baseline,
+                timeout=timeout, description="controller state as after a clean restart",
+            )
+        except Exception as exc:
+            print(f"FAIL to soft reset, restarting kytosd. {exc}")
+            self.restart_kytos_baseline()
+            return False
+        self.record_timing("soft_reset", time.monotonic() - begin)
+        return True
+
+    def restart_kytos_baseline(self):
+        """Restart kytosd clean and record the state used by soft_reset."""
+        self.config_all_links_up()
+        self.restart_kytos_clean()
+        self.wait_kytos_converged()
+        self.soft_reset_baseline = self.get_controller_state()
+
+    def get_controller_state(self):
+        """Return the state compared by soft_reset: flow tables of the
+        switches, stored flows, topology metadata and enabled/status of
+        its elements, users and number of documents of each collection."""
+        api = self.api
+        switches = api.get(f"{KYTOS_API}/kytos/topology/v3/switches", timeout=10)
+        links = api.get(f"{KYTOS_API}/kytos/topology/v3/links", timeout=10)
+        topology = {}
+        for dpid, switch in switches.json()["switches"].items():
+            topology[dpid] = (switch["enabled"], switch["metadata"])
+            for intf_id, intf in switch["interfaces"].items():
+                topology[intf_id] = (intf["enabled"], intf["metadata"])
+        for link_id, link in links.json()["links"].items():
+            topology[link_id] = (link["enabled"], link["status"], link["metadata"])
+
+        documents = {}
+        for name in self.db.list_collection_names():
+            ignored = SOFT_RESET_IGNORED_DOCS.get(name)
+            query = {"$nor": [ignored]} if ignored else {}
+            documents[name] = self.db[name].count_documents(query)
+
+        return {
+            "flows": {
+                sw.name: sorted(
+                    FLOW_COUNTERS.sub("", flow).strip()
+                    for flow in sw.dpctl("dump-flows").splitlines()
+                )
+                for sw in self.net.switches
+            },
+            "stored_flows": self.get_stored_flow_ids(),
+            "topology": topology,
+            "users": sorted(user["username"] for user in self.db.users.find()),
+            "documents": documents,
+        }
+
+    def get_stored_flow_ids(self):
+        """Return the flow_manager stored flows (not deleted) ids by dpid."""
+        response = self.api.get(
+            f"{KYTOS_API}/kytos/flow_manager/v2/stored_flows", timeout=10
+        )
+        if response.status_code == 404:
+            return {}
+        return {
+            dpid: sorted(
+                flow["flow_id"] for flow in flows if flow.get("state") != "deleted"
+            )
+            for dpid, flows in response.json().items()
+        }
+
+    def delete_controller_state(self):
+        """Delete what was created since the soft_reset baseline."""
+        api = self.api
+        baseline = self.soft_reset_baseline
+        napps = {napp for _, napp in self.get_napps_ready_endpoints()}
+
+        if "mef_eline" in napps:
+            url = f"{KYTOS_API}/kytos/mef_eline/v2/evc"
+            for evc_id in api.get(f"{url}/", timeout=10).json():
+                api.delete(f"{url}/{evc_id}", timeout=10)
+            # deleted EVCs are only archived
+            self.db.evcs.delete_many({"archived": True})
 
-    def reconnect_switches(self, target="tcp:127.0.0.1:6653",
-                           temp_target="tcp:127.0.0.1:6654", wait=True):
+        if "maintenance" in napps:
+            url = f"{KYTOS_API}/kytos/maintenance/v1"
+            for window in api.get(url, timeout=10).json():
+                if window["status"] == "running":
+                    api.patch(f"{url}/{window['id']}/end", timeout=10)
+                api.delete(f"{url}/{window['id']}", timeout=10)
+
+        if "of_multi_table" in napps:
+            url = f"{KYTOS_API}/kytos/of_multi_table/v1/pipeline"
+            for pipeline in api.get(url, timeout=10).json()["pipelines"]:
+                if pipeline["status"] == "enabled":
+                    api.post(f"{url}/{pipeline['id']}/disable", timeout=10)
+                api.delete(f"{url}/{pipeline['id']}", timeout=10)
+
+        if "flow_manager" in napps:
+            url = f"{KYTOS_API}/kytos/flow_manager/v2"
+            stored = api.get(f"{url}/stored_flows", timeout=10).json()
+            for dpid, flows in stored.items():
+                keep = set(baseline["stored_flows"].get(dpid, []))
+                delete = [
+                    {
+                        "cookie": flow["flow"].get("cookie", 0),
+                        "cookie_mask": 0xFFFFFFFFFFFFFFFF,
+                        "table_id": flow["flow"].get("table_id", 0),
+                        "priority": flow["flow"].get("priority"),
+                        "match": flow["flow"].get("match", {}),
+                    }
+                    for flow in flows
+                    if flow.get("state") != "deleted" and flow["flow_id"] not in keep
+                ]
+                if delete:
+                    api.delete(
+                        f"{url}/flows/{dpid}", json={"flows": delete, "force": True},
+                        timeout=10,
+                    )
+
+        url = f"{KYTOS_API}/kytos/topology/v3"
+        switches = api.get(f"{url}/switches", timeout=10).json()["switches"]
+        elements = [("switches", dpid, sw) for dpid, sw in switches.items()]
+        for sw in switches.values():
+            elements.extend(
+                ("interfaces", intf_id, intf)
+                for intf_id, intf in sw["interfaces"].items()
+            )
+        links = api.get(f"{url}/links", timeout=10).json()["links"]
+        elements.extend(("links", link_id, link) for link_id, link in links.items())
+        for kind, elem_id, elem in elements:
+            base = baseline["topology"].get(elem_id)
+            base_metadata = base[-1] if base else {}
+            for key in elem["metadata"]:
+                if key not in base_metadata:
+                    api.delete(f"{url}/{kind}/{elem_id}/metadata/{key}", timeout=10)
+            changed = {
+                key: value for key, value in base_metadata.items()
+                if elem["metadata"].get(key) != value
+            }
+            if changed:
+                api.post(f"{url}/{kind}/{elem_id}/metadata", json=changed, timeout=10)
+            if not elem["enabled"] and (not base or base[0]):
+                api.post(f"{url}/{kind}/{elem_id}/enable", timeout=10)
+
+        # kytos core users can only be deleted through the API by an
+        # authenticated user, so the new ones are removed from the database
+        self.db.users.delete_many({"username": {"$nin": baseline["users"]}})
+
+    def reconnect_switches(self, target=f"tcp:127.0.0.1:{KYTOS_OF_PORT}",
+                           temp_target=f"tcp:127.0.0.1:{KYTOS_OF_PORT + 1}",
+                           wait=True):
         """Restart switches connections.
         This method can also be used to trigger a consistency check initial run.
 
         A temporary target is used in order to avoid OvS deleting the flows
         if the controller config were to be deleted.
         """
+        switches = self.ovs_switches()
         for sw in self.net.switches:
-            if hasattr(sw, "reset_controller") and callable(sw.reset_controller):
+            if sw not in switches:
                 sw.reset_controller()
-                continue
-            sw.vsctl(f"set-controller {sw.name} {temp_target}")
-            sw.controllerUUIDs(update=True)
-            sw.vsctl(f"set-controller {sw.name} {target}")
-            sw.controllerUUIDs(update=True)
+        if switches:
+            # one transaction for all the bridges with each target
+            for controller in (temp_target, target):
+                ovs_vsctl(*(
+                    arg for sw in switches
+                    for arg in ("--", "set-controller", sw.name, controller)
+                ))
+            self.update_controller_uuids()
         if wait:
             self.wait_switches_connect()
 
+    def ovs_switches(self):
+        """Return the switches managed through the local ovs-vsctl (the
+        other backends provide a reset_controller method instead)."""
+        return [
+            sw for sw in self.net.switches
+            if not callable(getattr(sw, "reset_controller", None))
+        ]
+
+    def update_controller_uuids(self):
+        """Refresh the controller UUIDs cached by each switch, with a
+        single OVSDB query for all the OvS bridges."""
+        switches = self.ovs_switches()
+        for sw in self.net.switches:
+            if sw not in switches:
+                sw.controllerUUIDs(update=True)
+        if not switches:
+            return
+        uuids = bridges_controller_uuids()
+        for sw in switches:
+            sw._uuids = uuids.get(sw.name, [])
+
     def configLinkStatus(self, a, b, status, port1=None, port2=None):
+        self.set_links_status([(a, b, port1, port2)], status)
+
+    def link_connections(self, a, b, port1=None, port2=None):
+        """Return the (intf on a, intf on b) of the links between a and b
+        (only the one between port1 and port2 if both are provided)."""
         connections = []
         node_a = self.net.get(a)
         node_b = self.net.get(b)
         if not node_a:
             error(f"src not in network: {a}\n")
-            return
+            return connections
         if not node_b:
             error(f"dst not in network: {b}\n")
-            return
+            return connections
         if port1 and port2:
             intf1 = node_a.intfs.get(port1)
             intf2 = node_b.intfs.get(port2)
@@ -589,31 +2018,180 @@ class NetworkTest:
             connections = node_a.connectionsTo(node_b)
         if len(connections) == 0:
             error(f"src and dst not connected: {a} {b}\n")
-            return
+        return connections
+
+    def set_links_status(self, links, status, at=None):
+        """Set the status ("up" or "down") of several links at once.
+
+        links are Mininet links or (a, b[, port1, port2]) tuples as taken
+        by configLinkStatus. The interfaces are grouped by network
+        namespace and each group is changed by a single `ip -batch`, all
+        of them run concurrently. If at (a time.time() timestamp) is
+        given, the change starts at that time. Returns the time at which
+        the change started.
+        """
+        if status not in ("up", "down"):
+            raise ValueError(f"Invalid link status {status}")
+        connections = []
+        for link in links:
+            if isinstance(link, tuple):
+                connections.extend(self.link_connections(*link))
+            else:
+                connections.append((link.intf1, link.intf2))
+        batches = defaultdict(list)
+        for intf in (intf for conn in connections for intf in conn):
+            node = intf.node
+            batches[node if node.inNamespace else None].append(
+                f"link set dev {intf.name} {status}"
+            )
+        if at is not None:
+            time.sleep(max(at - time.time(), 0))
+        started_at = time.time()
         # for NoviSwitch hosts, before changing the status of the veth interfaces
         # we need to actually change the status of the interface on the switch to
         # trigger the OpenFlow PortStatus message on Noviflow NOS
-        if HAS_NOVISWITCH and isinstance(node_a, NoviSwitch):
-            node_a.configLinkStatus([c[0] for c in connections], status)
-        if HAS_NOVISWITCH and isinstance(node_b, NoviSwitch):
-            node_b.configLinkStatus([c[1] for c in connections], status)
+        if HAS_NOVISWITCH:
+            novi_intfs = defaultdict(list)
+            for intf in (intf for conn in connections for intf in conn):
+                if isinstance(intf.node, NoviSwitch):
+                    novi_intfs[intf.node].append(intf)
+            for node, intfs in novi_intfs.items():
+                node.configLinkStatus(intfs, status)
         # now we change the status on veth interfaces
-        for srcIntf, dstIntf in connections:
-            result = srcIntf.ifconfig(status)
-            if result:
-                error(f"link src status change failed: {result}\n")
-            result = dstIntf.ifconfig(status)
-            if result:
-                error(f"link dst status change failed: {result}\n")
+        procs = []
+        for node, commands in batches.items():
+            cmd = ["ip", "-force", "-batch", "-"]
+            if node is not None:
+                cmd = ["mnexec", "-a", str(node.pid)] + cmd
+            proc = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, text=True,
+            )
+            proc.stdin.write("\n".join(commands) + "\n")
+            proc.stdin.close()
+            procs.append((node, proc))
+        for node, proc in procs:
+            output = proc.stdout.read()
+            if proc.wait():
+                namespace = node.name if node is not None else "root"
+                error(f"link status change failed in {namespace} namespace: {output}\n")
+        return started_at
 
     def config_all_links_up(self):
-        for link in self.net.links:
-            self.configLinkStatus(
-                link.intf1.node.name,
-                link.intf2.node.name,
-                "up"
-            )
+        self.set_links_status(self.net.links, "up")
+
+    def dump_all_flows(self, switches=None, max_workers=16):
+        """Return {switch name: FlowTable} of the switches (names or nodes,
+        all of them by default), dumped concurrently."""
+        switches = [
+            self.net.get(sw) if isinstance(sw, str) else sw
+            for sw in (switches or self.net.switches)
+        ]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(switches))) as pool:
+            tables = pool.map(dump_flow_table, switches)
+        return {sw.name: table for sw, table in zip(switches, tables)}
+
+    def reset_network(self):
+        """Cheap reset of the network to its initial state: all links up,
+        no flows on the switches and the hosts as configured by Mininet
+        (extra interfaces, e.g. VLANs, removed and addresses reapplied)."""
+        self.config_all_links_up()
+        for sw in self.net.switches:
+            sw.dpctl('del-flows')
+        for host in self.net.hosts:
+            intfs = host.intfNames()
+            for line in host.cmd("ip -o link show").splitlines():
+                fields = line.split(":")
+                if len(fields) < 2:
+                    continue
+                name = fields[1].strip().split("@")[0]
+                if name != "lo" and name not in intfs:
+                    host.cmd(f"ip link del {name}")
+            for name in intfs:
+                host.cmd(f"ip addr flush dev {name}")
+            host.cmd("ip neigh flush all")
+            host.configDefault()
+
+    def network_wiring(self):
+        """Return the links and the switch ports of the network, to tell
+        whether a test changed its topology (see NetworkPool.acquire)."""
+        links = sorted(
+            (link.intf1.node.name, link.intf1.name,
+             link.intf2.node.name, link.intf2.name)
+            for link in self.net.links
+        )
+        ports = sorted(
+            (sw.name, port, intf.name)
+            for sw in self.net.switches for intf, port in sw.ports.items()
+        )
+        return links, ports
 
     def stop(self):
+        if self.ovsdb_monitor:
+            self.ovsdb_monitor.stop()
+        close_of_clients()
         self.net.stop()
-        mininet.clean.cleanup()
+        cleanup_mininet()
+
+
+class NetworkPool:
+    """Keep the network of the last test class alive for the session, so
+    the next classes using the same topology don't build it again.
+
+    Only one Mininet network can run at a time (NetworkTest cleans up any
+    Mininet leftover), so the live network is stopped when a different
+    topology is needed or when the session ends (see close()). It is also
+    built again when it was built with other arguments, when its links or
+    switch ports changed since it was built (e.g. a test added or deleted
+    a link), or when the class released it with rebuild=True.
+    """
+
+    def __init__(self, reuse=REUSE_NETWORKS):
+        self.reuse = reuse
+        self.networks = {}
+
+    def acquire(self, controller_ip, topo_name="ring", **kwargs):
+        """Return a started network (without the controller) of topo_name."""
+        net = self.networks.get(topo_name)
+        if net is not None:
+            if net.build_kwargs != kwargs:
+                print(f"Network {topo_name} was built with other arguments, building it again.")
+            elif net.network_wiring() != net.wiring:
+                print(f"Network {topo_name} links changed, building it again.")
+            else:
+                begin = time.monotonic()
+                try:
+                    net.reset_network()
+                    net.record_timing("network_reset", time.monotonic() - begin)
+                    return net
+                except Exception as exc:
+                    print(f"FAIL to reset network {topo_name}, building it again. {exc}")
+        self.close()
+        begin = time.monotonic()
+        net = NetworkTest(controller_ip, topo_name=topo_name, **kwargs)
+        net.start(start_controller=False)
+        net.build_kwargs = kwargs
+        net.wiring = net.network_wiring()
+        net.record_timing("network_build", time.monotonic() - begin)
+        self.networks[topo_name] = net
+        return net
+
+    def release(self, net, rebuild=False):
+        """Give back a network acquired by a test class. Classes that change
+        the topology (adding or deleting links or interfaces) set
+        rebuild_network and pass it as rebuild, so the next class gets a
+        new network (and the scheduler counts it, see tests/scheduling.py)."""
+        net.use_db_snapshot = False
+        net.soft_reset_baseline = None
+        if rebuild or not self.reuse:
+            self.networks.pop(net.topo_name, None)
+            net.stop()
+
+    def close(self):
+        """Stop all the networks."""
+        for net in self.networks.values():
+            net.stop()
+        self.networks.clear()
+
+
+network_pool = NetworkPool()
@@ -8,6 +8,8 @@ from mininet.clean import addCleanupCallback
 import logging
 import logging.handlers
 
+from tests.openflow import OPENFLOW_NATIVE_STATS, OpenFlowClient
+
 
 novi_cleanup_commands = [
     "del config controller controllergroup all controllerid all",
@@ -114,6 +116,7 @@ class NoviSwitch(Switch):
         self.controllers = []
         switch = NOVISETTINGS[self.novi_name]
         self.novi_ip = switch["ip"]
+        self.of_client = None
         self.ssh_client = paramiko.SSHClient()
         self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         self.ssh_client.connect(
@@ -544,6 +547,13 @@ class NoviSwitch(Switch):
     def dpctl(self, *args):
         "Run dpctl command"
         switch = "tcp:%s:6634" % NOVISETTINGS[self.novi_name]["ip"]
+        if args == ("del-flows",) and OPENFLOW_NATIVE_STATS:
+            try:
+                return self.del_flows()
+            except Exception as exc:
+                logger.warning(
+                    "OpenFlow del-flows failed in %s, using ovs-ofctl: %s" % (self.novi_name, exc)
+                )
         cmd = "ovs-ofctl %s -O OpenFlow13 %s %s" % (args[0], switch, " ".join(args[1:]))
         result = run_cmd(cmd)
         if args[0] != "del-flows":
@@ -564,6 +574,34 @@ class NoviSwitch(Switch):
 
         return result
 
+    def openflow_client(self):
+        """Persistent OpenFlow connection to the switch passive listener."""
+        if self.of_client is None:
+            self.of_client = OpenFlowClient((self.novi_ip, 6634))
+        return self.of_client
+
+    def del_flows(self):
+        """Delete all the flows and return once the switch confirmed it with
+        a barrier reply. The flow table is checked afterwards and, if some
+        flows are still there (for up to NOVIMAXWAIT), they are logged."""
+        client = self.openflow_client()
+        client.delete_flows()
+        begin = time.time()
+        interval = 0.05
+        while True:
+            flows = client.flow_stats()
+            if not flows:
+                return ""
+            if time.time() - begin > NOVIMAXWAIT:
+                logger.error(
+                    "flows not deleted from %s after %ss: %s"
+                    % (self.novi_name, NOVIMAXWAIT, [str(flow) for flow in flows])
+                )
+                return ""
+            logger.info(f"DEBUG: remaining flows for del-flows: {[str(flow) for flow in flows]}")
+            time.sleep(interval)
+            interval = min(interval * 2, 1)
+
     def reset_controller(self):
         """Reset the controller connection."""
         cmd = "set status controller controllergroup all controllerid all reset"
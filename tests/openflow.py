@@ -0,0 +1,462 @@
+"""Minimal OpenFlow 1.3 client to read the switches state without ovs-ofctl.
+
+OpenFlowClient keeps one connection to a switch passive listener (the
+bridge management socket for Open vSwitch, the tcp port 6634 for the
+Noviflow switches) and sends multipart flow, port and table stats
+requests and barriers on it. The replies are returned as records (the
+flows as tests.flow_table.Flow), so no process is spawned and no text
+is parsed.
+
+Only what the tests need is decoded: the OXM basic match fields (named
+and formatted as ovs-ofctl prints them, with dl_type and nw_proto folded
+into shorthands like ip or tcp), and the goto_table and apply_actions
+instructions with the usual actions, set_field included. Anything else
+is shown with its OpenFlow type number.
+"""
+import ipaddress
+import itertools
+import os
+import socket
+import struct
+import threading
+
+from tests.flow_table import Flow
+
+# read and change the switches through OpenFlowClient instead of ovs-ofctl
+OPENFLOW_NATIVE_STATS = os.environ.get("OPENFLOW_NATIVE_STATS", "1") != "0"
+
+OFP_VERSION = 0x04
+OFPT_HELLO = 0
+OFPT_ERROR = 1
+OFPT_ECHO_REQUEST = 2
+OFPT_ECHO_REPLY = 3
+OFPT_FLOW_MOD = 14
+OFPT_MULTIPART_REQUEST = 18
+OFPT_MULTIPART_REPLY = 19
+OFPT_BARRIER_REQUEST = 20
+OFPT_BARRIER_REPLY = 21
+
+OFPMP_FLOW = 1
+OFPMP_TABLE = 3
+OFPMP_PORT_STATS = 4
+OFPMPF_REPLY_MORE = 1
+OFPFC_DELETE = 3
+
+OFPTT_ALL = 0xff
+OFPP_ANY = 0xffffffff
+OFPG_ANY = 0xffffffff
+OFPP_CONTROLLER = 0xfffffffd
+OFPVID_PRESENT = 0x1000
+OFP_NO_BUFFER = 0xffffffff
+
+HEADER = struct.Struct("!BBHI")
+MULTIPART = struct.Struct("!HH4x")
+FLOW_MOD = struct.Struct("!QQBBHHHIIIH2x")
+FLOW_STATS_REQUEST = struct.Struct("!B3xII4xQQ")
+FLOW_STATS = struct.Struct("!HBxIIHHHH4xQQQ")
+PORT_STATS = struct.Struct("!I4x12QII")
+TABLE_STATS = struct.Struct("!B3xIQQ")
+# empty OXM match (type OFPMT_OXM, length 4, padded to 8 bytes)
+EMPTY_MATCH = struct.pack("!HH4x", 1, 4)
+
+OXM_OF_BASIC = 0x8000
+# OXM basic field number: (name in the ovs-ofctl matches, name in its
+# set_field actions)
+OXM_FIELDS = {
+    0: ("in_port", "in_port"), 2: ("metadata", "metadata"),
+    3: ("dl_dst", "eth_dst"), 4: ("dl_src", "eth_src"),
+    5: ("dl_type", "eth_type"), 6: ("dl_vlan", "vlan_vid"),
+    7: ("dl_vlan_pcp", "vlan_pcp"), 8: ("nw_tos", "ip_dscp"),
+    9: ("nw_ecn", "nw_ecn"), 10: ("nw_proto", "nw_proto"),
+    11: ("nw_src", "ip_src"), 12: ("nw_dst", "ip_dst"),
+    13: ("tp_src", "tcp_src"), 14: ("tp_dst", "tcp_dst"),
+    15: ("tp_src", "udp_src"), 16: ("tp_dst", "udp_dst"),
+    17: ("tp_src", "sctp_src"), 18: ("tp_dst", "sctp_dst"),
+    19: ("icmp_type", "icmp_type"), 20: ("icmp_code", "icmp_code"),
+    21: ("arp_op", "arp_op"), 22: ("arp_spa", "arp_spa"),
+    23: ("arp_tpa", "arp_tpa"), 24: ("arp_sha", "arp_sha"),
+    25: ("arp_tha", "arp_tha"), 26: ("ipv6_src", "ipv6_src"),
+    27: ("ipv6_dst", "ipv6_dst"), 28: ("ipv6_label", "ipv6_label"),
+    29: ("icmp_type", "icmpv6_type"), 30: ("icmp_code", "icmpv6_code"),
+    31: ("nd_target", "nd_target"), 32: ("nd_sll", "nd_sll"),
+    33: ("nd_tll", "nd_tll"), 34: ("mpls_label", "mpls_label"),
+    35: ("mpls_tc", "mpls_tc"), 36: ("mpls_bos", "mpls_bos"),
+    38: ("tun_id", "tun_id"),
+}
+MAC_FIELDS = {3, 4, 24, 25, 32, 33}
+IPV4_FIELDS = {11, 12, 22, 23}
+IPV6_FIELDS = {26, 27, 31}
+HEX_FIELDS = {2, 28, 38}
+# (dl_type, nw_proto) shorthands of ovs-ofctl, nw_proto None for the
+# ones on dl_type only
+PROTOCOLS = {
+    ("0x0800", None): "ip", ("0x0800", "1"): "icmp",
+    ("0x0800", "6"): "tcp", ("0x0800", "17"): "udp",
+    ("0x0800", "132"): "sctp", ("0x86dd", None): "ipv6",
+    ("0x86dd", "58"): "icmp6", ("0x86dd", "6"): "tcp6",
+    ("0x86dd", "17"): "udp6", ("0x86dd", "132"): "sctp6",
+    ("0x0806", None): "arp", ("0x8035", None): "rarp",
+    ("0x8847", None): "mpls", ("0x8848", None): "mplsm",
+}
+PORT_COUNTERS = (
+    "rx_packets", "tx_packets", "rx_bytes", "tx_bytes", "rx_dropped",
+    "tx_dropped", "rx_errors", "tx_errors", "rx_frame_err", "rx_over_err",
+    "rx_crc_err", "collisions",
+)
+
+
+def round_up(length):
+    return (length + 7) // 8 * 8
+
+
+def format_ip(address_class, value, mask):
+    """Format an address with its mask as a prefix length when it is one,
+    as ovs-ofctl does."""
+    text = str(address_class(value))
+    if mask is None:
+        return text
+    bits = int.from_bytes(mask, "big")
+    width = len(mask) * 8
+    if bits == (1 << width) - 1:
+        return text
+    prefix = width - (~bits & ((1 << width) - 1)).bit_length()
+    if bits == ((1 << prefix) - 1) << (width - prefix):
+        return f"{text}/{prefix}"
+    return f"{text}/{address_class(mask)}"
+
+
+def format_oxm(field, value, mask, set_field=False):
+    """Return the ovs-ofctl style (name, value) of a basic OXM field, as
+    printed in a match or, with set_field, in a set_field action."""
+    match_name, set_name = OXM_FIELDS.get(field, (f"oxm_field{field}",) * 2)
+    name = set_name if set_field else match_name
+    if field in MAC_FIELDS:
+        text = ":".join(f"{byte:02x}" for byte in value)
+        if mask:
+            text += "/" + ":".join(f"{byte:02x}" for byte in mask)
+        return name, text
+    if field in IPV4_FIELDS and len(value) == 4:
+        return name, format_ip(ipaddress.IPv4Address, value, mask)
+    if field in IPV6_FIELDS and len(value) == 16:
+        return name, format_ip(ipaddress.IPv6Address, value, mask)
+    number = int.from_bytes(value, "big")
+    mask_number = int.from_bytes(mask, "big") if mask else None
+    if field == 6 and set_field:
+        # ovs-ofctl keeps the OFPVID_PRESENT bit, e.g. 4196->vlan_vid
+        return name, str(number)
+    if field == 6:
+        if mask_number in (None, 0x1fff) and number & OFPVID_PRESENT:
+            return name, str(number & 0xfff)
+        if mask_number is None:
+            mask_number = 0x1fff
+        return "vlan_tci", f"{number:#06x}/{mask_number:#06x}"
+    if field == 5:
+        return name, f"{number:#06x}"
+    if field == 8 and not set_field:
+        # nw_tos is the DSCP in the upper six bits of the ToS byte
+        number <<= 2
+    if field in HEX_FIELDS or mask_number is not None:
+        text = f"{number:#x}"
+        if mask_number is not None:
+            text += f"/{mask_number:#x}"
+        return name, text
+    return name, str(number)
+
+
+def fold_protocol(match):
+    """Replace dl_type and nw_proto of a match by the ovs-ofctl shorthand
+    (e.g. ip, arp or tcp6) when there is one. The shorthand is the first
+    field, with a None value."""
+    dl_type = match.get("dl_type")
+    nw_proto = match.get("nw_proto")
+    if (dl_type, nw_proto) in PROTOCOLS:
+        folded = ("dl_type", "nw_proto")
+        shorthand = PROTOCOLS[(dl_type, nw_proto)]
+    elif (dl_type, None) in PROTOCOLS:
+        folded = ("dl_type",)
+        shorthand = PROTOCOLS[(dl_type, None)]
+    else:
+        return match
+    rest = {name: value for name, value in match.items() if name not in folded}
+    return {shorthand: None, **rest}
+
+
+def parse_oxms(data, set_field=False):
+    """Parse a sequence of OXM TLVs into {name: value}."""
+    fields = {}
+    offset = 0
+    while offset < len(data):
+        oxm_class, field_mask, oxm_length = struct.unpack_from("!HBB", data, offset)
+        payload = data[offset + 4:offset + 4 + oxm_length]
+        offset += 4 + oxm_length
+        field, has_mask = field_mask >> 1, field_mask & 1
+        if oxm_class != OXM_OF_BASIC:
+            fields[f"oxm_{oxm_class:#x}_{field}"] = payload.hex()
+            continue
+        value, mask = payload, None
+        if has_mask:
+            half = oxm_length // 2
+            value, mask = payload[:half], payload[half:]
+        name, text = format_oxm(field, value, mask, set_field)
+        fields[name] = text
+    return fields
+
+
+def parse_match(data):
+    """Parse an ofp_match. Returns ({field: value}, its padded length)."""
+    _, length = struct.unpack_from("!HH", data)
+    match = parse_oxms(data[4:length])
+    return fold_protocol(match), round_up(length)
+
+
+def format_port(port):
+    if port == OFPP_CONTROLLER:
+        return "CONTROLLER"
+    return str(port)
+
+
+def parse_actions(data):
+    """Return the ovs-ofctl style text of a list of actions."""
+    actions = []
+    offset = 0
+    while offset + 4 <= len(data):
+        action_type, length = struct.unpack_from("!HH", data, offset)
+        if length < 4:
+            break
+        body = data[offset + 4:offset + length]
+        if action_type == 0:
+            port, max_len = struct.unpack_from("!IH", body)
+            if port == OFPP_CONTROLLER:
+                actions.append(f"CONTROLLER:{max_len}")
+            else:
+                actions.append(f"output:{format_port(port)}")
+        elif action_type in (17, 19):
+            ethertype, = struct.unpack_from("!H", body)
+            name = "push_vlan" if action_type == 17 else "push_mpls"
+            actions.append(f"{name}:{ethertype:#06x}")
+        elif action_type == 18:
+            actions.append("pop_vlan")
+        elif action_type == 22:
+            group, = struct.unpack_from("!I", body)
+            actions.append(f"group:{group}")
+        elif action_type == 25:
+            # the OXM field is followed by padding
+            field = parse_oxms(body[:4 + body[3]], set_field=True)
+            actions.extend(f"set_field:{value}->{name}" for name, value in field.items())
+        else:
+            actions.append(f"action_type={action_type}")
+        offset += length
+    return ",".join(actions)
+
+
+def parse_instructions(data):
+    """Return the ovs-ofctl style text of a list of instructions."""
+    actions = []
+    offset = 0
+    while offset + 4 <= len(data):
+        inst_type, length = struct.unpack_from("!HH", data, offset)
+        if length < 4:
+            break
+        if inst_type == 1:
+            table_id, = struct.unpack_from("!B", data, offset + 4)
+            actions.append(f"goto_table:{table_id}")
+        elif inst_type in (3, 4):
+            apply = parse_actions(data[offset + 8:offset + length])
+            if inst_type == 3:
+                actions.append(f"write_actions({apply})")
+            elif apply:
+                actions.append(apply)
+        elif inst_type == 5:
+            actions.append("clear_actions")
+        elif inst_type == 6:
+            meter, = struct.unpack_from("!I", data, offset + 4)
+            actions.append(f"meter:{meter}")
+        else:
+            actions.append(f"instruction_type={inst_type}")
+        offset += length
+    return ",".join(actions) or "drop"
+
+
+def parse_flow_stats(data):
+    """Parse the body of flow stats replies into Flow records."""
+    flows = []
+    offset = 0
+    while offset < len(data):
+        (length, table, duration_sec, duration_nsec, priority, idle_timeout,
+         hard_timeout, _, cookie, n_packets, n_bytes) = FLOW_STATS.unpack_from(data, offset)
+        match, match_length = parse_match(data[offset + FLOW_STATS.size:offset + length])
+        instructions = data[offset + FLOW_STATS.size + match_length:offset + length]
+        actions = parse_instructions(instructions)
+        duration = duration_sec + duration_nsec / 1e9
+        counters = {"duration": duration, "n_packets": n_packets, "n_bytes": n_bytes}
+        fields = [f"priority={priority}"]
+        fields += [name if value is None else f"{name}={value}" for name, value in match.items()]
+        timeouts = "".join(
+            f" {name}={value},"
+            for name, value in (("idle_timeout", idle_timeout), ("hard_timeout", hard_timeout))
+            if value
+        )
+        text = (
+            f"cookie={cookie:#x}, duration={duration:.3f}s, table={table},"
+            f" n_packets={n_packets}, n_bytes={n_bytes},{timeouts}"
+            f" {','.join(fields)} actions={actions}"
+        )
+        flows.append(Flow(table, cookie, priority, match, actions, counters, text))
+        offset += length
+    return flows
+
+
+class OpenFlowError(Exception):
+    """Error replied by the switch."""
+
+
+class OpenFlowClient:
+    """Persistent OpenFlow 1.3 connection to a switch passive listener.
+
+    address is a unix socket path or a (host, port) tuple. The requests
+    are serialized, so a client can be shared by several threads.
+    """
+
+    def __init__(self, address, timeout=10):
+        self.address = address
+        self.timeout = timeout
+        self.sock = None
+        self.buffer = b""
+        self.xids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def connect(self):
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.address)
+        else:
+            sock = socket.create_connection(self.address, timeout=self.timeout)
+        self.sock = sock
+        self.buffer = b""
+        self.send(OFPT_HELLO, 0)
+        msg_type, _, body = self.recv()
+        if msg_type != OFPT_HELLO:
+            raise OpenFlowError(f"expected HELLO, got message type {msg_type}")
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def send(self, msg_type, xid, body=b""):
+        self.sock.sendall(HEADER.pack(OFP_VERSION, msg_type, HEADER.size + len(body), xid) + body)
+
+    def recv(self):
+        """Return the (type, xid, body) of the next message, answering the
+        echo requests."""
+        while True:
+            while len(self.buffer) < HEADER.size or \
+                    len(self.buffer) < HEADER.unpack_from(self.buffer)[2]:
+                data = self.sock.recv(65536)
+                if not data:
+                    raise ConnectionError(f"connection to {self.address} closed")
+                self.buffer += data
+            _, msg_type, length, xid = HEADER.unpack_from(self.buffer)
+            body = self.buffer[HEADER.size:length]
+            self.buffer = self.buffer[length:]
+            if msg_type == OFPT_ECHO_REQUEST:
+                self.send(OFPT_ECHO_REPLY, xid, body)
+                continue
+            return msg_type, xid, body
+
+    def transaction(self, msg_type, body, reply_type, barrier=False):
+        """Send a request and return the bodies of its replies (several for
+        the multipart ones). With barrier, the request is followed by a
+        barrier and the barrier reply is waited for instead. Reconnects
+        once if the connection was lost."""
+        with self.lock:
+            for attempt in (1, 2):
+                try:
+                    if self.sock is None:
+                        self.connect()
+                    return self._transaction(msg_type, body, reply_type, barrier)
+                except (OSError, ConnectionError):
+                    self.close()
+                    if attempt == 2:
+                        raise
+
+    def _transaction(self, msg_type, body, reply_type, barrier=False):
+        xid = next(self.xids)
+        self.send(msg_type, xid, body)
+        request_xid = xid
+        if barrier:
+            xid = next(self.xids)
+            self.send(OFPT_BARRIER_REQUEST, xid)
+            reply_type = OFPT_BARRIER_REPLY
+        replies = []
+        while True:
+            reply, reply_xid, reply_body = self.recv()
+            if reply_xid not in (xid, request_xid):
+                continue
+            if reply == OFPT_ERROR:
+                err_type, err_code = struct.unpack_from("!HH", reply_body)
+                raise OpenFlowError(
+                    f"{self.address}: error type {err_type} code {err_code}"
+                )
+            if reply != reply_type:
+                continue
+            if reply != OFPT_MULTIPART_REPLY:
+                return [reply_body]
+            _, flags = MULTIPART.unpack_from(reply_body)
+            replies.append(reply_body[MULTIPART.size:])
+            if not flags & OFPMPF_REPLY_MORE:
+                return replies
+
+    def multipart(self, mp_type, body=b""):
+        replies = self.transaction(
+            OFPT_MULTIPART_REQUEST, MULTIPART.pack(mp_type, 0) + body,
+            OFPT_MULTIPART_REPLY,
+        )
+        return b"".join(replies)
+
+    def barrier(self):
+        """Return once the switch processed all the previous messages."""
+        self.transaction(OFPT_BARRIER_REQUEST, b"", OFPT_BARRIER_REPLY)
+
+    def delete_flows(self, table=OFPTT_ALL, cookie=0, cookie_mask=0):
+        """Delete the flows (all of them by default) and return once the
+        switch confirmed it, with the reply to the following barrier."""
+        body = FLOW_MOD.pack(
+            cookie, cookie_mask, table, OFPFC_DELETE, 0, 0, 0, OFP_NO_BUFFER,
+            OFPP_ANY, OFPG_ANY, 0,
+        ) + EMPTY_MATCH
+        self.transaction(OFPT_FLOW_MOD, body, OFPT_BARRIER_REPLY, barrier=True)
+
+    def flow_stats(self, table=OFPTT_ALL, cookie=0, cookie_mask=0):
+        """Return the flows (as Flow records)."""
+        body = FLOW_STATS_REQUEST.pack(
+            table, OFPP_ANY, OFPG_ANY, cookie, cookie_mask
+        ) + EMPTY_MATCH
+        return parse_flow_stats(self.multipart(OFPMP_FLOW, body))
+
+    def port_stats(self, port=OFPP_ANY):
+        """Return {port number: {counter: value}}."""
+        data = self.multipart(OFPMP_PORT_STATS, struct.pack("!I4x", port))
+        ports = {}
+        for offset in range(0, len(data), PORT_STATS.size):
+            port_no, *counters, duration_sec, duration_nsec = \
+                PORT_STATS.unpack_from(data, offset)
+            ports[port_no] = dict(zip(PORT_COUNTERS, counters))
+            ports[port_no]["duration"] = duration_sec + duration_nsec / 1e9
+        return ports
+
+    def table_stats(self):
+        """Return {table id: {active_count, lookup_count, matched_count}},
+        for the tables with flows or lookups."""
+        data = self.multipart(OFPMP_TABLE)
+        tables = {}
+        for offset in range(0, len(data), TABLE_STATS.size):
+            table_id, active, lookup, matched = TABLE_STATS.unpack_from(data, offset)
+            if active or lookup:
+                tables[table_id] = {
+                    "active_count": active,
+                    "lookup_count": lookup,
+                    "matched_count": matched,
+                }
+        return tables
@@ -0,0 +1,185 @@
+"""Follow the OpenFlow connection of the OvS bridges through OVSDB.
+
+OvsdbMonitor keeps one JSON-RPC session with ovsdb-server monitoring the
+Bridge controllers and the Controller is_connected column. Waiters are
+woken up as soon as the bridges connect, and the connect/disconnect
+times of each bridge are kept to measure the reconnection latency.
+"""
+import itertools
+import json
+import os
+import socket
+import threading
+import time
+
+OVSDB_SOCK = os.environ.get("OVSDB_SOCK", "/var/run/openvswitch/db.sock")
+
+
+def ovsdb_uuids(value):
+    """Return the UUIDs of an OVSDB JSON value (a uuid or a set of them)."""
+    kind, data = value
+    if kind == "uuid":
+        return [data]
+    return [uuid for _, uuid in data]
+
+
+class OvsdbMonitor:
+    """Monitor the Bridge and Controller tables of the Open_vSwitch db."""
+
+    def __init__(self, path=OVSDB_SOCK):
+        self.path = path
+        self.sock = None
+        self.thread = None
+        self.cond = threading.Condition()
+        self.send_lock = threading.Lock()
+        self.echo_ids = itertools.count(1)
+        self.echo_replied = 0
+        self.bridges = {}      # bridge uuid -> (name, controller uuids)
+        self.controllers = {}  # controller uuid -> is_connected
+        self.connected = {}    # bridge name -> connected to any controller
+        self.connected_at = {}
+        self.disconnected_at = {}
+        self.reconnections = []
+        self.ready = False
+        self.error = None
+
+    def start(self):
+        """Connect to ovsdb-server and start following the updates."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+        self.send({
+            "method": "monitor",
+            "params": [
+                "Open_vSwitch", None, {
+                    "Bridge": {"columns": ["name", "controller"]},
+                    "Controller": {"columns": ["is_connected"]},
+                },
+            ],
+            "id": 0,
+        })
+        self.thread = threading.Thread(
+            target=self.run, name="ovsdb-monitor", daemon=True
+        )
+        self.thread.start()
+        with self.cond:
+            self.cond.wait_for(lambda: self.ready or self.error, timeout=5)
+        if self.error:
+            raise self.error
+        if not self.ready:
+            raise TimeoutError(f"no reply from ovsdb-server at {self.path}")
+
+    def stop(self):
+        if self.sock is not None:
+            # wake up the thread blocked in recv, close alone doesn't
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.sock.close()
+            self.sock = None
+
+    def send(self, message):
+        with self.send_lock:
+            self.sock.sendall(json.dumps(message).encode())
+
+    def sync(self, timeout=5):
+        """Make sure the updates of the transactions already committed were
+        received: ovsdb-server replies to the echo after sending them."""
+        echo_id = next(self.echo_ids)
+        self.send({"method": "echo", "params": [], "id": f"sync-{echo_id}"})
+        with self.cond:
+            self.cond.wait_for(
+                lambda: self.error or self.echo_replied >= echo_id, timeout=timeout
+            )
+
+    def run(self):
+        decoder = json.JSONDecoder()
+        buffer = ""
+        try:
+            while True:
+                data = self.sock.recv(65536)
+                if not data:
+                    raise ConnectionError("ovsdb-server closed the connection")
+                buffer += data.decode()
+                while buffer:
+                    try:
+                        message, end = decoder.raw_decode(buffer)
+                    except ValueError:
+                        break
+                    buffer = buffer[end:].lstrip()
+                    self.handle(message)
+        except Exception as exc:
+            with self.cond:
+                self.error = exc
+                self.cond.notify_all()
+
+    def handle(self, message):
+        if message.get("method") == "echo":
+            self.send({"result": message["params"], "error": None, "id": message["id"]})
+        elif message.get("method") == "update":
+            self.update(message["params"][1])
+        elif str(message.get("id")).startswith("sync-"):
+            with self.cond:
+                self.echo_replied = int(message["id"][len("sync-"):])
+                self.cond.notify_all()
+        elif message.get("id") == 0:
+            if message.get("error"):
+                raise Exception(f"OVSDB monitor failed: {message['error']}")
+            self.update(message["result"])
+            with self.cond:
+                self.ready = True
+                self.cond.notify_all()
+
+    def update(self, table_updates):
+        now = time.monotonic()
+        with self.cond:
+            for uuid, row in table_updates.get("Controller", {}).items():
+                if "new" in row:
+                    self.controllers[uuid] = row["new"].get("is_connected", False)
+                else:
+                    self.controllers.pop(uuid, None)
+            for uuid, row in table_updates.get("Bridge", {}).items():
+                if "new" in row:
+                    new = row["new"]
+                    self.bridges[uuid] = (new["name"], ovsdb_uuids(new["controller"]))
+                else:
+                    self.bridges.pop(uuid, None)
+            connected = {
+                name: any(self.controllers.get(uuid) for uuid in uuids)
+                for name, uuids in self.bridges.values()
+            }
+            for name, is_connected in connected.items():
+                if is_connected == self.connected.get(name):
+                    continue
+                if is_connected:
+                    self.connected_at[name] = now
+                    if name in self.disconnected_at:
+                        self.reconnections.append(
+                            (name, now - self.disconnected_at[name])
+                        )
+                elif name in self.connected:
+                    self.disconnected_at[name] = now
+            self.connected = connected
+            self.cond.notify_all()
+
+    def wait_connected(self, names, timeout):
+        """Wait until all the bridges are connected. Return False on timeout."""
+        self.sync()
+        with self.cond:
+            ready = self.cond.wait_for(
+                lambda: self.error or all(self.connected.get(n) for n in names),
+                timeout=timeout,
+            )
+            if self.error:
+                raise self.error
+            return bool(ready)
+
+    def status(self, names):
+        with self.cond:
+            return [(name, self.connected.get(name, False)) for name in names]
+
+    def pop_reconnections(self):
+        """Return and clear the (bridge, seconds disconnected) measured."""
+        with self.cond:
+            reconnections, self.reconnections = self.reconnections, []
+            return reconnections
@@ -0,0 +1,102 @@
+"""Timestamped UDP probes to measure the dataplane outage of EVCs.
+
+Run inside the Mininet hosts (with ``host.popen``) by the failover
+benchmark:
+
+    python3 probe.py recv --port 5005 --interval 0.01
+    python3 probe.py send --port 5005 --interval 0.01 10.0.0.2 10.0.1.2
+
+Every interval the sender sends each destination a probe with the
+destination index, a sequence number and the send time. The receiver
+runs until SIGTERM and then prints a JSON document with, for each index,
+the probes received, the highest sequence number, the first and last
+arrival times, the largest one-way delay and the gaps between
+consecutive probes longer than ``--gap`` intervals. The hosts share the
+clock of the machine, so these times can be compared with the time of a
+link failure. Only the standard library is used.
+"""
+import argparse
+import json
+import signal
+import socket
+import struct
+import sys
+import time
+
+PROBE = struct.Struct("!IId")  # destination index, sequence number, send time
+
+
+def stop(signum, frame):
+    raise SystemExit(0)
+
+
+def send(args):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    seq = 0
+    next_send = time.monotonic()
+    while True:
+        now = time.time()
+        for index, destination in enumerate(args.destinations):
+            try:
+                sock.sendto(PROBE.pack(index, seq, now), (destination, args.port))
+            except OSError:
+                # e.g. ENOBUFS while the path is down, the probe is lost
+                pass
+        seq += 1
+        next_send += args.interval
+        time.sleep(max(next_send - time.monotonic(), 0))
+
+
+def receive(args):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    sock.bind(("", args.port))
+    sock.settimeout(0.2)
+    threshold = args.gap * args.interval
+    probes = {}
+    try:
+        while True:
+            try:
+                data = sock.recv(PROBE.size)
+            except socket.timeout:
+                continue
+            now = time.time()
+            index, seq, sent = PROBE.unpack(data)
+            stats = probes.get(index)
+            if stats is None:
+                stats = probes[index] = {
+                    "received": 0, "max_seq": seq, "first": now, "last": now,
+                    "max_delay": 0.0, "gaps": [],
+                }
+            elif now - stats["last"] > threshold:
+                stats["gaps"].append((stats["last"], now))
+            stats["received"] += 1
+            stats["max_seq"] = max(stats["max_seq"], seq)
+            stats["last"] = now
+            stats["max_delay"] = max(stats["max_delay"], now - sent)
+    finally:
+        json.dump({"stopped": time.time(), "probes": probes}, sys.stdout)
+        sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mode", choices=("send", "recv"))
+    parser.add_argument("destinations", nargs="*")
+    parser.add_argument("--port", type=int, default=5005)
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--gap", type=float, default=3,
+                        help="gaps longer than this many intervals are reported")
+    args = parser.parse_intermixed_args()
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        if args.mode == "send":
+            send(args)
+        else:
+            receive(args)
+    except (SystemExit, KeyboardInterrupt):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Reorder the collected tests to reduce network rebuilds.
+
+Each test class declares the topology it runs on (``topo_name``) and
+whether the next class needs a new network because it changes the links
+or interfaces (``rebuild_network``, which it also passes to
+network_pool.release). Classes are grouped by topology, keeping the
+order in which each topology was first collected, and the classes
+forcing a rebuild run last in their group. The tests of a class are
+never split nor reordered, since some of them depend on each other.
+"""
+from collections import OrderedDict
+
+DEFAULT_TOPOLOGY = "ring"
+
+
+def requirements(item):
+    """Return the (topology, rebuild_network) of the class of a test."""
+    cls = getattr(item, "cls", None)
+    return (
+        getattr(cls, "topo_name", DEFAULT_TOPOLOGY),
+        bool(getattr(cls, "rebuild_network", False)),
+    )
+
+
+def count_rebuilds(reqs):
+    """Number of networks built after the first one: a class needs a new
+    network when its topology differs from the one of the previous class,
+    or when the previous class forces a rebuild."""
+    return sum(
+        1 for (prev_topo, prev_rebuild), (topo, _) in zip(reqs, reqs[1:])
+        if prev_rebuild or prev_topo != topo
+    )
+
+
+def group_by_class(items):
+    """Group the items by class, keeping the collection order."""
+    groups = OrderedDict()
+    for item in items:
+        cls = getattr(item, "cls", None)
+        key = (item.module.__name__, cls.__name__) if cls else item.nodeid
+        groups.setdefault(key, []).append(item)
+    return list(groups.values())
+
+
+def schedule(items):
+    """Return the reordered items and how many network rebuilds it takes
+    before and after reordering."""
+    groups = group_by_class(items)
+    reqs = [requirements(group[0]) for group in groups]
+
+    first_topo = {}
+    for index, (topo_name, _) in enumerate(reqs):
+        first_topo.setdefault(topo_name, index)
+    order = sorted(
+        range(len(groups)),
+        key=lambda i: (first_topo[reqs[i][0]], reqs[i][1], i),
+    )
+
+    stats = {
+        "rebuilds_before": count_rebuilds(reqs),
+        "rebuilds_after": count_rebuilds([reqs[i] for i in order]),
+    }
+    return [item for i in order for item in groups[i]], stats
@@ -0,0 +1,139 @@
+"""Topology discovery convergence benchmark.
+
+For ring, grid and fat-tree topologies of about BENCH_SWITCHES switches
+(10, 50 and 100 by default, from 10 to 500), measures the time from the
+start of kytosd, with a clean database, until /topology/v3/links has
+every expected link (the ids of create_link_id) UP, BENCH_TRIALS times
+each. The result of each kind of topology is a scaling curve of the
+discovery time against the number of switches and links, with its
+log-log slope to catch super-linear regressions in topology/of_lldp.
+
+The discovery time depends on the LINK_UP_TIMER of topology and the
+LLDP polling settings of of_lldp (patched by kytos-init.sh), so they
+are saved with the result.
+"""
+import math
+import os
+import re
+import time
+
+import pytest
+
+from tests.benchmark import (
+    BenchmarkResult, bench_param, distribution, scaling_exponent,
+)
+from tests.helpers import BASE_ENV, kytos_api, network_pool
+
+CONTROLLER = '127.0.0.1'
+NAPPS_DIR = os.path.join(
+    os.environ.get("NAPPS_PATH") or BASE_ENV, "var/lib/kytos/napps"
+)
+DISCOVERY_SETTINGS = {
+    "kytos/topology": ["LINK_UP_TIMER"],
+    "kytos/of_lldp": ["POLLING_TIME", "LIVENESS_DEAD_MULTIPLIER"],
+}
+
+
+def napp_setting(napp, name):
+    """Return the value of a NApp setting as written in its settings.py,
+    or None if it can't be read."""
+    try:
+        with open(os.path.join(NAPPS_DIR, napp, "settings.py")) as f:
+            text = f.read()
+    except OSError:
+        return None
+    match = re.search(rf"^{name}\s*=\s*(.+?)\s*$", text, re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def scaled_topo_name(kind, switches):
+    """Name of the generated topology of kind with about that many
+    switches (see tests.helpers.make_topo)."""
+    if kind == "grid":
+        rows = max(math.isqrt(switches), 1)
+        return f"grid:{rows}x{math.ceil(switches / rows)}"
+    if kind == "fattree":
+        # 5k^2/4 switches, with k even
+        return f"fattree:{2 * max(math.ceil(math.sqrt(switches * 4 / 5) / 2), 1)}"
+    return f"ring_n:{max(switches, 3)}"
+
+
+@pytest.mark.benchmark
+class TestBenchTopologyDiscovery:
+
+    @staticmethod
+    def discover(net, timeout):
+        """Start kytosd with a clean database and return the seconds until
+        it was running, the switches connected and all the links UP."""
+        net.stop_kytosd()
+        net.drop_database()
+        for sw in net.net.switches:
+            sw.dpctl('del-flows')
+        begin = time.monotonic()
+        net.start_controller(enable_all=True)
+        started = time.monotonic() - begin
+        net.wait_switches_connect(timeout=timeout)
+        connected = time.monotonic() - begin
+        net.wait_kytos_links(status="UP", timeout=timeout)
+        return {
+            "controller_start": started,
+            "switches_connected": connected,
+            "links_up": time.monotonic() - begin,
+        }
+
+    @pytest.mark.parametrize("kind", ["ring_n", "grid", "fattree"])
+    def test_discovery_scaling(self, kind):
+        sizes = bench_param("switches", [10, 50, 100])
+        trials = bench_param("trials", 3)
+        timeout = bench_param("timeout", 600)
+        settings = {
+            f"{napp}.{name}": napp_setting(napp, name)
+            for napp, names in DISCOVERY_SETTINGS.items() for name in names
+        }
+
+        points = []
+        failure = None
+        for size in sizes:
+            topo_name = scaled_topo_name(kind, size)
+            net = network_pool.acquire(CONTROLLER, topo_name=topo_name)
+            point = {
+                "topology": topo_name,
+                "switches": len(net.net.switches),
+                "links": len(net.link_index.entries),
+            }
+            try:
+                runs = [self.discover(net, timeout) for _ in range(trials)]
+                settings["polling_time"] = kytos_api.get_lldp_polling_time()
+            except Exception as exc:
+                failure = f"{topo_name}: {exc}"
+                runs = []
+            finally:
+                network_pool.release(net)
+            points.append({
+                **point,
+                **{
+                    phase: distribution(run[phase] for run in runs)
+                    for phase in ("controller_start", "switches_connected", "links_up")
+                },
+            })
+            if failure:
+                # the larger topologies would time out too
+                break
+
+        result = BenchmarkResult(
+            "topology_discovery", kind=kind, switches=sizes, trials=trials,
+            timeout=timeout, settings=settings,
+        )
+        result.add(
+            points=points,
+            links_exponent=scaling_exponent(
+                (point["links"], point["links_up"].get("p50")) for point in points
+            ),
+            switches_exponent=scaling_exponent(
+                (point["switches"], point["links_up"].get("p50")) for point in points
+            ),
+            failure=failure,
+        )
+        path = result.save()
+        print(f"benchmark result written to {path}: {result.metrics}")
+        assert failure is None, failure
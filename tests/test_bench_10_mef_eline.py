@@ -0,0 +1,136 @@
+"""EVC provisioning throughput and time to active benchmark.
+
+Creates BENCH_EVCS EVCs (100 by default, from 100 to 10,000) on the
+amlight topology with at most BENCH_CONCURRENCY (32) requests in flight,
+and follows each one from its POST until it is active and until its
+flows are installed on every switch of its path. The UNIs are disjoint
+pairs of host ports on different switches, each EVC with its own VLAN.
+Past about 4,000 EVCs over the same NNI, mef_eline runs out of S-VLANs
+and the creations fail, which shows up in the error rates.
+"""
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+
+from tests.benchmark import (
+    BenchmarkResult, bench_param, distribution, evc_payloads, histogram,
+)
+from tests.helpers import (
+    AsyncKytosClient, colon_dpid, kytos_api, network_pool, uni_pairs,
+)
+
+CONTROLLER = '127.0.0.1'
+MEF_ELINE_COOKIE_PREFIX = 0xaa
+
+
+def evc_switches(evc, dpid_names):
+    """Names of the switches of the EVC UNIs and current path."""
+    dpids = {
+        evc["uni_a"]["interface_id"].rsplit(":", 1)[0],
+        evc["uni_z"]["interface_id"].rsplit(":", 1)[0],
+    }
+    for link in evc.get("current_path", []):
+        dpids.add(link["endpoint_a"]["switch"])
+        dpids.add(link["endpoint_b"]["switch"])
+    return [dpid_names[dpid] for dpid in dpids if dpid in dpid_names]
+
+
+@pytest.mark.benchmark
+class TestBenchEvcProvisioning:
+    net = None
+    topo_name = "amlight"
+
+    @classmethod
+    def setup_class(cls):
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
+
+    @classmethod
+    def teardown_class(cls):
+        network_pool.release(cls.net)
+
+    def setup_method(self, method):
+        self.net.restart_kytos_clean()
+        self.net.wait_kytos_converged()
+
+    async def test_evc_provisioning(self):
+        count = bench_param("evcs", 100)
+        concurrency = bench_param("concurrency", 32)
+        timeout = bench_param("timeout", 600)
+        interval = bench_param("poll_interval", 0.5)
+        payloads = evc_payloads(uni_pairs(self.net.net), count)
+        dpid_names = {colon_dpid(sw.dpid): sw.name for sw in self.net.net.switches}
+
+        errors = Counter()
+        post_latency = []
+        posted_at = {}
+
+        async with AsyncKytosClient(concurrency=concurrency) as api:
+            async def create(payload):
+                begin = time.monotonic()
+                try:
+                    # no retries, a retried POST could create the EVC twice
+                    response = await api.request(
+                        "POST", "kytos/mef_eline/v2/evc/", retries=0, json=payload
+                    )
+                except Exception as exc:
+                    errors[type(exc).__name__] += 1
+                    return
+                post_latency.append(time.monotonic() - begin)
+                if response.status_code != 201:
+                    errors[str(response.status_code)] += 1
+                    return
+                posted_at[response.json()["circuit_id"]] = begin
+
+            start = time.monotonic()
+            await api.map(create, payloads)
+            accepted = time.monotonic()
+
+        # follow all the EVCs with one listing and one dump of each switch
+        # per round, so the resolution of the times is about interval
+        active_at = {}
+        flows_at = {}
+        switches = {}
+        deadline = accepted + timeout
+        while len(flows_at) < len(posted_at) and time.monotonic() < deadline:
+            evcs = kytos_api.list_evcs()
+            now = time.monotonic()
+            for evc_id in posted_at.keys() - active_at.keys():
+                evc = evcs.get(evc_id)
+                if evc and evc["active"]:
+                    active_at[evc_id] = now
+                    switches[evc_id] = evc_switches(evc, dpid_names)
+            waiting = active_at.keys() - flows_at.keys()
+            if waiting:
+                tables = self.net.dump_all_flows()
+                now = time.monotonic()
+                for evc_id in waiting:
+                    cookie = MEF_ELINE_COOKIE_PREFIX << 56 | int(evc_id, 16)
+                    if all(tables[name].find(cookie=cookie) for name in switches[evc_id]):
+                        flows_at[evc_id] = now
+            await asyncio.sleep(interval)
+
+        time_to_active = [active_at[e] - posted_at[e] for e in active_at]
+        time_to_flows = [flows_at[e] - posted_at[e] for e in flows_at]
+        last = max(flows_at.values(), default=accepted)
+        result = BenchmarkResult(
+            "mef_eline_provisioning", evcs=count, concurrency=concurrency,
+            timeout=timeout, poll_interval=interval, topology=self.topo_name,
+        )
+        result.add(
+            created=len(posted_at),
+            active=len(active_at),
+            flows_installed=len(flows_at),
+            create_rate=len(posted_at) / (accepted - start),
+            provisioning_rate=len(flows_at) / (last - start),
+            errors=dict(errors),
+            error_rate=sum(errors.values()) / count,
+            post_latency=distribution(post_latency),
+            time_to_active=distribution(time_to_active),
+            time_to_active_histogram=histogram(time_to_active),
+            time_to_flows=distribution(time_to_flows),
+        )
+        path = result.save()
+        print(f"benchmark result written to {path}: {result.metrics}")
+        assert posted_at, f"no EVC created: {dict(errors)}"
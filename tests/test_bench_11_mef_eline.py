@@ -0,0 +1,305 @@
+"""EVC failover convergence benchmark.
+
+Creates BENCH_EVCS EVCs (20 by default) between h11 (s1) and h2 (s2) on
+the ring topology and, for BENCH_TRIALS trials, keeps timestamped probes
+(tests/probe.py) running from h11 to h2 over every EVC while the link of
+their current path goes down. For each EVC moved by the failure, it
+measures the dataplane outage (the gap in the probes received by h2) and
+the control plane reroute time (from the link failure until the API
+shows the new current_path).
+
+It runs in two modes: "failover_path", with EVCs whose failover_path is
+already installed and only has to be promoted, and "dynamic", with EVCs
+with an explicit primary path (so without failover_path), which have to
+compute and install a new path when the link goes down.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from tests.benchmark import BenchmarkResult, bench_param, distribution
+from tests.helpers import (
+    WaitTimeout, colon_dpid, kytos_api, network_pool, wait_until,
+)
+
+CONTROLLER = '127.0.0.1'
+PROBE_SCRIPT = os.path.join(os.path.dirname(__file__), "probe.py")
+PROBE_PORT = 5005
+FIRST_VLAN = 100
+
+# ring topology: h11 is on s1:1, h2 on s2:1 and the s1-s2 link is s1:3-s2:2
+UNI_A = "00:00:00:00:00:00:00:01:1"
+UNI_Z = "00:00:00:00:00:00:00:02:1"
+PRIMARY_PATH = [
+    {"endpoint_a": {"id": "00:00:00:00:00:00:00:01:3"},
+     "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}},
+]
+
+
+def evc_payload(index, mode):
+    vlan = FIRST_VLAN + index
+    payload = {
+        "name": f"bench_failover_{index}",
+        "enabled": True,
+        "dynamic_backup_path": True,
+        "uni_a": {"interface_id": UNI_A, "tag": {"tag_type": "vlan", "value": vlan}},
+        "uni_z": {"interface_id": UNI_Z, "tag": {"tag_type": "vlan", "value": vlan}},
+    }
+    if mode == "dynamic":
+        # EVCs with an explicit path don't get a failover_path
+        payload["primary_path"] = PRIMARY_PATH
+    return payload
+
+
+def probe_addresses(index):
+    """Addresses of the h11 and h2 VLAN interfaces of the EVC index."""
+    prefix = f"10.{index >> 8}.{index & 255}"
+    return f"{prefix}.1", f"{prefix}.2"
+
+
+def run_ip_batch(host, commands):
+    proc = host.popen(
+        ["ip", "-force", "-batch", "-"], stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    output, _ = proc.communicate("\n".join(commands) + "\n")
+    assert proc.returncode == 0, f"ip -batch failed on {host.name}: {output}"
+
+
+def uses_primary_path(evc):
+    endpoints = {
+        link[side]["id"] for link in evc["current_path"]
+        for side in ("endpoint_a", "endpoint_b")
+    }
+    primary = {
+        link[side]["id"] for link in PRIMARY_PATH
+        for side in ("endpoint_a", "endpoint_b")
+    }
+    return len(evc["current_path"]) == len(PRIMARY_PATH) and endpoints == primary
+
+
+def outage(probes, failed_at, interval):
+    """Return the seconds without probes after failed_at (None if the
+    probes never came back) and the probes lost."""
+    if probes is None:
+        return None, None
+    lost = probes["max_seq"] + 1 - probes["received"]
+    if probes["last"] < failed_at or probes["stopped"] - probes["last"] > 3 * interval:
+        return None, lost
+    seconds = sum(
+        end - start - interval for start, end in probes["gaps"]
+        if end >= failed_at
+    )
+    return seconds, lost
+
+
+@pytest.mark.benchmark
+class TestBenchEvcFailover:
+    net = None
+    topo_name = "ring"
+
+    @classmethod
+    def setup_class(cls):
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
+
+    @classmethod
+    def teardown_class(cls):
+        network_pool.release(cls.net)
+
+    def setup_method(self, method):
+        self.net.config_all_links_up()
+        self.net.restart_kytos_clean()
+        self.net.wait_kytos_converged()
+
+    def wait_ready(self, evc_ids, mode, timeout):
+        """Wait until the EVCs are active and, in failover_path mode, have
+        a failover_path, or in dynamic mode are back on the primary path."""
+        def condition():
+            evcs = kytos_api.list_evcs()
+            for evc_id in evc_ids:
+                evc = evcs[evc_id]
+                assert evc["active"], f"EVC {evc_id} not active"
+                if mode == "failover_path":
+                    assert evc["failover_path"], f"EVC {evc_id} has no failover_path"
+                else:
+                    assert uses_primary_path(evc), f"EVC {evc_id} not on primary path"
+            return evcs
+        return wait_until(
+            condition, timeout=timeout, interval=0.2, max_interval=1,
+            description=f"{len(evc_ids)} EVCs ready for failover",
+        )
+
+    def wait_reroute(self, old_paths, timeout):
+        """Poll the EVCs until they are active on a new current_path and
+        return {evc_id: time.time() when it was seen}."""
+        rerouted = {}
+        deadline = time.monotonic() + timeout
+        while len(rerouted) < len(old_paths) and time.monotonic() < deadline:
+            evcs = kytos_api.list_evcs()
+            now = time.time()
+            for evc_id, old_path in old_paths.items():
+                evc = evcs[evc_id]
+                if evc_id not in rerouted and evc["active"] \
+                        and evc["current_path"] and evc["current_path"] != old_path:
+                    rerouted[evc_id] = now
+            time.sleep(0.05)
+        return rerouted
+
+    def setup_probe_interfaces(self, count):
+        """Create a VLAN interface per EVC on h11 and h2, with static
+        neighbors so no ARP is needed during the failures."""
+        h11, h2 = self.net.net.get("h11", "h2")
+        for host, peer, side in ((h11, h2, 0), (h2, h11, 1)):
+            intf = host.intfNames()[0]
+            peer_mac = peer.MAC()
+            commands = []
+            for index in range(count):
+                vlan = FIRST_VLAN + index
+                addresses = probe_addresses(index)
+                commands += [
+                    f"link add link {intf} name vlan{vlan} type vlan id {vlan}",
+                    f"link set vlan{vlan} up",
+                    f"addr add {addresses[side]}/24 dev vlan{vlan}",
+                    f"neigh replace {addresses[1 - side]} lladdr {peer_mac}"
+                    f" dev vlan{vlan} nud permanent",
+                ]
+            run_ip_batch(host, commands)
+
+    def cleanup_probe_interfaces(self, count):
+        for host in self.net.net.get("h11", "h2"):
+            run_ip_batch(host, [
+                f"link del vlan{FIRST_VLAN + index}" for index in range(count)
+            ])
+
+    def start_probes(self, count, interval):
+        h11, h2 = self.net.net.get("h11", "h2")
+        options = ["--port", str(PROBE_PORT), "--interval", str(interval)]
+        receiver = h2.popen(
+            [sys.executable, PROBE_SCRIPT, "recv", *options],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        time.sleep(0.2)
+        sender = h11.popen(
+            [sys.executable, PROBE_SCRIPT, "send", *options,
+             *(probe_addresses(index)[1] for index in range(count))],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+        return sender, receiver
+
+    @staticmethod
+    def stop_probes(sender, receiver):
+        """Stop the probes and return {EVC index: receiver stats}."""
+        sender.terminate()
+        sender.communicate(timeout=10)
+        receiver.terminate()
+        output, errors = receiver.communicate(timeout=10)
+        assert output, f"no output from the probe receiver: {errors}"
+        result = json.loads(output)
+        probes = {int(index): stats for index, stats in result["probes"].items()}
+        for stats in probes.values():
+            stats["stopped"] = result["stopped"]
+        return probes
+
+    def failure_link(self, path):
+        """The (a, b, port1, port2) of the first link of a current_path."""
+        dpid_names = {
+            colon_dpid(sw.dpid): sw.name
+            for sw in self.net.net.switches
+        }
+        link = path[0]
+        endpoint_a, endpoint_b = link["endpoint_a"], link["endpoint_b"]
+        return (
+            dpid_names[endpoint_a["switch"]], dpid_names[endpoint_b["switch"]],
+            endpoint_a["port_number"], endpoint_b["port_number"],
+        )
+
+    @pytest.mark.parametrize("mode", ["failover_path", "dynamic"])
+    def test_failover_convergence(self, mode):
+        count = bench_param("evcs", 20)
+        trials = bench_param("trials", 5)
+        interval = bench_param("probe_interval", 0.01)
+        warmup = bench_param("warmup", 2.0)
+        settle = bench_param("settle", 2.0)
+        timeout = bench_param("timeout", 60)
+
+        evc_ids = [
+            kytos_api.create_evc(evc_payload(index, mode))["circuit_id"]
+            for index in range(count)
+        ]
+        evc_index = {evc_id: index for index, evc_id in enumerate(evc_ids)}
+        self.setup_probe_interfaces(count)
+
+        outages = []
+        reroutes = []
+        lost_probes = []
+        per_trial = []
+        try:
+            for trial in range(trials):
+                evcs = self.wait_ready(evc_ids, mode, timeout)
+                link = self.failure_link(evcs[evc_ids[0]]["current_path"])
+                link_id = evcs[evc_ids[0]]["current_path"][0]["id"]
+                old_paths = {
+                    evc_id: evcs[evc_id]["current_path"] for evc_id in evc_ids
+                    if any(hop["id"] == link_id for hop in evcs[evc_id]["current_path"])
+                }
+
+                sender, receiver = self.start_probes(count, interval)
+                try:
+                    time.sleep(warmup)
+                    failed_at = self.net.set_links_status([link], "down")
+                    rerouted = self.wait_reroute(old_paths, timeout)
+                    time.sleep(settle)
+                finally:
+                    probes = self.stop_probes(sender, receiver)
+                self.net.set_links_status([link], "up")
+
+                trial_outages = []
+                trial_reroutes = []
+                unrecovered = 0
+                for evc_id in old_paths:
+                    seconds, lost = outage(
+                        probes.get(evc_index[evc_id]), failed_at, interval
+                    )
+                    if seconds is None:
+                        unrecovered += 1
+                    trial_outages.append(seconds)
+                    lost_probes.append(lost)
+                    if evc_id in rerouted:
+                        trial_reroutes.append(rerouted[evc_id] - failed_at)
+                outages += trial_outages
+                reroutes += trial_reroutes
+                per_trial.append({
+                    "link": link_id,
+                    "affected": len(old_paths),
+                    "rerouted": len(rerouted),
+                    "unrecovered": unrecovered,
+                    "outage": distribution(trial_outages),
+                    "reroute": distribution(trial_reroutes),
+                })
+                try:
+                    self.net.wait_kytos_links(status="UP", timeout=timeout)
+                except WaitTimeout as exc:
+                    pytest.fail(f"trial {trial}: links not back UP: {exc}")
+        finally:
+            self.cleanup_probe_interfaces(count)
+
+        result = BenchmarkResult(
+            "mef_eline_failover", mode=mode, evcs=count, trials=trials,
+            probe_interval=interval, warmup=warmup, settle=settle,
+            topology=self.topo_name,
+        )
+        result.add(
+            outage=distribution(outages),
+            reroute=distribution(reroutes),
+            lost_probes=distribution(lost_probes),
+            unrecovered=sum(trial["unrecovered"] for trial in per_trial),
+            not_rerouted=sum(t["affected"] - t["rerouted"] for t in per_trial),
+            trials=per_trial,
+        )
+        path = result.save()
+        print(f"benchmark result written to {path}: {result.metrics}")
+        assert reroutes, f"no EVC rerouted: {per_trial}"
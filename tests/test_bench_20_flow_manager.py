@@ -0,0 +1,198 @@
+"""flow_manager bulk install and delete throughput benchmark.
+
+Installs BENCH_FLOWS flows (1,000 by default, e.g. BENCH_FLOWS=1000,10000,
+100000 for one run per size) spread across the switches of the amlight
+topology and BENCH_TABLES tables, in batches of BENCH_BATCH flows with
+at most BENCH_CONCURRENCY requests in flight. The "switch" mode posts
+each batch to /flow_manager/v2/flows/{dpid} of one switch, the "all"
+mode posts it to /flow_manager/v2/flows, which installs it on every
+switch.
+
+For the installation it measures the API acceptance rate, the time
+until stored_flows?state=installed has every flow and the time until
+the dump of each switch has them. The flows are then deleted with a
+single cookie/cookie_mask range, as in test_026_delete_flows_cookie_mask_range,
+and the same times are measured until none is left.
+"""
+import time
+from collections import Counter
+
+import pytest
+
+from tests.benchmark import BenchmarkResult, bench_param, chunks, distribution
+from tests.helpers import AsyncKytosClient, colon_dpid, kytos_api, network_pool
+
+CONTROLLER = '127.0.0.1'
+BENCH_COOKIE_PREFIX = 0xbe
+BENCH_COOKIE = BENCH_COOKIE_PREFIX << 56
+BENCH_COOKIE_MASK = 0xff << 56
+BENCH_COOKIE_RANGE = [BENCH_COOKIE, BENCH_COOKIE | (1 << 56) - 1]
+
+
+def bench_flow(index, tables):
+    """A flow with a unique cookie and dl_src, dropping the packets."""
+    dl_src = (0x02be << 32 | index).to_bytes(6, "big")
+    return {
+        "cookie": BENCH_COOKIE | index,
+        "table_id": index % tables,
+        "priority": 1000,
+        "match": {
+            "dl_src": ":".join(f"{byte:02x}" for byte in dl_src),
+        },
+        "actions": [],
+    }
+
+
+@pytest.mark.benchmark
+class TestBenchFlowManager:
+    net = None
+    topo_name = "amlight"
+
+    @classmethod
+    def setup_class(cls):
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
+
+    @classmethod
+    def teardown_class(cls):
+        network_pool.release(cls.net)
+
+    def setup_method(self, method):
+        self.net.restart_kytos_clean()
+        self.net.wait_kytos_converged()
+
+    def follow(self, expected, begin, timeout, interval):
+        """Poll stored_flows and the switch dumps until the number of
+        bench flows of each switch is the expected one ({switch name:
+        count}). Return the seconds since begin until stored_flows and
+        until the dump of each switch matched (None if they didn't)."""
+        dpids = {colon_dpid(sw.dpid): sw.name for sw in self.net.net.switches}
+        stored_at = None
+        dumped_at = {}
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if stored_at is None:
+                stored = kytos_api.get_stored_flows(
+                    state="installed", cookie_range=BENCH_COOKIE_RANGE
+                )
+                counts = {
+                    dpids[dpid]: len(flows) for dpid, flows in stored.items()
+                    if dpid in dpids
+                }
+                if all(counts.get(name, 0) == count for name, count in expected.items()):
+                    stored_at = time.monotonic() - begin
+            waiting = [name for name in expected if name not in dumped_at]
+            if waiting:
+                tables = self.net.dump_all_flows(waiting)
+                now = time.monotonic() - begin
+                for name in waiting:
+                    if len(tables[name].find(cookie_prefix=BENCH_COOKIE_PREFIX)) == expected[name]:
+                        dumped_at[name] = now
+            if stored_at is not None and len(dumped_at) == len(expected):
+                break
+            time.sleep(interval)
+        return stored_at, dumped_at
+
+    async def install(self, flows, mode, batch, concurrency):
+        """Post the flows in batches. Return the number of flows accepted,
+        the request latencies and the flows refused by status code or
+        exception."""
+        switches = self.net.net.switches
+        posts = []
+        if mode == "all":
+            posts = [("kytos/flow_manager/v2/flows", chunk) for chunk in chunks(flows, batch)]
+        else:
+            per_switch = [flows[i::len(switches)] for i in range(len(switches))]
+            for switch, switch_flows in zip(switches, per_switch):
+                path = f"kytos/flow_manager/v2/flows/{colon_dpid(switch.dpid)}"
+                posts += [(path, chunk) for chunk in chunks(switch_flows, batch)]
+        errors = Counter()
+        latencies = []
+        accepted = []
+
+        async with AsyncKytosClient(concurrency=concurrency) as api:
+            async def post(request):
+                path, chunk = request
+                begin = time.monotonic()
+                try:
+                    response = await api.request(
+                        "POST", path, retries=0, json={"flows": chunk}
+                    )
+                except Exception as exc:
+                    errors[type(exc).__name__] += len(chunk)
+                    return
+                latencies.append(time.monotonic() - begin)
+                if response.status_code != 202:
+                    errors[str(response.status_code)] += len(chunk)
+                    return
+                accepted.append(len(chunk))
+
+            await api.map(post, posts)
+        return sum(accepted), latencies, errors
+
+    @pytest.mark.parametrize("mode", ["switch", "all"])
+    @pytest.mark.parametrize("count", bench_param("flows", [1000]))
+    async def test_bulk_install_delete(self, count, mode):
+        tables = bench_param("tables", 4)
+        batch = bench_param("batch", 500)
+        concurrency = bench_param("concurrency", 8)
+        timeout = bench_param("timeout", 900)
+        interval = bench_param("poll_interval", 1.0)
+        switches = self.net.net.switches
+        flows = [bench_flow(index, tables) for index in range(count)]
+        if mode == "all":
+            expected = {sw.name: count for sw in switches}
+        else:
+            expected = {
+                sw.name: len(flows[i::len(switches)]) for i, sw in enumerate(switches)
+            }
+        total = sum(expected.values())
+
+        begin = time.monotonic()
+        accepted, latencies, errors = await self.install(flows, mode, batch, concurrency)
+        accept_time = time.monotonic() - begin
+        installed_stored, installed_dumped = self.follow(
+            expected, begin, timeout, interval
+        )
+
+        delete_begin = time.monotonic()
+        kytos_api.delete_flows(
+            [{"cookie": BENCH_COOKIE, "cookie_mask": BENCH_COOKIE_MASK}]
+        )
+        delete_accept_time = time.monotonic() - delete_begin
+        deleted_stored, deleted_dumped = self.follow(
+            {name: 0 for name in expected}, delete_begin, timeout, interval
+        )
+
+        installed_all = max(installed_dumped.values()) \
+            if len(installed_dumped) == len(expected) else None
+        deleted_all = max(deleted_dumped.values()) \
+            if len(deleted_dumped) == len(expected) else None
+        result = BenchmarkResult(
+            "flow_manager_bulk", flows=count, mode=mode, tables=tables,
+            batch=batch, concurrency=concurrency, poll_interval=interval,
+            switches=len(switches), topology=self.topo_name,
+        )
+        result.add(
+            switch_flows=total,
+            accepted=accepted,
+            accept_time=accept_time,
+            accept_rate=accepted / accept_time,
+            errors=dict(errors),
+            error_rate=sum(errors.values()) / count,
+            request_latency=distribution(latencies),
+            install_stored_time=installed_stored,
+            install_dump_time=installed_all,
+            install_rate=total / installed_all if installed_all else None,
+            install_dump_time_per_switch=distribution(installed_dumped.values()),
+            delete_accept_time=delete_accept_time,
+            delete_stored_time=deleted_stored,
+            delete_dump_time=deleted_all,
+            delete_rate=total / deleted_all if deleted_all else None,
+            delete_dump_time_per_switch=distribution(deleted_dumped.values()),
+        )
+        path = result.save()
+        print(f"benchmark result written to {path}: {result.metrics}")
+        assert installed_all is not None, \
+            f"flows not installed on all switches after {timeout}s: {installed_dumped}"
+        assert deleted_all is not None, \
+            f"flows not deleted from all switches after {timeout}s: {deleted_dumped}"
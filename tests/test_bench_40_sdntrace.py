@@ -0,0 +1,236 @@
+"""sdntrace_cp trace throughput benchmark.
+
+On the linear10 and amlight topologies, with a four table of_multi_table
+pipeline enabled, creates EVCs between host ports in steps of
+BENCH_EVCS (10, 100 and 500 by default) to grow the flow tables. At each
+step it runs BENCH_TRACES control plane traces (2,000 by default) from
+the UNIs of the EVCs, once with one PUT /amlight/sdntrace_cp/v1/trace
+per trace and once with PUT /amlight/sdntrace_cp/v1/traces of BENCH_BATCH
+traces, both with BENCH_CONCURRENCY requests in flight. It reports the
+traces per second and the per-trace latency against the flow table size,
+and the speedup of the batch endpoint.
+"""
+import time
+from collections import Counter
+
+import pytest
+
+from tests.benchmark import (
+    BenchmarkResult, bench_param, chunks, distribution, evc_payloads,
+)
+from tests.helpers import (
+    AsyncKytosClient, kytos_api, network_pool, uni_pairs, wait_until,
+)
+
+CONTROLLER = '127.0.0.1'
+MULTI_TABLE_COOKIE_PREFIX = 0xad
+
+# table 0 goes to 1 (coloring and of_lldp), then 2 (mef_eline evpl) and
+# 3 (mef_eline epl), so the traces go through three tables
+PIPELINE = {
+    "multi_table": [
+        {
+            "table_id": 0,
+            "description": "First table for miss flow entry",
+            "table_miss_flow": {
+                "priority": 0,
+                "instructions": [{"instruction_type": "goto_table", "table_id": 1}],
+            },
+        },
+        {
+            "table_id": 1,
+            "description": "Second table for coloring and of_lldp",
+            "napps_table_groups": {"coloring": ["base"], "of_lldp": ["base"]},
+            "table_miss_flow": {
+                "priority": 0,
+                "instructions": [{"instruction_type": "goto_table", "table_id": 2}],
+            },
+        },
+        {
+            "table_id": 2,
+            "description": "Third table for mef_eline evpl",
+            "napps_table_groups": {"mef_eline": ["evpl"]},
+            "table_miss_flow": {
+                "priority": 0,
+                "instructions": [{"instruction_type": "goto_table", "table_id": 3}],
+            },
+        },
+        {
+            "table_id": 3,
+            "description": "Fourth table for mef_eline epl",
+            "napps_table_groups": {"mef_eline": ["epl"]},
+        },
+    ]
+}
+
+
+def uni_traces(payloads):
+    """sdntrace_cp trace payloads from both UNIs of the EVC payloads."""
+    traces = []
+    for payload in payloads:
+        for uni in (payload["uni_a"], payload["uni_z"]):
+            dpid, port = uni["interface_id"].rsplit(":", 1)
+            traces.append({
+                "trace": {
+                    "switch": {"dpid": dpid, "in_port": int(port)},
+                    "eth": {"dl_vlan": uni["tag"]["value"]},
+                }
+            })
+    return traces
+
+
+def is_complete(steps):
+    return bool(steps) and steps[-1].get("type") == "last"
+
+
+async def put_traces(traces, batch, concurrency):
+    """Run the traces, one per PUT /v1/trace if batch is 0, or batch per
+    PUT /v1/traces. Return the seconds taken, the request latencies, the
+    number of traces per request, the traces complete and the errors."""
+    if batch:
+        puts = [("amlight/sdntrace_cp/v1/traces", chunk) for chunk in chunks(traces, batch)]
+    else:
+        puts = [("amlight/sdntrace_cp/v1/trace", trace) for trace in traces]
+    latencies = []
+    sizes = []
+    errors = Counter()
+    complete = 0
+
+    async with AsyncKytosClient(concurrency=concurrency) as api:
+        async def put(request):
+            nonlocal complete
+            path, body = request
+            begin = time.monotonic()
+            try:
+                response = await api.request("PUT", path, json=body)
+            except Exception as exc:
+                errors[type(exc).__name__] += 1
+                return
+            latencies.append(time.monotonic() - begin)
+            sizes.append(len(body) if batch else 1)
+            if response.status_code != 200:
+                errors[str(response.status_code)] += 1
+                return
+            result = response.json()["result"]
+            complete += sum(map(is_complete, result if batch else [result]))
+
+        begin = time.monotonic()
+        await api.map(put, puts)
+        elapsed = time.monotonic() - begin
+    return elapsed, latencies, sizes, complete, errors
+
+
+class SdntraceBenchmark:
+    """Trace throughput benchmark, run on the topo_name of the subclasses."""
+    net = None
+    topo_name = None
+
+    @classmethod
+    def setup_class(cls):
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
+
+    @classmethod
+    def teardown_class(cls):
+        network_pool.release(cls.net)
+
+    def setup_method(self, method):
+        self.net.restart_kytos_clean()
+        self.net.wait_kytos_converged()
+        self.enable_pipeline()
+
+    def enable_pipeline(self):
+        pipeline = kytos_api.call(
+            "POST", "kytos/of_multi_table/v1/pipeline", expect=201, json=PIPELINE
+        )
+        kytos_api.call("POST", f"kytos/of_multi_table/v1/pipeline/{pipeline['id']}/enable")
+        misses = len(PIPELINE["multi_table"]) - 1
+
+        def condition():
+            tables = self.net.dump_all_flows()
+            missing = [
+                name for name, table in tables.items()
+                if len(table.find(cookie_prefix=MULTI_TABLE_COOKIE_PREFIX)) < misses
+            ]
+            assert not missing, f"pipeline not installed on {missing}"
+            return True
+        wait_until(condition, description="of_multi_table pipeline installed")
+
+    def wait_evcs_active(self, evc_ids, timeout):
+        def condition():
+            evcs = kytos_api.list_evcs()
+            inactive = [evc_id for evc_id in evc_ids if not evcs[evc_id]["active"]]
+            assert not inactive, f"{len(inactive)} EVCs not active"
+            return True
+        wait_until(
+            condition, timeout=timeout, max_interval=1,
+            description=f"{len(evc_ids)} EVCs active",
+        )
+
+    async def test_trace_throughput(self):
+        steps = bench_param("evcs", [10, 100, 500])
+        count = bench_param("traces", 2000)
+        batch = bench_param("batch", 100)
+        concurrency = bench_param("concurrency", 4)
+        timeout = bench_param("timeout", 600)
+        payloads = evc_payloads(uni_pairs(self.net.net), max(steps))
+
+        evc_ids = []
+        points = []
+        async with AsyncKytosClient(concurrency=concurrency) as api:
+            for size in sorted(steps):
+                created = await api.create_evcs(payloads[len(evc_ids):size])
+                evc_ids += [data["circuit_id"] for data in created]
+                self.wait_evcs_active(evc_ids, timeout)
+                # wait until the flow tables stop changing
+                self.net.wait_kytos_converged(timeout=timeout)
+                tables = self.net.dump_all_flows()
+                traces = uni_traces(payloads[:size])
+                traces = (traces * (count // len(traces) + 1))[:count]
+
+                point = {
+                    "evcs": size,
+                    "flows": sum(len(table) for table in tables.values()),
+                    "max_switch_flows": max(len(table) for table in tables.values()),
+                }
+                for name, batch_size in (("single", 0), ("batch", batch)):
+                    elapsed, latencies, sizes, complete, errors = await put_traces(
+                        traces, batch_size, concurrency
+                    )
+                    point[name] = {
+                        "traces_per_second": count / elapsed,
+                        "request_latency": distribution(latencies),
+                        "trace_latency": distribution(
+                            latency / traces_sent
+                            for latency, traces_sent in zip(latencies, sizes)
+                        ),
+                        "complete": complete,
+                        "errors": dict(errors),
+                    }
+                point["batch_speedup"] = (
+                    point["batch"]["traces_per_second"]
+                    / point["single"]["traces_per_second"]
+                )
+                points.append(point)
+
+        result = BenchmarkResult(
+            "sdntrace_cp_throughput", topology=self.topo_name, evcs=steps,
+            traces=count, batch=batch, concurrency=concurrency,
+            pipeline_tables=len(PIPELINE["multi_table"]),
+        )
+        result.add(points=points)
+        path = result.save()
+        print(f"benchmark result written to {path}: {result.metrics}")
+        for point in points:
+            for name in ("single", "batch"):
+                assert point[name]["complete"] == count, \
+                    f"{point['evcs']} EVCs, {name}: incomplete traces {point[name]}"
+
+
+@pytest.mark.benchmark
+class TestBenchSdntraceLinear10(SdntraceBenchmark):
+    topo_name = "linear10"
+
+
+@pytest.mark.benchmark
+class TestBenchSdntraceAmlight(SdntraceBenchmark):
+    topo_name = "amlight"
@@ -1,13 +1,12 @@
 import time
 import shutil
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import re
 import os
 import pytest
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 # TODO: check all the logs on the end
 # TODO: persist the logs of syslog
@@ -17,6 +16,7 @@ KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
 
 class TestE2EKytosServer:
     net = None
+    topo_name = "ring"
     syslog_found = None
 
     def setup_method(self, method):
@@ -31,8 +31,7 @@ class TestE2EKytosServer:
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
         # rotate logfile (copy/truncate strategy)
         try:
             cls.logfile = '/var/log/syslog'
@@ -45,13 +44,13 @@ class TestE2EKytosServer:
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_start_kytos_api_core(self):
 
         # Check server status if it is UP and running
         api_url = KYTOS_API+'/core/status/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -76,7 +75,7 @@ class TestE2EKytosServer:
                 ('amlight', 'kytos_stats'),
             ]
         api_url = KYTOS_API+'/core/napps_enabled/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -84,11 +83,11 @@ class TestE2EKytosServer:
 
         # Check disable a napp
         api_url = KYTOS_API+'/core/napps/kytos/mef_eline/disable'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         api_url = KYTOS_API+'/core/napps_enabled/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -99,7 +98,7 @@ class TestE2EKytosServer:
         self.net.wait_switches_connect()
 
         api_url = KYTOS_API+'/core/napps_enabled/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -107,11 +106,11 @@ class TestE2EKytosServer:
 
         # check enable a napp
         api_url = KYTOS_API+'/core/napps/kytos/mef_eline/enable'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         api_url = KYTOS_API+'/core/napps_enabled/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -1,15 +1,17 @@
 import json
-import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import time
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2ETopology:
     net = None
+    topo_name = "ring"
+    # some tests add and delete links, the next class needs a new network
+    rebuild_network = True
 
     def setup_method(self, method):
         """
@@ -23,12 +25,11 @@ class TestE2ETopology:
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net, rebuild=cls.rebuild_network)
 
     def restart(self, _clean_config=False, _enable_all=False):
 
@@ -45,7 +46,7 @@ class TestE2ETopology:
         Test /api/kytos/topology/v3/ on GET
         """
         api_url = KYTOS_API + '/topology/v3/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         topology = {
@@ -80,7 +81,7 @@ class TestE2ETopology:
         Test /api/kytos/topology/v3/switches on GET
         """
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         assert response.status_code == 200, response.text
@@ -101,20 +102,20 @@ class TestE2ETopology:
 
         # Make sure the switches are disabled by default
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['switches'][switch_id]['enabled'] is False
 
         # Enable the switches
         api_url = KYTOS_API + '/topology/v3/switches/%s/enable' % switch_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         self.restart()
 
         # Check if the switch is enabled
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['switches'][switch_id]['enabled'] is True
 
@@ -122,7 +123,7 @@ class TestE2ETopology:
 
         # Check if the switches are still enabled and now with the links
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['switches'][switch_id]['enabled'] is True
 
@@ -137,18 +138,18 @@ class TestE2ETopology:
 
         # Enable the switch
         api_url = KYTOS_API + '/topology/v3/switches/%s/enable' % switch_id
-        requests.post(api_url)
+        kytos_api.post(api_url)
 
         # Disable the switch
         api_url = KYTOS_API + '/topology/v3/switches/%s/disable' % switch_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         self.restart()
 
         # Check if the switch is disabled
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['switches'][switch_id]['enabled'] is False
 
@@ -167,28 +168,28 @@ class TestE2ETopology:
         payload = {"tmp_key": "tmp_value"}
         key = next(iter(payload))
         api_url = KYTOS_API + '/topology/v3/switches/%s/metadata' % switch_id
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
         self.restart()
 
         # Verify that the metadata is inserted
         api_url = KYTOS_API + '/topology/v3/switches/%s/metadata' % switch_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         keys = data['metadata'].keys()
         assert key in keys
 
         # Delete the switch metadata
         api_url = KYTOS_API + '/topology/v3/switches/%s/metadata/%s' % (switch_id, key)
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Make sure the metadata is removed
         api_url = KYTOS_API + '/topology/v3/switches/%s/metadata' % switch_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         keys = data['metadata'].keys()
         assert key not in keys
@@ -206,7 +207,7 @@ class TestE2ETopology:
         def insert_metadata(metadata):
             payload = metadata
             api_url = f"{KYTOS_API}/topology/v3/switches/{switch_id}/metadata"
-            return requests.post(
+            return kytos_api.post(
                 api_url,
                 data=json.dumps(payload),
                 headers={"Content-type": "application/json"},
@@ -223,7 +224,7 @@ class TestE2ETopology:
 
         # Verify that the metadata is inserted
         api_url = KYTOS_API + '/topology/v3/switches/%s/metadata' % switch_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         keys = list(data['metadata'].keys())
         expected_keys = [str(k) for k in range(n_keys)]
@@ -239,12 +240,12 @@ class TestE2ETopology:
         # Enable switch
         dpid = '00:00:00:00:00:00:00:01'
         api_url = f"{KYTOS_API}/topology/v3/switches/{dpid}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         # Make sure the interfaces are disabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         for interface in data['interfaces']:
             assert data['interfaces'][interface]['enabled'] is False
@@ -253,14 +254,14 @@ class TestE2ETopology:
 
         # Enable the interface
         api_url = KYTOS_API + '/topology/v3/interfaces/%s/enable' % interface_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Check if the interface is enabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['interfaces'][interface_id]['enabled'] is True
 
@@ -273,12 +274,12 @@ class TestE2ETopology:
         # Enable switch
         switch_id = "00:00:00:00:00:00:00:01"
         api_url = f"{KYTOS_API}/topology/v3/switches/{switch_id}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         # Make sure all the interfaces belonging to the target switch are disabled
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         for interface in data['switches'][switch_id]['interfaces']:
@@ -286,14 +287,14 @@ class TestE2ETopology:
 
         # Enabling all the interfaces
         api_url = KYTOS_API + '/topology/v3/interfaces/switch/%s/enable' % switch_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Make sure all the interfaces belonging to the target switch are enabled
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         for interface in data['switches'][switch_id]['interfaces']:
@@ -301,14 +302,14 @@ class TestE2ETopology:
 
         # Disabling all the interfaces
         api_url = KYTOS_API + '/topology/v3/interfaces/switch/%s/disable' % switch_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Make sure all the interfaces belonging to the target switch are disable
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         for interface in data['switches'][switch_id]['interfaces']:
@@ -325,32 +326,32 @@ class TestE2ETopology:
         # Enable switch
         switch_id = "00:00:00:00:00:00:00:01"
         api_url = f"{KYTOS_API}/topology/v3/switches/{switch_id}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         # Enable the interface
         interface_id = "00:00:00:00:00:00:00:01:4"
         api_url = KYTOS_API + '/topology/v3/interfaces/%s/enable' % interface_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Check if the interface is enabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['interfaces'][interface_id]['enabled'] is True
 
         # Disable the interface and check if the interface is really disabled
         api_url = KYTOS_API + '/topology/v3/interfaces/%s/disable' % interface_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['interfaces'][interface_id]['enabled'] is False
 
@@ -365,19 +366,19 @@ class TestE2ETopology:
         # Enable switch
         switch_id = "00:00:00:00:00:00:00:01"
         api_url = f"{KYTOS_API}/topology/v3/switches/{switch_id}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         # Enabling all the interfaces
         api_url = KYTOS_API + '/topology/v3/interfaces/switch/%s/enable' % switch_id
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Make sure all the interfaces belonging to the target switch are enabled
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         for interface in data['switches'][switch_id]['interfaces']:
@@ -400,28 +401,28 @@ class TestE2ETopology:
         key = next(iter(payload))
 
         api_url = KYTOS_API + '/topology/v3/interfaces/%s/metadata' % interface_id
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
         self.restart()
 
         # Verify that the metadata is inserted
         api_url = KYTOS_API + '/topology/v3/interfaces/%s/metadata' % interface_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         keys = data['metadata'].keys()
         assert key in keys
 
         # Delete the interface metadata
         api_url = KYTOS_API + '/topology/v3/interfaces/%s/metadata/%s' % (interface_id, key)
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Make sure the metadata is removed
         api_url = KYTOS_API + '/topology/v3/interfaces/%s/metadata' % interface_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         keys = data['metadata'].keys()
         assert key not in keys
@@ -438,7 +439,7 @@ class TestE2ETopology:
 
         # make sure the links are disabled by default
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         assert response.status_code == 200, response.text
@@ -449,18 +450,18 @@ class TestE2ETopology:
             sw = "00:00:00:00:00:00:00:0%d" % i
 
             api_url = KYTOS_API + '/topology/v3/switches/%s/enable' % sw
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 201, response.text
 
             api_url = KYTOS_API + '/topology/v3/interfaces/switch/%s/enable' % sw
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 200, response.text
 
         self.restart()
 
         # now all the links should stay disabled
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert len(data['links']) == 3
 
@@ -473,14 +474,14 @@ class TestE2ETopology:
         assert data['links'][link_id1]['enabled'] is False
 
         api_url = KYTOS_API + '/topology/v3/links/%s/enable' % link_id1
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         self.restart()
 
         # check if the links are now enabled
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['links'][link_id1]['enabled'] is True
 
@@ -498,7 +499,7 @@ class TestE2ETopology:
 
         # make sure the links are disabled by default
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         assert response.status_code == 200, response.text
@@ -509,18 +510,18 @@ class TestE2ETopology:
             sw = "00:00:00:00:00:00:00:0%d" % i
 
             api_url = KYTOS_API + '/topology/v3/switches/%s/enable' % sw
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 201, response.text
 
             api_url = KYTOS_API + '/topology/v3/interfaces/switch/%s/enable' % sw
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 200, response.text
 
         self.restart()
 
         # now all the links should stay disabled
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert len(data['links']) == 3
 
@@ -533,12 +534,12 @@ class TestE2ETopology:
         assert data['links'][link_id1]['enabled'] is False
 
         api_url = KYTOS_API + '/topology/v3/links/%s/enable' % link_id1
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         # check if the links are now enabled
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['links'][link_id1]['enabled'] is True
 
@@ -551,13 +552,13 @@ class TestE2ETopology:
 
         # check if the links are still enabled and now with the links
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['links'][link_id1]['enabled'] is True
 
         # disable the link
         api_url = KYTOS_API + '/topology/v3/links/%s/disable' % link_id1
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         # restart kytos and check if the links are still enabled
@@ -569,7 +570,7 @@ class TestE2ETopology:
 
         # check if the links are still enabled and now with the links
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['links'][link_id1]['enabled'] is False
 
@@ -590,18 +591,18 @@ class TestE2ETopology:
             sw = "00:00:00:00:00:00:00:0%d" % i
 
             api_url = KYTOS_API + '/topology/v3/switches/%s/enable' % sw
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 201, response.text
 
             api_url = KYTOS_API + '/topology/v3/interfaces/switch/%s/enable' % sw
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 200, response.text
 
         self.restart()
 
         # Get the link_id
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         link_id1 = None
@@ -612,7 +613,7 @@ class TestE2ETopology:
 
         # Enable the link_id
         api_url = KYTOS_API + '/topology/v3/links/%s/enable' % link_id1
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         self.restart()
@@ -622,28 +623,28 @@ class TestE2ETopology:
         key = next(iter(payload))
 
         api_url = KYTOS_API + '/topology/v3/links/%s/metadata' % link_id1
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
         self.restart()
 
         # Verify that the metadata is inserted
         api_url = KYTOS_API + '/topology/v3/links/%s/metadata' % link_id1
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         keys = data['metadata'].keys()
         assert key in keys
 
         # Delete the link metadata
         api_url = KYTOS_API + '/topology/v3/links/%s/metadata/%s' % (link_id1, key)
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         self.restart()
 
         # Make sure the metadata is removed
         api_url = KYTOS_API + '/topology/v3/links/%s/metadata' % link_id1
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         keys = data['metadata'].keys()
@@ -667,7 +668,7 @@ class TestE2ETopology:
         link_1_2, link_1_3 = None, None
 
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert len(data['links']) == 3
 
@@ -686,14 +687,14 @@ class TestE2ETopology:
 
         # Add new link ("01:3" - "03:4") through Mininet
         for intf in s1.intfList():
-            if intf.name == "s1-eth3":
+            if intf.name == f"{s1.name}-eth3":
                 s1_eht3 = intf
                 break
         assert s1_eht3 is not None
         s1_eht3.delete()
         self.net.net.addLink(s1, s3, port1=3, port2=4)
-        s1.attach('s1-eth3')
-        s3.attach('s3-eth4')
+        s1.attach(f'{s1.name}-eth3')
+        s3.attach(f'{s3.name}-eth4')
 
         # Start Kytos with the new link
         self.net.start_controller(clean_config=False, enable_all=True)
@@ -701,7 +702,7 @@ class TestE2ETopology:
         time.sleep(10)
 
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert len(data['links']) == 4
 
@@ -722,20 +723,20 @@ class TestE2ETopology:
         # Add link ("01:3" - "02:2") again so new link ("01:3" - "03:4") 
         # is mismatched
         for intf in s1.intfList():
-            if intf.name == "s1-eth3":
+            if intf.name == f"{s1.name}-eth3":
                 s1_eht3 = intf
                 break
         assert s1_eht3 is not None
         for intf in s2.intfList():
-            if intf.name == "s2-eth2":
+            if intf.name == f"{s2.name}-eth2":
                 s2_eth2 = intf
                 break
         assert s2_eth2 is not None
         s1_eht3.delete()
         s2_eth2.delete()
         self.net.net.addLink(s1, s2, port1=3, port2=2)
-        s1.attach('s1-eth3')
-        s2.attach('s2-eth2')
+        s1.attach(f'{s1.name}-eth3')
+        s2.attach(f'{s2.name}-eth2')
 
         # Start Kytos with the new link
         self.net.start_controller(clean_config=False, enable_all=True)
@@ -743,7 +744,7 @@ class TestE2ETopology:
         time.sleep(10)
 
         api_url = KYTOS_API + '/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert len(data['links']) == 4
 
@@ -763,7 +764,7 @@ class TestE2ETopology:
 
         # Make sure the switch is disabled
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         assert response.status_code == 200, response.text
@@ -773,7 +774,7 @@ class TestE2ETopology:
 
         # Make sure the interfaces are disabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
 
         assert response.status_code == 200, response.text
@@ -789,7 +790,7 @@ class TestE2ETopology:
 
         # Make sure the switch is disabled
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         assert response.status_code == 200, response.text
         data = response.json()
@@ -805,7 +806,7 @@ class TestE2ETopology:
 
         # Make sure the interfaces are disabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         assert response.status_code == 200, response.text
         data = response.json()
@@ -1,15 +1,17 @@
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import time
 import json
 import os
 import pytest
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 class TestE2ETopology:
     net = None
+    topo_name = "multi"
+    # some tests add and delete links, the next class needs a new network
+    rebuild_network = True
 
     def setup_method(self, method):
         """
@@ -19,16 +21,15 @@ class TestE2ETopology:
         # which all elements are enabled in a clean setting
         self.net.config_all_links_up()
         self.net.restart_kytos_clean()
-        time.sleep(20)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="multi")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net, rebuild=cls.rebuild_network)
 
     @pytest.mark.skipif(
         os.environ.get("SWITCH_CLASS") in ("NoviSwitch", "P4OfSwitch"),
@@ -41,20 +42,20 @@ class TestE2ETopology:
         """
         intf_id = "00:00:00:00:00:00:00:01:1"
         api_url = f'{KYTOS_API}/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert intf_id in data["interfaces"]
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}/disable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         S1 = self.net.net.get('s1')
-        S1.detach('s1-eth1')
+        S1.detach(f'{S1.name}-eth1')
         time.sleep(5)
 
         api_url = f'{KYTOS_API}/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert not intf_id in data["interfaces"]
@@ -69,7 +70,7 @@ class TestE2ETopology:
 
         # Get the link_id
         api_url = f'{KYTOS_API}/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200
         data = response.json()
         link_id = None
@@ -84,23 +85,23 @@ class TestE2ETopology:
 
         # Not disabled
         api_url = f'{KYTOS_API}/topology/v3/links/{link_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409, response.text
         
         # Disabling link
         self.net.net.configLinkStatus('s1', 's6', 'down')
         api_url = f'{KYTOS_API}/topology/v3/links/{link_id}/disable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
     
         # Deleting link
         api_url = f'{KYTOS_API}/topology/v3/links/{link_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         # Verify absence of link
         api_url = f'{KYTOS_API}/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200
         data = response.json()
         assert link_id not in data["links"]
@@ -114,16 +115,16 @@ class TestE2ETopology:
         # Switch is not disabled, 409
         switch_1 = "00:00:00:00:00:00:00:01"
         api_url = f'{KYTOS_API}/topology/v3/switches/{switch_1}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409
 
         # Switch have links, 409
         api_url = f'{KYTOS_API}/topology/v3/switches/{switch_1}/disable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201
 
         api_url = f'{KYTOS_API}/topology/v3/switches/{switch_1}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409
 
         # Get the link_id
@@ -134,7 +135,7 @@ class TestE2ETopology:
             if counter_searches:
                 time.sleep(5)
             api_url = f'{KYTOS_API}/topology/v3/links'
-            response = requests.get(api_url)
+            response = kytos_api.get(api_url)
             assert response.status_code == 200, response.text
             data = response.json()
             for key, value in data['links'].items():
@@ -149,12 +150,12 @@ class TestE2ETopology:
         for link in links_id:
             # Disabling links
             api_url = f'{KYTOS_API}/topology/v3/links/{link}/disable'
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 201, response.text
     
             # Deleting links
             api_url = f'{KYTOS_API}/topology/v3/links/{link}'
-            response = requests.delete(api_url)
+            response = kytos_api.delete(api_url)
             assert response.status_code == 200, response.text
 
         # Delete switch, success
@@ -163,7 +164,7 @@ class TestE2ETopology:
         while status_code != 200 and counter_tries < 5:
             time.sleep(5)
             api_url = f'{KYTOS_API}/topology/v3/switches/{switch_1}'
-            response = requests.delete(api_url)
+            response = kytos_api.delete(api_url)
             status_code = response.status_code
             counter_tries += 1
         assert response.status_code == 200, f"{response.text}, tries: {counter_tries}"
@@ -192,34 +193,34 @@ class TestE2ETopology:
             }
         ]}
         api_url = f'{KYTOS_API}/flow_manager/v2/flows/{switch_2}'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         # Interface is enabled
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409, response.text
 
         # Interface is active
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}/disable/'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409, response.text
 
         # Interface has a link
         S2, S6 = self.net.net.get('s2', 's6')
-        S2.detach('s2-eth4')
+        S2.detach(f'{S2.name}-eth4')
 
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409, response.text
 
         # Installed flows related to the interface
         api_url = f'{KYTOS_API}/topology/v3/links'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200
         data = response.json()
         link_id = None
@@ -233,14 +234,14 @@ class TestE2ETopology:
         assert link_id
         self.net.net.configLinkStatus('s2', 's6', 'down')
         api_url = f'{KYTOS_API}/topology/v3/links/{link_id}/disable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
         api_url = f'{KYTOS_API}/topology/v3/links/{link_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409, response.text
 
         # Interface succesfully deleted
@@ -249,14 +250,14 @@ class TestE2ETopology:
             "flows": [{"priority": 10, "table_id": 1}]
         }
         api_url = f'{KYTOS_API}/flow_manager/v2/flows/{switch_2}'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
         api_url = f'{KYTOS_API}/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert not intf_id in data["interfaces"]
@@ -276,7 +277,7 @@ class TestE2ETopology:
         """
         # Count how many interfaces does Switch 01
         api_url = f'{KYTOS_API}/topology/v3/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         memo_intfs_before = data["topology"]["switches"]["00:00:00:00:00:00:00:01"]["interfaces"]
 
@@ -289,8 +290,8 @@ class TestE2ETopology:
         # Add interface to s1 and s3
         S1, S3 = self.net.net.get('s1', 's3')
         self.net.net.addLink(S1, S3, port1=20, port2=20)
-        S1.attach('s1-eth20')
-        S3.attach('s3-eth20')
+        S1.attach(f'{S1.name}-eth20')
+        S3.attach(f'{S3.name}-eth20')
         time.sleep(2)
 
         # Look for new interface in the database
@@ -308,7 +309,7 @@ class TestE2ETopology:
 
         # Look for new interface in the memory
         api_url = f'{KYTOS_API}/topology/v3/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         memo_intfs_after = data["topology"]["switches"]["00:00:00:00:00:00:00:01"]["interfaces"]
 
@@ -1,29 +1,28 @@
 import os
 import time
 import pytest
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 
 CONTROLLER = "127.0.0.1"
-KYTOS_API = f"http://{CONTROLLER}:8181/api/kytos"
+KYTOS_API = f"http://{CONTROLLER}:{KYTOS_API_PORT}/api/kytos"
 
 
 class TestE2ETopologyDupDpid:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         self.net.config_all_links_up()
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="ring")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     @pytest.mark.skipif(
         os.environ.get("SWITCH_CLASS") in ("NoviSwitch", "P4OfSwitch"),
@@ -46,7 +45,7 @@ class TestE2ETopologyDupDpid:
         sw1_dpid = "00:00:00:00:00:00:00:01"
 
         api_url = f"{KYTOS_API}/topology/v3/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
 
@@ -77,7 +76,7 @@ class TestE2ETopologyDupDpid:
 
             time.sleep(10)
 
-            response = requests.get(api_url)
+            response = kytos_api.get(api_url)
             assert response.status_code == 200, response.text
             data = response.json()
 
@@ -1,21 +1,28 @@
 import json
-import re
 import time
 from datetime import datetime, timedelta
 
 import pytest
 from random import randrange
-import requests
 
-from tests.helpers import NetworkTest
+from tests.helpers import (
+    KYTOS_API_PORT,
+    KYTOS_UNUSED_OF_PORT,
+    all_of,
+    dump_flow_table,
+    evc_active,
+    evc_current_path_changed,
+    flows_count,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 TIME_FMT = "%Y-%m-%dT%H:%M:%S+0000"
 
-RE_I=re.IGNORECASE
-
 # BasicFlows
 # Each should have at least 3 flows, considering topology 'ring':
 # - 01 for LLDP
@@ -24,6 +31,7 @@ BASIC_FLOWS = 3
 
 class TestE2EMefEline:
     net = None
+    topo_name = "ring"
     evcs = {}
 
     def setup_method(self, method):
@@ -36,16 +44,15 @@ class TestE2EMefEline:
         # Start the controller setting an environment in
         # which all elements are disabled in a clean setting
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def restart(self, _clean_config=False, _enable_all=True):
         # Start the controller setting an environment in which the setting is
@@ -70,10 +77,7 @@ class TestE2EMefEline:
                 "tag": {"tag_type": "vlan", "value": vlan_id}
             }
         }
-        api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
-        assert response.status_code == 201, response.text
-        data = response.json()
+        data = kytos_api.create_evc(payload)
         if store:
             self.evcs[vlan_id] = data['circuit_id']
         return data['circuit_id']
@@ -81,7 +85,7 @@ class TestE2EMefEline:
     def test_010_list_evcs_should_be_empty(self):
         """Test if list circuits return 'no circuit stored.'."""
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         assert response.json() == {}
 
@@ -107,16 +111,16 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
-        time.sleep(10)
-
         s1 = self.net.net.get('s1')
-        flow_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
+
+        flow_s1 = dump_flow_table(s1)
         #Make sure that the flows have EVPL default values
-        assert 'priority=20000' in flow_s1
+        assert flow_s1.find(priority=20000), str(flow_s1)
 
         h11, h12 = self.net.net.get('h11', 'h12')
         h11.cmd('ip link add link %s name vlan101 type vlan id 101' % (h11.intfNames()[0]))
@@ -130,13 +134,13 @@ class TestE2EMefEline:
         assert ', 0% packet loss,' in result
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
         # Each switch must have BASIC_FLOWS + 02 for the EVC (ingress + egress)
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
 
         # TODO: make sure it should be dl_vlan instead of vlan_vid
-        assert 'dl_vlan=101' in flows_s1
+        assert flows_s1.find(dl_vlan="101"), str(flows_s1)
 
         # clean up
         h11.cmd('ip link del vlan101')
@@ -164,29 +168,32 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
-        time.sleep(10)
+        s1, s2 = self.net.net.get('s1', 's2')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 3),
+            flows_count(s2, BASIC_FLOWS + 3),
+        ))
 
         # search for the cookie, should have three flows:
         #  - 2 for the current path
         #  - 1 for the failover path
-        s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
 
         #Make sure that both flow have EVPL default values
-        assert 'priority=20000' in flows_s1
-        assert 'priority=20000' in flows_s2
+        assert flows_s1.find(priority=20000), str(flows_s1)
+        assert flows_s2.find(priority=20000), str(flows_s2)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 3, flows_s2
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 3, str(flows_s2)
 
         # make sure it should be dl_vlan instead of vlan_vid
-        assert 'dl_vlan=15' in flows_s1
-        assert 'dl_vlan=15' in flows_s2
+        assert flows_s1.find(dl_vlan="15"), str(flows_s1)
+        assert flows_s2.find(dl_vlan="15"), str(flows_s2)
 
         # Make the final and most important test: connectivity
         # 1. create the vlans and setup the ip addresses
@@ -221,30 +228,33 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
-        time.sleep(10)
+        s1, s2 = self.net.net.get('s1', 's2')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 3),
+            flows_count(s2, BASIC_FLOWS + 3),
+        ))
 
         # Each switch must have BASIC_FLOWS + 03 for the EVC:
         #  - 2 for current path (ingress + egress)
         #  - 1 for failover path
-        s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 3, flows_s2
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 3, str(flows_s2)
 
         #Make sure that both flow have EVPL default values
-        assert 'priority=20000' in flows_s1
-        assert 'priority=20000' in flows_s2
+        assert flows_s1.find(priority=20000), str(flows_s1)
+        assert flows_s2.find(priority=20000), str(flows_s2)
 
         # make sure it should be dl_vlan instead of vlan_vid
-        assert 'in_port=1,dl_vlan=102' in flows_s1
-        assert 'push_vlan:0x88a8' not in flows_s1
-        assert 'in_port=1,dl_vlan=103' in flows_s2
-        assert 'push_vlan:0x88a8' not in flows_s2
+        assert flows_s1.find(in_port="1", dl_vlan="102"), str(flows_s1)
+        assert not any("push_vlan:0x88a8" in flow.actions for flow in flows_s1), str(flows_s1)
+        assert flows_s2.find(in_port="1", dl_vlan="103"), str(flows_s2)
+        assert not any("push_vlan:0x88a8" in flow.actions for flow in flows_s2), str(flows_s2)
 
         # Make the final and most important test: connectivity
         # 1. create the vlans and setup the ip addresses
@@ -278,28 +288,31 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
-        time.sleep(10)
+        s1, s2 = self.net.net.get('s1', 's2')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 3),
+            flows_count(s2, BASIC_FLOWS + 3),
+        ))
 
         # Each switch must have BASIC_FLOWS + 03 for the EVC:
         #  - 2 for current path (ingress + egress)
         #  - 1 for failover path
-        s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 3, flows_s2
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 3, str(flows_s2)
 
         #Make sure that both flow have EVPL and EPL default values
-        assert 'priority=20000' in flows_s1
-        assert 'priority=10000' in flows_s2
+        assert flows_s1.find(priority=20000), str(flows_s1)
+        assert flows_s2.find(priority=10000), str(flows_s2)
 
         # make sure it should be dl_vlan instead of vlan_vid
-        assert 'in_port=1,dl_vlan=104' in flows_s1, flows_s1
-        assert 'in_port=1,dl_vlan' not in flows_s2, flows_s2
+        assert flows_s1.find(in_port="1", dl_vlan="104"), str(flows_s1)
+        assert not any("dl_vlan" in flow.match for flow in flows_s2.find(in_port="1")), str(flows_s2)
 
         # Make the final and most important test: connectivity
         # 1. create the vlans and setup the ip addresses
@@ -312,7 +325,7 @@ class TestE2EMefEline:
         result = h11.cmd('ping -c1 104.0.0.2')
 
         # make sure it should be dl_vlan instead of vlan_vid
-        assert 'dl_vlan=104' in flows_s1
+        assert flows_s1.find(dl_vlan="104"), str(flows_s1)
 
         # clean up
         h11.cmd('ip link del vlan104')
@@ -335,12 +348,12 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
         evc1 = data['circuit_id']
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         # Create circuit 2: same vlan id but in different UNIs
         payload = {
@@ -357,34 +370,38 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
         evc2 = data['circuit_id']
         assert evc1 != evc2
-        time.sleep(10)
+        s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 6),
+            flows_count(s2, BASIC_FLOWS + 5),
+            flows_count(s3, BASIC_FLOWS + 5),
+        ))
 
         # Switch s1 should have BASIC_FLOWS + 3 for evc1 + 3 for evc2
         # Switch s2 should have BASIC_FLOWS + 3 for evc1 + 2 for evc2/failover
         # Switch s2 should have BASIC_FLOWS + 3 for evc2 + 2 for evc1/failover
-        s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 6, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 5, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 5, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS + 6, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 5, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 5, str(flows_s3)
 
         #Make sure that both flow have EVPL default values
-        assert 'priority=20000' in flows_s1
-        assert 'priority=20000' in flows_s2
-        assert 'priority=20000' in flows_s3
+        assert flows_s1.find(priority=20000), str(flows_s1)
+        assert flows_s2.find(priority=20000), str(flows_s2)
+        assert flows_s3.find(priority=20000), str(flows_s3)
 
         # make sure it should be dl_vlan instead of vlan_vid
-        assert 'dl_vlan=110' in flows_s1
-        assert 'dl_vlan=110' in flows_s2
-        assert 'dl_vlan=110' in flows_s3
+        assert flows_s1.find(dl_vlan="110"), str(flows_s1)
+        assert flows_s2.find(dl_vlan="110"), str(flows_s2)
+        assert flows_s3.find(dl_vlan="110"), str(flows_s3)
 
         # Make the final and most important test: connectivity
         # 1. create the vlans and setup the ip addresses
@@ -435,35 +452,38 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
         evc1 = data['circuit_id']
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         # It verifies EVC's status
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['enabled'] is True
 
         # It disables the circuit
         payload = {"enabled": False}
-        response = requests.patch(api_url + evc1, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
-        time.sleep(10)
+        s1, s2 = self.net.net.get('s1', 's2')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS),
+            flows_count(s2, BASIC_FLOWS),
+        ))
 
         # It verifies EVC's status
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['enabled'] is False
 
         # Each switch must have BASIC_FLOWS
-        s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
 
         # Nodes should not be able to ping each other
         h11, h2 = self.net.net.get('h11', 'h2')
@@ -495,18 +515,22 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
         evc1 = data['circuit_id']
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         # Delete the circuit
         api_url += evc1
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
-        time.sleep(10)
+        s1, s2 = self.net.net.get('s1', 's2')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS),
+            flows_count(s2, BASIC_FLOWS),
+        ))
 
         # try to reuse the vlan id
         payload = {
@@ -523,22 +547,25 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
         evc2 = data['circuit_id']
         assert evc1 != evc2
-        time.sleep(10)
+        s1, s2 = self.net.net.get('s1', 's2')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 3),
+            flows_count(s2, BASIC_FLOWS + 3),
+        ))
 
         # Each switch must have BASIC_FLOWS + 03 for the EVC:
         #  - 2 for current path (ingress + egress)
         #  - 1 for failover path
-        s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 3, flows_s2
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 3, str(flows_s2)
 
         # Nodes should be able to ping each other
         h11, h2 = self.net.net.get('h11', 'h2')
@@ -587,33 +614,40 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
-        time.sleep(10)
+        evc1 = response.json()['circuit_id']
+        s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 2),
+            flows_count(s2, BASIC_FLOWS + 2),
+            flows_count(s3, BASIC_FLOWS + 2),
+        ))
+        evc = wait_until(evc_active(evc1))
 
         # Each switch must have BASIC_FLOWS + 02 for the EVC:
         #  - 2 for current path (ingress + egress)
         #  - (there will be no failover path)
-        s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 2, flows_s3
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 2, str(flows_s3)
 
         # Command to up/down links to test if back-up path is taken
         self.net.net.configLinkStatus('s1', 's2', 'down')
 
         # Wait just a few seconds to give time to the controller receive and process the linkDown event
-        time.sleep(10)
+        wait_until(evc_current_path_changed(evc1, evc["current_path"]))
+        wait_until(flows_count(s2, BASIC_FLOWS))
 
         # # Check on the virtual switches directly for flows
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
 
         # Nodes should be able to ping each other
         h11, h3 = self.net.net.get('h11', 'h3')
@@ -633,29 +667,29 @@ class TestE2EMefEline:
         self.net.net.configLinkStatus('s1', 's2', 'up')
 
         assert ', 0% packet loss,' in result
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 2
+        assert len(flows_s1) == BASIC_FLOWS + 2
+        assert len(flows_s2) == BASIC_FLOWS
+        assert len(flows_s3) == BASIC_FLOWS + 2
 
     def test_055_delete_evc_after_restart_kytos_and_no_switch_reconnected(self):
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
         evc1 = self.create_evc(100)
 
         # restart the controller and change the port on purpose to avoid switches to connect
-        self.net.start_controller(clean_config=False, enable_all=True, port=9999)
+        self.net.start_controller(clean_config=False, enable_all=True, port=KYTOS_UNUSED_OF_PORT)
         time.sleep(10)
 
         # Delete the circuit
-        response = requests.delete(api_url + evc1)
+        response = kytos_api.delete(api_url + evc1)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert evc1 not in data
 
-        response = requests.get(api_url, params={'archived': True})
+        response = kytos_api.get(api_url, params={'archived': True})
         assert response.status_code == 200, response.text
         data = response.json()
         assert evc1 in data
@@ -699,56 +733,63 @@ class TestE2EMefEline:
                     }
                 }
                 api_url = KYTOS_API + '/mef_eline/v2/evc/'
-                response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+                response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
                 assert response.status_code == 201, response.text
                 data = response.json()
                 assert 'circuit_id' in data
                 evcs[i] = data['circuit_id']
 
-            time.sleep(10)
+            s1, s2 = self.net.net.get('s1', 's2')
+            wait_until(all_of(
+                flows_count(s1, BASIC_FLOWS + 30),
+                flows_count(s2, BASIC_FLOWS + 30),
+            ))
 
             # make sure the evcs are active and the flows were created
-            s1, s2 = self.net.net.get('s1', 's2')
-            flows_s1 = s1.dpctl('dump-flows')
-            flows_s2 = s2.dpctl('dump-flows')
+            flows_s1 = dump_flow_table(s1)
+            flows_s2 = dump_flow_table(s2)
             for vid in evcs:
                 evc_id = evcs[vid]
                 api_url = KYTOS_API + '/mef_eline/v2/evc/' + evc_id
-                response = requests.get(api_url)
+                response = kytos_api.get(api_url)
                 assert response.status_code == 200, response.text
                 evc = response.json()
                 # should be active
                 assert evc["active"] is True
                 # search for the vlan id
-                assert "dl_vlan=%s" % vid in flows_s1
-                assert "dl_vlan=%s" % vid in flows_s2
+                assert flows_s1.find(dl_vlan=str(vid)), str(flows_s1)
+                assert flows_s2.find(dl_vlan=str(vid)), str(flows_s2)
                 # search for the cookie, should have three flows:
                 #  - 2 for the current path
                 #  - 1 for the failover path
-                assert len(re.findall(evc['id'], flows_s1, flags=RE_I)) == 3, \
+                cookie = int(f"0xaa{evc['id']}", 16)
+                assert len(flows_s1.find(cookie=cookie)) == 3, \
                     f"round={x} - should have 3 flows but had: \n{flows_s1}"
-                assert len(re.findall(evc['id'], flows_s2, flags=RE_I)) == 3, \
+                assert len(flows_s2.find(cookie=cookie)) == 3, \
                     f"round={x} - should have 3 flows but had: \n{flows_s2}"
 
             # Delete the circuits
             for vid in evcs:
                 evc_id = evcs[vid]
                 api_url = KYTOS_API + '/mef_eline/v2/evc/' + evc_id
-                response = requests.delete(api_url)
+                response = kytos_api.delete(api_url)
                 assert response.status_code == 200, response.text
 
-            time.sleep(60)
+            wait_until(all_of(
+                flows_count(s1, BASIC_FLOWS),
+                flows_count(s2, BASIC_FLOWS),
+            ))
 
             # make sure the circuits were deleted
             api_url = KYTOS_API + '/mef_eline/v2/evc/'
-            response = requests.get(api_url)
+            response = kytos_api.get(api_url)
             assert response.status_code == 200, response.text
             assert response.json() == {}
-            flows_s1 = s1.dpctl('dump-flows')
-            flows_s2 = s2.dpctl('dump-flows')
-            assert len(flows_s1.splitlines()) == BASIC_FLOWS, \
+            flows_s1 = dump_flow_table(s1)
+            flows_s2 = dump_flow_table(s2)
+            assert len(flows_s1) == BASIC_FLOWS, \
                 f"round={x} - should have {BASIC_FLOWS} flows but had: \n{flows_s1}"
-            assert len(flows_s2.splitlines()) == BASIC_FLOWS, \
+            assert len(flows_s2) == BASIC_FLOWS, \
                 f"round={x} - should have {BASIC_FLOWS} flows but had: \n{flows_s2}"
 
     def test_085_create_and_remove_ten_circuit_concurrently(self):
@@ -767,51 +808,58 @@ class TestE2EMefEline:
             thread.join()
 
         # give some time so Kytos can create the flows and everything
-        time.sleep(10)
+        s1, s2 = self.net.net.get('s1', 's2')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 30),
+            flows_count(s2, BASIC_FLOWS + 30),
+        ))
 
         # make sure the evcs are active and the flows were created
-        s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
         for vid in self.evcs:
 
             api_url = KYTOS_API + '/mef_eline/v2/evc/' + self.evcs[vid]
-            response = requests.get(api_url)
+            response = kytos_api.get(api_url)
             assert response.status_code == 200, response.text
             evc = response.json()
             # should be active
             assert evc["active"] is True
 
             # search for the vlan id
-            assert "dl_vlan=%s" % vid in flows_s1
-            assert "dl_vlan=%s" % vid in flows_s2
+            assert flows_s1.find(dl_vlan=str(vid)), str(flows_s1)
+            assert flows_s2.find(dl_vlan=str(vid)), str(flows_s2)
             # search for the cookie, should have three flows:
             #  - 2 for the current path
             #  - 1 for the failover path
-            assert len(re.findall(evc['id'], flows_s1, flags=RE_I)) == 3, \
+            cookie = int(f"0xaa{evc['id']}", 16)
+            assert len(flows_s1.find(cookie=cookie)) == 3, \
                 "should have 3 flows but had: \n%s" % flows_s1
-            assert len(re.findall(evc['id'], flows_s2, flags=RE_I)) == 3, \
+            assert len(flows_s2.find(cookie=cookie)) == 3, \
                 "should have 3 flows but had: \n%s" % flows_s2
 
         # Delete the circuits
         for vid in self.evcs:
             evc_id = self.evcs[vid]
             api_url = KYTOS_API + '/mef_eline/v2/evc/' + evc_id
-            response = requests.delete(api_url)
+            response = kytos_api.delete(api_url)
             assert response.status_code == 200, response.text
 
-        time.sleep(60)
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS),
+            flows_count(s2, BASIC_FLOWS),
+        ))
 
         # make sure the circuits were deleted
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         assert response.json() == {}
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, \
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s1) == BASIC_FLOWS, \
             f"should have only {BASIC_FLOWS} flow but had: \n{flows_s1}"
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, \
+        assert len(flows_s2) == BASIC_FLOWS, \
             f"should have only {BASIC_FLOWS} flow but had: \n{flows_s2}"
 
     def test_090_patch_evc_new_name(self):
@@ -820,7 +868,7 @@ class TestE2EMefEline:
         evc1 = self.create_evc(100)
 
         # It verifies EVC's name
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data['name'] == 'Vlan_100'
@@ -828,14 +876,14 @@ class TestE2EMefEline:
         payload = {"name": "My EVC_100"}
 
         # It sets a new name
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         time.sleep(10)
 
         # It verifies EVC's new name
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['name'] == 'My EVC_100'
 
@@ -850,14 +898,14 @@ class TestE2EMefEline:
         }
 
         # It sets a new interface_id
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['uni_a']['interface_id'] == "00:00:00:00:00:00:00:01:2"
 
@@ -872,14 +920,14 @@ class TestE2EMefEline:
         }
 
         # It sets a new interface_id
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['uni_z']['interface_id'] == "00:00:00:00:00:00:00:02:2"
 
@@ -899,12 +947,12 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's end_date
-        requests.patch(api_url + evc1, data=json.dumps(payload),
-                       headers={'Content-type': 'application/json'})
+        kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                        headers={'Content-type': 'application/json'})
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['end_date'] == end_date.strftime(TIME_FMT)
 
@@ -913,7 +961,7 @@ class TestE2EMefEline:
 
         # Verify if the circuit is active
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + evc1
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data["active"] is False
 
@@ -928,16 +976,16 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's bandwidth
-        requests.patch(api_url + evc1, data=json.dumps(payload),
-                       headers={'Content-type': 'application/json'})
+        kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                        headers={'Content-type': 'application/json'})
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['bandwidth'] == bandwidth
 
-        requests.delete(api_url + evc1)
+        kytos_api.delete(api_url + evc1)
 
     def test_115_patch_priority(self):
 
@@ -950,22 +998,22 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's sb_priority
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['sb_priority'] == sb_priority, data
 
         s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert 'priority=100' in flows_s1
-        assert 'priority=100' in flows_s2
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        assert flows_s1.find(priority=100), str(flows_s1)
+        assert flows_s2.find(priority=100), str(flows_s2)
 
     def test_120_patch_queue_id(self):
 
@@ -978,23 +1026,23 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's queue_id
-        requests.patch(api_url + evc1, data=json.dumps(payload),
-                       headers={'Content-type': 'application/json'})
+        kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                        headers={'Content-type': 'application/json'})
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['queue_id'] == queue_id
 
         s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
 
         # also asserts set_queue comes before output
-        assert 'set_queue:3,output' in flows_s1
-        assert 'set_queue:3,output' in flows_s2
+        assert any("set_queue:3,output" in flow.actions for flow in flows_s1), str(flows_s1)
+        assert any("set_queue:3,output" in flow.actions for flow in flows_s2), str(flows_s2)
 
     def test_125_patch_dynamic_backup_path(self):
         """Test patching an EVC to be non dynamic with primary_path."""
@@ -1014,14 +1062,14 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's dynamic_backup_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['dynamic_backup_path'] == dynamic_backup_path
 
@@ -1034,8 +1082,8 @@ class TestE2EMefEline:
         payload = {
             "dynamic_backup_path": False,
         }
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         expected_err = "must have a primary path or allow dynamic paths"
         data = response.json()
@@ -1061,8 +1109,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
         time.sleep(10)
@@ -1075,14 +1123,14 @@ class TestE2EMefEline:
             ]
         }
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -1093,7 +1141,7 @@ class TestE2EMefEline:
         assert paths == payload2["primary_path"]
         assert data['active'] is True
 
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         assert response.status_code == 200, response.text
         data = response.json()
         paths = []
@@ -1133,8 +1181,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:03:3"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -1148,13 +1196,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's backup_path
-        requests.patch(api_url + evc1, data=json.dumps(payload2),
-                       headers={'Content-type': 'application/json'})
+        kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                        headers={'Content-type': 'application/json'})
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -1165,7 +1213,7 @@ class TestE2EMefEline:
         assert paths == payload2["backup_path"]
         assert data['active'] is True
 
-        requests.delete(api_url + evc1)
+        kytos_api.delete(api_url + evc1)
 
     def test_140_current_path_value_given_dynamic_backup_path_and_primary_path_conditions(self):
         payload = {
@@ -1187,7 +1235,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -1205,7 +1253,7 @@ class TestE2EMefEline:
                          "endpoint_b": {"id": "00:00:00:00:00:00:00:03:2"}}]
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -1234,14 +1282,14 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -1266,7 +1314,7 @@ class TestE2EMefEline:
                          "endpoint_b": {"id": "00:00:00:00:00:00:00:03:2"}}]
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -1283,7 +1331,7 @@ class TestE2EMefEline:
         # Wait just a few seconds to give time to the controller receive and process the linkUp event
         time.sleep(10)
 
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -1313,7 +1361,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -1326,7 +1374,7 @@ class TestE2EMefEline:
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         assert data['active'] is False
@@ -1347,7 +1395,7 @@ class TestE2EMefEline:
 
         time.sleep(10)
 
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         assert data['active'] is True
@@ -1380,7 +1428,7 @@ class TestE2EMefEline:
         api_url = KYTOS_API + '/mef_eline/v2/evc/%s/metadata' % evc1
 
         # Make sure the metadata is initially empty
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert 'metadata' in data
@@ -1390,28 +1438,28 @@ class TestE2EMefEline:
         my_key = 'tmp_key'
         payload = {my_key: "tmp_value", "other": [1, 2, 3]}
 
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         # Make sure the metadata was inserted
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data['metadata'] == payload
 
         self.restart()
 
         # Make sure the metadata is still there
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data['metadata'] == payload
 
         # Delete the evc metadata
-        response = requests.delete(api_url + '/' + my_key)
+        response = kytos_api.delete(api_url + '/' + my_key)
         assert response.status_code == 200, response.text
 
         # Make sure the metadata was deleted
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert my_key not in data['metadata']
@@ -1420,7 +1468,7 @@ class TestE2EMefEline:
         self.restart()
 
         # Make sure the metadata is still not there
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert my_key not in data['metadata']
@@ -1450,14 +1498,14 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
         time.sleep(10)
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         untagged_flow = self.get_flow_by_vlan_match(data, 0)
 
@@ -1500,14 +1548,14 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
         time.sleep(10)
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         any_flow = self.get_flow_by_vlan_match(data, "4096/4096")
 
@@ -1555,7 +1603,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1580,7 +1628,7 @@ class TestE2EMefEline:
         ]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         any_flow = self.get_flow_by_vlan_match(data, "4096/4096")
         assert any_flow["match"] == expected[0]["match"]
@@ -1588,7 +1636,7 @@ class TestE2EMefEline:
         assert any_flow["instructions"][0]["actions"] == expected[0]["actions"]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:02"]["flows"]
         common_flow = self.get_flow_by_vlan_match(data, 100)
         assert common_flow["match"] == expected[1]["match"]
@@ -1625,7 +1673,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1648,7 +1696,7 @@ class TestE2EMefEline:
         ]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         common_flow = self.get_flow_by_vlan_match(data, 100)
         assert common_flow["match"] == expected[0]["match"]
@@ -1656,7 +1704,7 @@ class TestE2EMefEline:
         assert common_flow["instructions"][0]["actions"] == expected[0]["actions"]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:02"]["flows"]
         untagged_flow = self.get_flow_by_vlan_match(data, 0)
         assert untagged_flow["match"] == expected[1]["match"]
@@ -1692,7 +1740,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1717,7 +1765,7 @@ class TestE2EMefEline:
         ]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         any_flow = self.get_flow_by_vlan_match(data, "4096/4096")
         assert any_flow["match"] == expected[0]["match"]
@@ -1725,7 +1773,7 @@ class TestE2EMefEline:
         assert any_flow["instructions"][0]["actions"] == expected[0]["actions"]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:02"]["flows"]
         untagged_flow = self.get_flow_by_vlan_match(data, 0)
         assert untagged_flow["match"] == expected[1]["match"]
@@ -1747,7 +1795,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1760,7 +1808,7 @@ class TestE2EMefEline:
         ]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         any_flow = self.get_flow_by_vlan_match(data, "4096/4096")
         assert any_flow["match"] == expected[0]["match"]
@@ -1797,7 +1845,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1810,7 +1858,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         untagged_flow = self.get_flow_by_vlan_match(data, 0)
         assert untagged_flow["match"] == expected["match"]
@@ -1842,7 +1890,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1859,7 +1907,7 @@ class TestE2EMefEline:
         ]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         any_flow = self.get_flow_by_vlan_match(data, "4096/4096")
         assert any_flow["match"] == expected[0]["match"]
@@ -1901,7 +1949,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1924,7 +1972,7 @@ class TestE2EMefEline:
         ]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         commom_flow = self.get_flow_by_vlan_match(data, 100)
         assert commom_flow["match"] == expected[0]["match"]
@@ -1964,7 +2012,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -1981,7 +2029,7 @@ class TestE2EMefEline:
         ]
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()["00:00:00:00:00:00:00:01"]["flows"]
         any_flow = self.get_flow_by_vlan_match(data, "4096/4096")
         assert any_flow["match"] == expected[0]["match"]
@@ -2008,7 +2056,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=evc_1)
+        response = kytos_api.post(api_url, json=evc_1)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -2027,7 +2075,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=evc_2)
+        response = kytos_api.post(api_url, json=evc_2)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -2040,11 +2088,11 @@ class TestE2EMefEline:
             "test": "data"
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/metadata'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         api_url = KYTOS_API + '/mef_eline/v2/evc?metadata.test=data'
-        response = requests.get(api_url, json=payload)
+        response = kytos_api.get(api_url, json=payload)
         assert response.status_code == 200
         data = response.json()
         assert "test" in data[evc_1_id]["metadata"]
@@ -2056,18 +2104,16 @@ class TestE2EMefEline:
         evc1 = self.create_evc(100)
         time.sleep(10)
 
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["active"]
         assert data["current_path"]
 
         # shutdown NNIs and UNI a
-        self.net.net.configLinkStatus("s1", "s2", "down")
-        self.net.net.configLinkStatus("s3", "s1", "down")
-        self.net.net.configLinkStatus("s1", "h11", "down")
+        self.net.set_links_status([("s1", "s2"), ("s3", "s1"), ("s1", "h11")], "down")
 
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert not data["current_path"]
@@ -2075,7 +2121,7 @@ class TestE2EMefEline:
         # bring up only UNI, EVC should still remain not active
         self.net.net.configLinkStatus("s1", "h11", "up")
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         # pathfinder won't find a new path since UNI is part of the graph
@@ -2085,7 +2131,7 @@ class TestE2EMefEline:
         self.net.net.configLinkStatus("s1", "s2", "up")
         self.net.net.configLinkStatus("s3", "s1", "up")
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["active"]
         assert data["current_path"]
@@ -2093,7 +2139,7 @@ class TestE2EMefEline:
         # shutdown UNI a, now it should deactivate again
         self.net.net.configLinkStatus("s1", "h11", "down")
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert data["current_path"]
@@ -2101,7 +2147,7 @@ class TestE2EMefEline:
         # bring up UNI a, now it should activate
         self.net.net.configLinkStatus("s1", "h11", "up")
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["active"]
         assert data["current_path"]
@@ -2112,7 +2158,7 @@ class TestE2EMefEline:
         self.net.net.configLinkStatus("s1", "h11", "down")
 
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert not data["current_path"]
@@ -2120,7 +2166,7 @@ class TestE2EMefEline:
         # bring up a NNI, it shouldn't activate yet since UNI is still down
         self.net.net.configLinkStatus("s1", "s2", "up")
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert not data["current_path"]
@@ -2128,7 +2174,7 @@ class TestE2EMefEline:
         # bring up UNI a, now it should activate, and result in new deployment
         self.net.net.configLinkStatus("s1", "h11", "up")
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["active"]
         assert data["current_path"]
@@ -2158,14 +2204,14 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        r = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        r = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert r.status_code == 201, r.text
         data = r.json()
         evc1 = data["circuit_id"]
 
         time.sleep(10)
 
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["active"]
         assert data["current_path"]
@@ -2173,7 +2219,7 @@ class TestE2EMefEline:
         # shutdown UNI a, it should deactivate
         self.net.net.configLinkStatus('s1', 'h11', 'down')
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert data["current_path"]
@@ -2181,7 +2227,7 @@ class TestE2EMefEline:
         # shutdown NNI too, current_path should be gone too
         self.net.net.configLinkStatus('s3', 's1', 'down')
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert not data["current_path"]
@@ -2189,7 +2235,7 @@ class TestE2EMefEline:
         # bring up UNI a, it shouldn't activate yet, since NNI is down
         self.net.net.configLinkStatus('s1', 'h11', 'up')
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert not data["current_path"]
@@ -2197,7 +2243,7 @@ class TestE2EMefEline:
         # bring up NNI, it should activate
         self.net.net.configLinkStatus('s3', 's1', 'up')
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["active"]
         assert data["current_path"]
@@ -2206,7 +2252,7 @@ class TestE2EMefEline:
         self.net.net.configLinkStatus('s1', 'h11', 'down')
         self.net.net.configLinkStatus('s3', 's1', 'down')
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert not data["current_path"]
@@ -2214,7 +2260,7 @@ class TestE2EMefEline:
         # bring up NNI, it shouldn't activate since UNI is still down
         self.net.net.configLinkStatus('s3', 's1', 'up')
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert not data["active"]
         assert data["current_path"]
@@ -2222,7 +2268,7 @@ class TestE2EMefEline:
         # bring up UNI a, it should activate
         self.net.net.configLinkStatus('s1', 'h11', 'up')
         time.sleep(10)
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["active"]
         assert data["current_path"]
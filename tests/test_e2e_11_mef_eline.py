@@ -2,12 +2,21 @@ import json
 import time
 
 import pytest
-import requests
 
-from tests.helpers import NetworkTest
+from tests.helpers import (
+    KYTOS_API_PORT,
+    all_of,
+    dump_flow_table,
+    evc_active,
+    evc_current_path_changed,
+    flows_count,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % (CONTROLLER)
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 # BasicFlows
 # Each should have at least 3 flows, considering topology 'ring4':
@@ -15,8 +24,10 @@ KYTOS_API = 'http://%s:8181/api/kytos' % (CONTROLLER)
 # - 02 for amlight/coloring (node degree - number of neighbors)
 BASIC_FLOWS = 3
 
+@pytest.mark.usefixtures("db_snapshot")
 class TestE2EMefEline:
     net = None
+    topo_name = "ring4"
 
     def setup_method(self, method):
         """
@@ -29,16 +40,15 @@ class TestE2EMefEline:
         # which all elements are disabled in a clean setting
         self.net.restart_kytos_clean()
         self.net.wait_switches_connect()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name='ring4')
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_005_on_primary_path_fail_should_migrate_to_backup(self):
 
@@ -77,27 +87,33 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
-        time.sleep(10)
+        evc = wait_until(evc_active(response.json()['circuit_id']))
 
         # Command to up/down links to test if back-up path is taken
         self.net.net.configLinkStatus('s1', 's2', 'down')
 
         # Wait just a few seconds to give time to the controller receive and process the linkDown event
-        time.sleep(10)
+        wait_until(evc_current_path_changed(evc["id"], evc["current_path"]))
+        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 2),
+            flows_count(s2, BASIC_FLOWS + 2),
+            flows_count(s3, BASIC_FLOWS + 2),
+            flows_count(s4, BASIC_FLOWS + 2),
+        ))
 
         # Check on the virtual switches directly for flows
-        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        flows_s4 = s4.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 2, flows_s3
-        assert len(flows_s4.splitlines()) == BASIC_FLOWS + 2, flows_s4
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        flows_s4 = dump_flow_table(s4)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 2, str(flows_s3)
+        assert len(flows_s4) == BASIC_FLOWS + 2, str(flows_s4)
 
         # Nodes should be able to ping each other
         h1, h3 = self.net.net.get('h1', 'h3')
@@ -142,25 +158,31 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        r = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        r = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert r.status_code == 201, r.text
 
-        time.sleep(10)
+        evc = wait_until(evc_active(r.json()['circuit_id']))
 
         # Command to disable links to test if back-up path is taken with the following command:
         self.net.net.configLinkStatus('s1', 's2', 'down')
-        time.sleep(10)
+        wait_until(evc_current_path_changed(evc["id"], evc["current_path"]))
+        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 2),
+            flows_count(s2, BASIC_FLOWS + 2),
+            flows_count(s3, BASIC_FLOWS + 2),
+            flows_count(s4, BASIC_FLOWS + 2),
+        ))
 
         # Check on the virtual switches directly for flows
-        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        flows_s4 = s4.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 2, flows_s3
-        assert len(flows_s4.splitlines()) == BASIC_FLOWS + 2, flows_s4
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        flows_s4 = dump_flow_table(s4)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 2, str(flows_s3)
+        assert len(flows_s4) == BASIC_FLOWS + 2, str(flows_s4)
 
         # Nodes should be able to ping each other
         h1, h3 = self.net.net.get('h1', 'h3')
@@ -203,26 +225,32 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        r = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        r = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert r.status_code == 201, r.text
 
-        time.sleep(10)
+        evc = wait_until(evc_active(r.json()['circuit_id']))
 
         # Command to disable links to test if back-up path is taken with the following command:
         self.net.net.configLinkStatus('s1', 's2', 'down')
-        time.sleep(10)
+        wait_until(evc_current_path_changed(evc["id"], evc["current_path"]))
+        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 2),
+            flows_count(s2, BASIC_FLOWS + 2),
+            flows_count(s3, BASIC_FLOWS + 2),
+            flows_count(s4, BASIC_FLOWS + 2),
+        ))
 
         # Check on the virtual switches directly for flows
-        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        flows_s4 = s4.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        flows_s4 = dump_flow_table(s4)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 2, flows_s3
-        assert len(flows_s4.splitlines()) == BASIC_FLOWS + 2, flows_s4
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 2, str(flows_s3)
+        assert len(flows_s4) == BASIC_FLOWS + 2, str(flows_s4)
 
         # Nodes should be able to ping each other
         h1, h3 = self.net.net.get('h1', 'h3')
@@ -254,21 +282,21 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
-        time.sleep(10)
+        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
 
         # Check on the virtual switches directly for flows.
-        s1, s2, s3, s4 = self.net.net.get('s1', 's2', 's3', 's4')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        flows_s4 = s4.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS, flows_s3
-        assert len(flows_s4.splitlines()) == BASIC_FLOWS, flows_s4
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        flows_s4 = dump_flow_table(s4)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS, str(flows_s3)
+        assert len(flows_s4) == BASIC_FLOWS, str(flows_s4)
 
         # Nodes should be able to ping each other
         h1, h2 = self.net.net.get('h1', 'h2')
@@ -312,7 +340,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         data = response.json()
@@ -333,7 +361,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         data = response.json()
@@ -363,7 +391,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
         circuit_id = response.json()["circuit_id"]
@@ -373,7 +401,7 @@ class TestE2EMefEline:
         }}
 
         api_url = f'{KYTOS_API}/mef_eline/v2/evc/{circuit_id}'
-        response = requests.patch(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_035_patch_fail_not_use_vlan(self):
@@ -396,7 +424,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": False,
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
         circuit_id = response.json()["circuit_id"]
@@ -411,14 +439,14 @@ class TestE2EMefEline:
             ],}
 
         api_url = f'{KYTOS_API}/mef_eline/v2/evc/{circuit_id}'
-        response = requests.patch(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         time.sleep(5)
 
         # Check for VLAN 999
         api_url = f'{KYTOS_API}/topology/v3/interfaces/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         available_vlans = response.json()["00:00:00:00:00:00:00:03:1"]["available_tags"]["vlan"]
         assert available_vlans == [[1, 3798], [3800, 4094]]
@@ -2,12 +2,11 @@ import time
 from datetime import datetime, timedelta
 
 import pytest
-import requests
 
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, dump_flow_table, kytos_api, network_pool
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 TIME_FMT = "%Y-%m-%dT%H:%M:%S+0000"
 
@@ -17,22 +16,23 @@ TIME_FMT = "%Y-%m-%dT%H:%M:%S+0000"
 # - 02 for amlight/coloring (node degree - number of neighbors)
 BASIC_FLOWS = 3
 
+@pytest.mark.usefixtures("db_snapshot")
 class TestE2EMefEline:
     net = None
+    topo_name = "ring"
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def setup_method(self, method):
         self.net.restart_kytos_clean()
         self.net.wait_switches_connect()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @pytest.fixture()
     def circuit_id(self):
@@ -47,7 +47,7 @@ class TestE2EMefEline:
 
     def _circuit_exists(self, circuit_id):
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         return response.status_code == 200
 
     def _create_circuit(self):
@@ -62,7 +62,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         data = response.json()
@@ -79,7 +79,7 @@ class TestE2EMefEline:
             "enabled": False,
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
 
         assert response.status_code == 200, response.text
 
@@ -91,7 +91,7 @@ class TestE2EMefEline:
             masks = [circuit_id, circuit_id]
         cookies = [int(f"0xaa{mask}", 16) for mask in masks]
         api_url = f'{KYTOS_API}/flow_manager/v2/stored_flows/?cookie_range={cookies[0]}&cookie_range={cookies[1]}&state=installed'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         flows = response.json()
         total_flows_prev = 0
         for flow_list in flows.values():
@@ -112,13 +112,13 @@ class TestE2EMefEline:
 
         # verify if the circuit is really disabled
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + disabled_circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         json = response.json()
         assert json.get("enabled") is False
 
         # create circuit schedule
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         # waiting some time to trigger the scheduler
@@ -127,7 +127,7 @@ class TestE2EMefEline:
 
         # Verify if the circuit is enabled 
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + disabled_circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         json = response.json()
@@ -155,13 +155,13 @@ class TestE2EMefEline:
 
         # verify if the circuit is really disabled
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + disabled_circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         json = response.json()
         assert json.get("enabled") is False
 
         # create circuit schedule
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         # waiting some time to trigger the scheduler
@@ -170,7 +170,7 @@ class TestE2EMefEline:
 
         # Verify if the circuit is enabled 
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + disabled_circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         json = response.json()
@@ -193,12 +193,12 @@ class TestE2EMefEline:
 
         # Create circuit schedule
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         # Verify the list of schedules
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()[0]
@@ -207,18 +207,18 @@ class TestE2EMefEline:
 
         # Recover schedule id created
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         json = response.json()
         schedule_id = json.get("circuit_scheduler")[0].get("id")
 
         # Delete circuit schedule
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/' + schedule_id
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         # Verify the list of schedules
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -238,7 +238,7 @@ class TestE2EMefEline:
 
         # create circuit schedule
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         json = response.json()
         assert response.status_code == 201, response.text
 
@@ -247,7 +247,7 @@ class TestE2EMefEline:
 
         # verify if the circuit is really disabled
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + disabled_circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         json = response.json()
         assert json.get("enabled") is False
 
@@ -258,7 +258,7 @@ class TestE2EMefEline:
 
         # patch circuit schedule
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/' + schedule_id
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         assert response.status_code == 200, response.text
 
         # waiting to trigger the scheduler
@@ -267,7 +267,7 @@ class TestE2EMefEline:
 
         # Verify if the circuit is enabled
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + disabled_circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         json = response.json()
 
         assert response.status_code == 200, response.text
@@ -281,7 +281,7 @@ class TestE2EMefEline:
 
         # List all the circuits stored
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         key = next(iter(data))
@@ -290,9 +290,9 @@ class TestE2EMefEline:
 
         # Verify that the flow is in the flow table
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
         # Each switch had BASIC_FLOWS flows + 02 for the EVC (ingress + egress)
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
 
     """Error, start_date should be patched only if the Evc
     has been created under the scheduler action
@@ -305,7 +305,7 @@ class TestE2EMefEline:
         start = datetime.now() + timedelta(minutes=start_delay)
 
         # It gets EVC's data
-        response = requests.get(api_url + circuit_id)
+        response = kytos_api.get(api_url + circuit_id)
         data = response.json()
         start_date = data['start_date']
 
@@ -314,13 +314,13 @@ class TestE2EMefEline:
         }
 
         # It tries to set a new circuit's start_date
-        response = requests.patch(api_url + circuit_id, json=payload)
+        response = kytos_api.patch(api_url + circuit_id, json=payload)
         assert response.status_code == 400, response.text
 
         time.sleep(10)
 
         # It gets EVC's data
-        response = requests.get(api_url + circuit_id)
+        response = kytos_api.get(api_url + circuit_id)
         data = response.json()
         assert start_date == data['start_date']
 
@@ -342,10 +342,10 @@ class TestE2EMefEline:
 
         # create circuit schedule
         api_url = KYTOS_API + '/mef_eline/v2/evc/schedule/'
-        requests.post(api_url, json=payload)
+        kytos_api.post(api_url, json=payload)
 
         # It verifies circuit schedule data
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         schedule_id = data[0]['schedule_id']
 
@@ -357,14 +357,14 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's start_date
-        response = requests.patch(api_url + schedule_id, json=payload2)
+        response = kytos_api.patch(api_url + schedule_id, json=payload2)
         assert response.status_code == 200, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.get(api_url + disabled_circuit_id)
+        response = kytos_api.get(api_url + disabled_circuit_id)
         data = response.json()
         assert data['start_date'] == start.strftime(TIME_FMT)
 
@@ -373,7 +373,7 @@ class TestE2EMefEline:
 
         # Delete the circuit
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         time.sleep(10)
@@ -381,33 +381,33 @@ class TestE2EMefEline:
         # Verify circuit removal by
         # listing all the circuits stored
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data == {}
 
         # Verify that the flow is not in the flow table
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
         # Each switch had BASIC_FLOWS flows + 02 for the EVC (ingress + egress)
         # at this point the flow number should be reduced to BASIC_FLOWS
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
 
         payload = {"enabled": False}
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         assert response.status_code == 404, response.text
 
     def test_intra_evc_uni_enabled(self):
         """ Test if the UNI of an intra-EVC circuit is enabled. """
         api_url = KYTOS_API + f'/topology/v3/switches/00:00:00:00:00:00:00:01/disable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         circuit_id = self._create_circuit()
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data['enabled'] is True
@@ -415,37 +415,37 @@ class TestE2EMefEline:
         assert self.get_mef_eline_flow_number(circuit_id) == 0
 
         api_url = KYTOS_API + f'/topology/v3/switches/00:00:00:00:00:00:00:01/enable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
         for i in [1, 2]:
             api_url = KYTOS_API + f'/topology/v3/interfaces/00:00:00:00:00:00:00:01:{i}/enable'
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 200, response.text
         time.sleep(10)
         assert self.get_mef_eline_flow_number(circuit_id) == 2
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.patch(api_url, json={"enabled": False})
+        response = kytos_api.patch(api_url, json={"enabled": False})
         assert response.status_code == 200, response.text
 
         assert self.get_mef_eline_flow_number(circuit_id) == 0
 
         api_url = KYTOS_API + f'/topology/v3/switches/00:00:00:00:00:00:00:01/disable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/' + circuit_id
-        response = requests.patch(api_url, json={"enabled": True})
+        response = kytos_api.patch(api_url, json={"enabled": True})
         assert response.status_code == 200, response.text
 
         assert self.get_mef_eline_flow_number(circuit_id) == 0
 
         api_url = KYTOS_API + f'/topology/v3/switches/00:00:00:00:00:00:00:01/enable'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 201, response.text
         for i in [1, 2]:
             api_url = KYTOS_API + f'/topology/v3/interfaces/00:00:00:00:00:00:00:01:{i}/enable'
-            response = requests.post(api_url)
+            response = kytos_api.post(api_url)
             assert response.status_code == 200, response.text
 
         time.sleep(10)
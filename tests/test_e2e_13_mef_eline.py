@@ -3,18 +3,18 @@ import time
 from datetime import datetime
 
 import pytest
-import requests
 
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, evc_active, kytos_api, network_pool, wait_until
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 TIME_FMT = "%Y-%m-%dT%H:%M:%S+0000"
 
 
 class TestE2EMefEline:
     net = None
+    topo_name = "ring"
     evcs = {}
 
     def setup_method(self, method):
@@ -27,16 +27,15 @@ class TestE2EMefEline:
         # Start the controller setting an environment in
         # which all elements are disabled in a clean setting
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def create_evc(self, vlan_id, store=False):
         payload = {
@@ -53,7 +52,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         if store:
             self.evcs[vlan_id] = data['circuit_id']
@@ -63,10 +62,10 @@ class TestE2EMefEline:
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
         evc1 = self.create_evc(100)
 
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         primary_path = data['primary_path']
 
@@ -78,12 +77,12 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1 + "A", data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1 + "A", data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 404, response.text
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data2 = response.json()
         assert data == data2
 
@@ -96,8 +95,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_015_patch_an_inconsistent_uni_a(self):
@@ -113,8 +112,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_020_patch_an_inconsistent_uni_a(self):
@@ -130,8 +129,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_030_patch_an_inconsistent_uni_a(self):
@@ -151,8 +150,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_035_patch_an_inconsistent_uni_a(self):
@@ -172,8 +171,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_040_patch_an_inconsistent_uni_a(self):
@@ -193,8 +192,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_045_patch_an_inconsistent_uni_a(self):
@@ -214,8 +213,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_050_patch_an_inconsistent_uni_a(self):
@@ -235,8 +234,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_a
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     # TODO
@@ -253,8 +252,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_065_patch_an_inconsistent_uni_z(self):
@@ -270,8 +269,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_070_patch_an_inconsistent_uni_z(self):
@@ -287,8 +286,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_080_patch_an_inconsistent_uni_z(self):
@@ -308,8 +307,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_085_patch_an_inconsistent_uni_z(self):
@@ -329,8 +328,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_090_patch_an_inconsistent_uni_z(self):
@@ -350,8 +349,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_095_patch_an_inconsistent_uni_z(self):
@@ -371,8 +370,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_100_patch_an_inconsistent_uni_z(self):
@@ -392,8 +391,8 @@ class TestE2EMefEline:
         }
 
         # It tries to setting up a new uni_z
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_105_patch_an_inconsistent_primary_path(self):
@@ -412,8 +411,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -425,13 +424,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -458,8 +457,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -471,13 +470,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         paths = []
         for _path in data['primary_path']:
@@ -505,8 +504,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         evc1 = data['circuit_id']
@@ -516,14 +515,14 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['primary_path'] != []
         assert data['active'] is True
@@ -550,8 +549,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         evc1 = data['circuit_id']
@@ -564,13 +563,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -603,8 +602,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -616,13 +615,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -650,8 +649,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -663,13 +662,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -697,8 +696,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -710,13 +709,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -750,8 +749,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -763,13 +762,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -803,8 +802,8 @@ class TestE2EMefEline:
                  "endpoint_b": {"id": "00:00:00:00:00:00:00:02:2"}}
             ]
         }
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
@@ -816,14 +815,14 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's primary_path
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         time.sleep(10)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
 
         paths = []
@@ -839,7 +838,7 @@ class TestE2EMefEline:
         evc1 = self.create_evc(100)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         creation_time = data['creation_time']
 
@@ -849,13 +848,13 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's creation_time
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         time.sleep(10)
 
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['creation_time'] == creation_time
 
@@ -868,12 +867,12 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's creation_time
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['active'] is True
 
@@ -887,12 +886,12 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's creation_time
-        response = requests.patch(api_url + evc1, data=json.dumps(payload),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['request_time'] != start.strftime(TIME_FMT)
 
@@ -910,12 +909,12 @@ class TestE2EMefEline:
             }
         }
 
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         data = response.json()
         evc1 = data['circuit_id']
 
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         payload2 = {
             "current_path": [
@@ -927,14 +926,14 @@ class TestE2EMefEline:
         }
 
         # It sets a new circuit's creation_time
-        response = requests.patch(api_url + evc1, data=json.dumps(payload2),
-                                  headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url + evc1, data=json.dumps(payload2),
+                                   headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
         time.sleep(10)
 
         # It verifies EVC's current_path
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data["current_path"][0]["active"] is True
 
@@ -943,16 +942,16 @@ class TestE2EMefEline:
         payload = {
             "unknown_tag": "my evc1",
         }
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
 
         assert response.status_code == 400, response.text
 
     def test_175_post_empty_json(self):
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
         payload = {}
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_180_post_unknown_port_on_interface(self):
@@ -969,8 +968,8 @@ class TestE2EMefEline:
             }
         }
 
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_185_post_unknown_interface(self):
@@ -987,8 +986,8 @@ class TestE2EMefEline:
             }
         }
 
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_190_post_an_evc_twice(self):
@@ -1005,12 +1004,12 @@ class TestE2EMefEline:
             }
         }
 
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
 
-        response = requests.post(api_url, data=json.dumps(payload1),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload1),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 409, response.text
 
     def test_195_get_unknown_circuit(self):
@@ -1018,7 +1017,7 @@ class TestE2EMefEline:
         evc1 = self.create_evc(100)
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1 + "A")
+        response = kytos_api.get(api_url + evc1 + "A")
         assert response.status_code == 404, response.text
 
     def test_200_post_on_dynamic_backup_path_and_backup_path(self):
@@ -1041,7 +1040,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_205_post_on_false_dynamic_backup_path_and_empty_primary_path(self):
@@ -1061,7 +1060,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_210_post_on_false_dynamic_backup_path_and_none_primary_path(self):
@@ -1080,7 +1079,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_215_post_on_none_dynamic_backup_path_and_empty_primary_path(self):
@@ -1099,7 +1098,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_220_post_on_none_dynamic_backup_path_and_none_primary_path(self):
@@ -1117,7 +1116,7 @@ class TestE2EMefEline:
         }
 
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     # TODO tests over primary_links and backup_links
@@ -1,15 +1,22 @@
 import time
 
 import pytest
-import requests
 
-from tests.helpers import NetworkTest
+from tests.helpers import (
+    KYTOS_API_PORT,
+    KYTOS_OF_PORT,
+    evc_active,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api' % (CONTROLLER, KYTOS_API_PORT)
 
 class TestE2EMefEline:
     net = None
+    topo_name = "amlight"
 
     def setup_method(self, method):
         """
@@ -21,18 +28,16 @@ class TestE2EMefEline:
         # Start the controller setting an environment in
         # which all elements are disabled in a clean setting
         self.net.restart_kytos_clean()
-        self.net.wait_kytos_links(status="UP")
+        self.net.wait_kytos_converged()
         self.net.wait_kytos_buff_low_usage()
-        time.sleep(5)
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name='amlight')
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def wait_sdntrace_result(self, trace_id:int, timeout=30):
         """Wait until sdntrace finishes."""
@@ -40,7 +45,7 @@ class TestE2EMefEline:
         while wait_count < timeout:
             try:
                 api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-                response = requests.get(f"{api_url}/{trace_id}")
+                response = kytos_api.get(f"{api_url}/{trace_id}")
                 data = response.json()
                 assert data["result"][-1]["reason"] == "done"
                 break
@@ -61,18 +66,14 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         return data["result"]["trace_id"]
 
     def delete_evc(self, circuit_id) -> dict:
         """Delete an EVC."""
-        api_url = f"{KYTOS_API}/kytos/mef_eline/v2/evc/{circuit_id}"
-        response = requests.delete(api_url)
-        assert response.status_code == 200, response.text
-        data = response.json()
-        return data
+        return kytos_api.delete_evc(circuit_id)
 
     def create_evc(
         self,
@@ -107,10 +108,7 @@ class TestE2EMefEline:
             payload.update(kwargs)
         times = 0
         while times < max_retries:
-            api_url = KYTOS_API + '/kytos/mef_eline/v2/evc/'
-            response = requests.post(api_url, json=payload)
-            data = response.json()
-            assert response.status_code == 201, response.text
+            data = kytos_api.create_evc(payload)
             if data["deployed"] is True:
                 break
             time.sleep(wait_time)
@@ -124,17 +122,14 @@ class TestE2EMefEline:
         return data['circuit_id']
 
     def get_evc_data(self, evc_id:str) -> dict:
-        api_url = KYTOS_API + '/kytos/mef_eline/v2/evc/' + evc_id
-        response = requests.get(api_url)
-        assert response.status_code == 200, response.text
-        return response.json()
+        return kytos_api.get_evc(evc_id)
     
     def redeploy_evc(self, evc_id, try_avoid_same_s_vlan=True):
         str_avoid_vlan = "false"
         if try_avoid_same_s_vlan:
             str_avoid_vlan = "true"
         api_url = f"{KYTOS_API}/kytos/mef_eline/v2/evc/{evc_id}/redeploy?try_avoid_same_s_vlan={str_avoid_vlan}"
-        response = requests.patch(api_url)
+        response = kytos_api.patch(api_url)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -153,10 +148,10 @@ class TestE2EMefEline:
                                vlan_id=100,
                                max_paths=10)
 
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         # It verifies EVC's data
-        response = requests.get(api_url + evc1)
+        response = kytos_api.get(api_url + evc1)
         data = response.json()
         assert data['enabled'] == True
         assert data['active'] == True
@@ -179,7 +174,7 @@ class TestE2EMefEline:
                                uni_z='00:00:00:00:00:00:00:17:16',
                                vlan_id=100)
         
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         evc_data = self.get_evc_data(evc1)
         old_path_dict = self.get_link_vlan_dict_from_path(evc_data["current_path"])
@@ -217,7 +212,7 @@ class TestE2EMefEline:
                                vlan_id=100,
                                primary_path=primary_path)
         
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         evc_data = self.get_evc_data(evc1)
         old_path_dict = self.get_link_vlan_dict_from_path(evc_data["current_path"])
@@ -270,7 +265,7 @@ class TestE2EMefEline:
                                primary_path=primary_path,
                                backup_path=backup_path)
         
-        time.sleep(10)
+        wait_until(evc_active(evc1))
 
         evc_data = self.get_evc_data(evc1)
         old_path_dict = self.get_link_vlan_dict_from_path(evc_data["current_path"])
@@ -324,22 +319,17 @@ class TestE2EMefEline:
         assert evc_content["enabled"]
         assert evc_content["active"]
 
-        Ampath1 = None
-        switches:list = self.net.net.switches
-        for switch in switches:
-            if switch.name == "Ampath1":
-                Ampath1 = switch
-                break
+        Ampath1 = self.net.net.get("Ampath1")
 
         # Deployment to primary_path
-        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:6654")
+        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:{KYTOS_OF_PORT + 1}")
         api_url = f"{KYTOS_API}/kytos/mef_eline/v2/evc/{evc}/redeploy"
-        response = requests.patch(api_url)
+        response = kytos_api.patch(api_url)
         assert response.status_code == 409, response.text
         evc_content = self.get_evc_data(evc)
         assert not evc_content["current_path"]
         self.net.net.configLinkStatus('Ampath1', 'Ampath3', 'down')
-        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:6653")
+        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:{KYTOS_OF_PORT}")
         self.net.wait_switches_connect()
         self.net.wait_kytos_links('Ampath1', 'Ampath3', status="DOWN")
         time.sleep(5)
@@ -356,16 +346,16 @@ class TestE2EMefEline:
             assert current["endpoint_b"]["id"] == primary["endpoint_b"]["id"]
 
         # Deployment to backup_path
-        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:6654")
+        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:{KYTOS_OF_PORT + 1}")
         api_url = f"{KYTOS_API}/kytos/mef_eline/v2/evc/{evc}/redeploy"
-        response = requests.patch(api_url)
+        response = kytos_api.patch(api_url)
         assert response.status_code == 409, response.text
         evc_content = self.get_evc_data(evc)
         assert not evc_content["current_path"]
         # Disable primary_path middle switch
         self.net.net.configLinkStatus('Ampath1', 'Ampath4', 'down')
         self.net.net.configLinkStatus('Ampath1', 'Ampath3', 'down')
-        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:6653")
+        Ampath1.vsctl(f"set-controller {Ampath1.name} tcp:127.0.0.1:{KYTOS_OF_PORT}")
         time.sleep(10)
         self.net.net.configLinkStatus('Ampath1', 'Ampath3', 'up')
         self.net.wait_kytos_links('Ampath1', 'Ampath3', status="UP")
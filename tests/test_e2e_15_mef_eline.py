@@ -2,32 +2,37 @@ import json
 import time
 import random
 
-import requests
-
-from tests.helpers import NetworkTest
+from tests.helpers import (
+    KYTOS_API_PORT,
+    dump_flow_table,
+    evc_active,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = "127.0.0.1"
-KYTOS_API = "http://%s:8181/api/kytos" % CONTROLLER
+KYTOS_API = "http://%s:%d/api/kytos" % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2EMefEline:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         """
         It is called at the beginning of every class method execution
         """
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="ring")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def restart(self, _clean_config=False, _enable_all=True):
         self.net.start_controller(clean_config=_clean_config, enable_all=_enable_all)
@@ -54,7 +59,7 @@ class TestE2EMefEline:
 
         for link_id, metadata in links_metadata.items():
             api_url = f"{KYTOS_API}/topology/v3/links/{link_id}/metadata"
-            response = requests.post(
+            response = kytos_api.post(
                 api_url,
                 data=json.dumps(metadata),
                 headers={"Content-type": "application/json"},
@@ -81,27 +86,15 @@ class TestE2EMefEline:
             payload.update({"primary_constraints": primary_constraints})
         if secondary_constraints:
             payload.update({"secondary_constraints": secondary_constraints})
-        api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
-        assert response.status_code == 201, response.text
-        data = response.json()
-        return data["circuit_id"]
+        return kytos_api.create_evc(payload)["circuit_id"]
 
     def update_evc(self, circuit_id: str, **kwargs) -> dict:
         """Update an EVC."""
-        api_url = f"{KYTOS_API}/mef_eline/v2/evc/{circuit_id}"
-        response = requests.patch(api_url, json=kwargs)
-        assert response.status_code == 200, response.text
-        data = response.json()
-        return data
+        return kytos_api.update_evc(circuit_id, kwargs)
 
     def delete_evc(self, circuit_id) -> dict:
         """Delete an EVC."""
-        api_url = f"{KYTOS_API}/mef_eline/v2/evc/{circuit_id}"
-        response = requests.delete(api_url)
-        assert response.status_code == 200, response.text
-        data = response.json()
-        return data
+        return kytos_api.delete_evc(circuit_id)
 
     def test_002_update_uni(self):
         """Test when a uni is updated"""
@@ -111,8 +104,8 @@ class TestE2EMefEline:
             uni_z="00:00:00:00:00:00:00:03:1",
             vlan_id=100,
         )
-        time.sleep(10)
-        response = requests.get(api_url + evc_id)
+        wait_until(evc_active(evc_id))
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["enabled"]
         assert data["active"]
@@ -126,7 +119,7 @@ class TestE2EMefEline:
             },
         )
         time.sleep(10)
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["uni_z"]["interface_id"] == "00:00:00:00:00:00:00:02:1"
 
@@ -166,7 +159,7 @@ class TestE2EMefEline:
         )
 
         time.sleep(10)
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["enabled"]
         assert data["active"]
@@ -199,7 +192,7 @@ class TestE2EMefEline:
             },
         )
         time.sleep(10)
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["enabled"]
         assert data["active"]
@@ -234,7 +227,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=evc_1)
+        response = kytos_api.post(api_url, json=evc_1)
         assert response.status_code == 201, response.text
         assert 'circuit_id' in response.json()
 
@@ -242,7 +235,7 @@ class TestE2EMefEline:
 
         # Verify if EVC tag has been allocated
         topo_url = KYTOS_API + "/topology/v3/interfaces/tag_ranges"
-        response = requests.get(topo_url)
+        response = kytos_api.get(topo_url)
         data = response.json()
         actual = data["00:00:00:00:00:00:00:02:1"]["available_tags"]["vlan"]
         actual_tr = data["00:00:00:00:00:00:00:02:1"]["tag_ranges"]["vlan"]
@@ -268,7 +261,7 @@ class TestE2EMefEline:
                 "interface_id": "00:00:00:00:00:00:00:02:2",
             }
         }
-        response = requests.post(api_url, json=evc_2)
+        response = kytos_api.post(api_url, json=evc_2)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -276,7 +269,7 @@ class TestE2EMefEline:
 
         # Verify if EVC tag has been allocated
         topo_url = KYTOS_API + "/topology/v3/interfaces/tag_ranges"
-        response = requests.get(topo_url)
+        response = kytos_api.get(topo_url)
         data = response.json()
         actual = data["00:00:00:00:00:00:00:02:2"]["available_tags"]["vlan"]
         expected = [[1, 99], [101, 199], [201, 3798], [3800, 4094]]
@@ -306,12 +299,12 @@ class TestE2EMefEline:
                 "interface_id": "00:00:00:00:00:00:00:02:1",
             },
         }
-        response = requests.patch(api_url+evc_2_id, json=payload)
+        response = kytos_api.patch(api_url+evc_2_id, json=payload)
         assert response.status_code == 400, response.text
 
         # Verify that patch has not allocated a tag
         topo_url = KYTOS_API + "/topology/v3/interfaces/tag_ranges"
-        response = requests.get(topo_url)
+        response = kytos_api.get(topo_url)
         data = response.json()
         actual = data["00:00:00:00:00:00:00:02:1"]["available_tags"]["vlan"]
         expected = [[1, 99], [101, 3798], [3800, 4094]]
@@ -341,14 +334,14 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         time.sleep(5)
 
         intf_id = '00:00:00:00:00:00:00:01:1'
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert response.status_code == 200, response.text
 
@@ -361,7 +354,7 @@ class TestE2EMefEline:
             "tag_ranges": [[1, 180], [300, 3500]]
         }
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 400, response.text
 
         # Every used tag included
@@ -370,11 +363,11 @@ class TestE2EMefEline:
             "tag_ranges": [[200, 4000]]
         }
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 200, response.text
 
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert response.status_code == 200, response.text
 
@@ -396,7 +389,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 400, response.text
 
         # EVC with available tag
@@ -414,12 +407,12 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         intf_id = '00:00:00:00:00:00:00:01:1'
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert response.status_code == 200, response.text
 
@@ -442,7 +435,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         circuit_id = response.json()["circuit_id"]
 
@@ -451,14 +444,14 @@ class TestE2EMefEline:
         expected = [[1, 9], [16, 3798], [3800, 4094]]
         intf_id = '00:00:00:00:00:00:00:01:1'
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert response.status_code == 200, response.text
         assert expected == data[intf_id]["available_tags"]["vlan"]
 
         intf_id = '00:00:00:00:00:00:00:02:1'
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert response.status_code == 200, response.text
         assert expected == data[intf_id]["available_tags"]["vlan"]
@@ -474,25 +467,25 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + f'/mef_eline/v2/evc/{circuit_id}'
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         assert response.status_code == 400, response.text
 
         payload["uni_z"]["tag"]["value"] = [[12, 21]]
         api_url = KYTOS_API + f'/mef_eline/v2/evc/{circuit_id}'
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         assert response.status_code == 200, response.text
 
         expected = [[1, 11], [22, 3798], [3800, 4094]]
         intf_id = '00:00:00:00:00:00:00:01:1'
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert response.status_code == 200, response.text
         assert expected == data[intf_id]["available_tags"]["vlan"]
 
         intf_id = '00:00:00:00:00:00:00:02:1'
         api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert response.status_code == 200, response.text
         assert expected == data[intf_id]["available_tags"]["vlan"]
@@ -501,16 +494,16 @@ class TestE2EMefEline:
 
         # Flows created with masks, 12/4092, 16/4092, 20/4094
         s1, s2 = self.net.net.get('s1', 's2')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == 8, flows_s1
-        assert 'in_port=1,vlan_tci=0x100c/0x1ffc' in flows_s1
-        assert 'in_port=1,vlan_tci=0x1010/0x1ffc' in flows_s1
-        assert 'in_port=1,vlan_tci=0x1014/0x1ffe' in flows_s1
-        assert len(flows_s2.splitlines()) == 8, flows_s2
-        assert 'in_port=1,vlan_tci=0x100c/0x1ffc' in flows_s2
-        assert 'in_port=1,vlan_tci=0x1010/0x1ffc' in flows_s2
-        assert 'in_port=1,vlan_tci=0x1014/0x1ffe' in flows_s2
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s1) == 8, str(flows_s1)
+        assert flows_s1.find(in_port="1", vlan_tci="0x100c/0x1ffc"), str(flows_s1)
+        assert flows_s1.find(in_port="1", vlan_tci="0x1010/0x1ffc"), str(flows_s1)
+        assert flows_s1.find(in_port="1", vlan_tci="0x1014/0x1ffe"), str(flows_s1)
+        assert len(flows_s2) == 8, str(flows_s2)
+        assert flows_s2.find(in_port="1", vlan_tci="0x100c/0x1ffc"), str(flows_s2)
+        assert flows_s2.find(in_port="1", vlan_tci="0x1010/0x1ffc"), str(flows_s2)
+        assert flows_s2.find(in_port="1", vlan_tci="0x1014/0x1ffe"), str(flows_s2)
 
         h11, h2 = self.net.net.get('h11', 'h2')
         # Ping mask 12/4092
@@ -559,7 +552,7 @@ class TestE2EMefEline:
             "00:00:00:00:00:00:00:03:3"
         ):
             api_url = KYTOS_API + f'/topology/v3/interfaces/{intf_id}/tag_ranges'
-            response = requests.post(api_url, json=payload)
+            response = kytos_api.post(api_url, json=payload)
             assert response.status_code == 200, response.text
 
         evc_1 = {
@@ -591,7 +584,7 @@ class TestE2EMefEline:
             ]
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=evc_1)
+        response = kytos_api.post(api_url, json=evc_1)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -599,7 +592,7 @@ class TestE2EMefEline:
 
         # Verify that tags haven't been allocated
         topo_url = KYTOS_API + "/topology/v3/interfaces/tag_ranges"
-        response = requests.get(topo_url)
+        response = kytos_api.get(topo_url)
         data = response.json()
         expected = [[1, 3798], [3800, 4094]]
         for intf_id in (
@@ -2,32 +2,30 @@ import json
 import time
 import random
 
-import requests
-
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, dump_flow_table, kytos_api, network_pool
 
 CONTROLLER = "127.0.0.1"
-KYTOS_API = "http://%s:8181/api/kytos" % CONTROLLER
+KYTOS_API = "http://%s:%d/api/kytos" % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2EMefEline:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         """
         It is called at the beginning of every class method execution
         """
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="ring")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def restart(self, _clean_config=False, _enable_all=True):
         self.net.start_controller(clean_config=_clean_config, enable_all=_enable_all)
@@ -54,7 +52,7 @@ class TestE2EMefEline:
 
         for link_id, metadata in links_metadata.items():
             api_url = f"{KYTOS_API}/topology/v3/links/{link_id}/metadata"
-            response = requests.post(
+            response = kytos_api.post(
                 api_url,
                 data=json.dumps(metadata),
                 headers={"Content-type": "application/json"},
@@ -81,27 +79,15 @@ class TestE2EMefEline:
             payload.update({"primary_constraints": primary_constraints})
         if secondary_constraints:
             payload.update({"secondary_constraints": secondary_constraints})
-        api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
-        assert response.status_code == 201, response.text
-        data = response.json()
-        return data["circuit_id"]
+        return kytos_api.create_evc(payload)["circuit_id"]
 
     def update_evc(self, circuit_id: str, **kwargs) -> dict:
         """Update an EVC."""
-        api_url = f"{KYTOS_API}/mef_eline/v2/evc/{circuit_id}"
-        response = requests.patch(api_url, json=kwargs)
-        assert response.status_code == 200, response.text
-        data = response.json()
-        return data
+        return kytos_api.update_evc(circuit_id, kwargs)
 
     def delete_evc(self, circuit_id) -> dict:
         """Delete an EVC."""
-        api_url = f"{KYTOS_API}/mef_eline/v2/evc/{circuit_id}"
-        response = requests.delete(api_url)
-        assert response.status_code == 200, response.text
-        data = response.json()
-        return data
+        return kytos_api.delete_evc(circuit_id)
 
     def test_001_not_ownership(self):
         """Test to create -> update with constraints."""
@@ -129,7 +115,7 @@ class TestE2EMefEline:
         )
 
         time.sleep(10)
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["enabled"]
         assert data["active"]
@@ -162,7 +148,7 @@ class TestE2EMefEline:
             },
         )
         time.sleep(10)
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["enabled"]
         assert data["active"]
@@ -192,7 +178,7 @@ class TestE2EMefEline:
         time.sleep(10)
         
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["failover_path"]
         assert (data["failover_path"][0]["endpoint_a"]["id"] ==
@@ -206,44 +192,44 @@ class TestE2EMefEline:
                 
 
         s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
 
-        assert len(flows_s1.splitlines()) == 6, flows_s1
-        assert len(flows_s2.splitlines()) == 6, flows_s2
-        assert len(flows_s3.splitlines()) == 5, flows_s3
+        assert len(flows_s1) == 6, str(flows_s1)
+        assert len(flows_s2) == 6, str(flows_s2)
+        assert len(flows_s3) == 5, str(flows_s3)
 
         url = f"{KYTOS_API}/topology/v3/interfaces/00:00:00:00:00:00:00:03:3/disable"
-        response = requests.post(url, headers={"Content-type": "application/json"})
+        response = kytos_api.post(url, headers={"Content-type": "application/json"})
         assert response.status_code == 200, response.text
         time.sleep(10)
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert not data["failover_path"]
 
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == 4, flows_s1
-        assert len(flows_s2.splitlines()) == 5, flows_s2
-        assert len(flows_s3.splitlines()) == 2, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == 4, str(flows_s1)
+        assert len(flows_s2) == 5, str(flows_s2)
+        assert len(flows_s3) == 2, str(flows_s3)
 
 
         url = f"{KYTOS_API}/topology/v3/interfaces/00:00:00:00:00:00:00:03:3/enable"
-        response = requests.post(url, headers={"Content-type": "application/json"})
+        response = kytos_api.post(url, headers={"Content-type": "application/json"})
         assert response.status_code == 200, response.text
 
         link_id = "c8b55359990f89a5849813dc348d30e9e1f991bad1dcb7f82112bd35429d9b07"
         url = f"{KYTOS_API}/topology/v3/links/{link_id}/enable"
-        response = requests.post(url, headers={"Content-type": "application/json"})
+        response = kytos_api.post(url, headers={"Content-type": "application/json"})
         assert response.status_code == 201, response.text
         time.sleep(10)
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
         assert data["failover_path"]
         assert (data["failover_path"][0]["endpoint_a"]["id"] ==
@@ -255,9 +241,9 @@ class TestE2EMefEline:
         assert (data["failover_path"][1]["endpoint_b"]["id"] ==
                 "00:00:00:00:00:00:00:03:2")
 
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == 6, flows_s1
-        assert len(flows_s2.splitlines()) == 6, flows_s2
-        assert len(flows_s3.splitlines()) == 5, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == 6, str(flows_s1)
+        assert len(flows_s2) == 6, str(flows_s2)
+        assert len(flows_s3) == 5, str(flows_s3)
@@ -4,12 +4,10 @@ import time
 import random
 from collections import defaultdict
 
-import requests
-
-from .helpers import NetworkTest
+from .helpers import KYTOS_API_PORT, kytos_api, network_pool
 
 CONTROLLER = "127.0.0.1"
-KYTOS_API = "http://%s:8181/api/kytos" % CONTROLLER
+KYTOS_API = "http://%s:%d/api/kytos" % (CONTROLLER, KYTOS_API_PORT)
 
 class LinkID(str):
     """Link Identifier"""
@@ -30,6 +28,7 @@ class LinkID(str):
 
 class TestE2EMefEline:
     net = None
+    topo_name = "multi"
 
     def setup_method(self, method):
         """
@@ -40,16 +39,15 @@ class TestE2EMefEline:
         self.net.config_all_links_up()
         # Start the controller with all elements enabled and clean database
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="multi")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_001_link_down(self):
         """Test link down behaviour."""
@@ -66,7 +64,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
 
         assert response.status_code == 201, response.text
 
@@ -76,7 +74,7 @@ class TestE2EMefEline:
         time.sleep(10)
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["current_path"]
@@ -106,7 +104,7 @@ class TestE2EMefEline:
         # EVC should be enabled but not active
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["enabled"]
@@ -119,7 +117,7 @@ class TestE2EMefEline:
 
         api_url = f"{KYTOS_API}/topology/v3/interfaces/tag_ranges"
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         assert response.ok, response.text
 
@@ -150,7 +148,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
 
         assert response.status_code == 201, response.text
 
@@ -160,7 +158,7 @@ class TestE2EMefEline:
         time.sleep(10)
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["current_path"]
@@ -188,7 +186,7 @@ class TestE2EMefEline:
         # EVC should be enabled but not active
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["enabled"]
@@ -201,7 +199,7 @@ class TestE2EMefEline:
 
         api_url = f"{KYTOS_API}/topology/v3/interfaces/tag_ranges"
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         assert response.ok, response.text
 
@@ -231,7 +229,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
 
         assert response.status_code == 201, response.text
 
@@ -241,7 +239,7 @@ class TestE2EMefEline:
         time.sleep(10)
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["current_path"]
@@ -269,7 +267,7 @@ class TestE2EMefEline:
         # EVC should be enabled but not active
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["enabled"]
@@ -282,7 +280,7 @@ class TestE2EMefEline:
 
         api_url = f"{KYTOS_API}/topology/v3/interfaces/tag_ranges"
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         assert response.ok, response.text
 
@@ -312,7 +310,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
 
         assert response.status_code == 201, response.text
 
@@ -322,7 +320,7 @@ class TestE2EMefEline:
         time.sleep(10)
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["current_path"]
@@ -353,7 +351,7 @@ class TestE2EMefEline:
         # EVC should be enabled but not active
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["enabled"]
@@ -366,7 +364,7 @@ class TestE2EMefEline:
 
         api_url = f"{KYTOS_API}/topology/v3/interfaces/tag_ranges"
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         assert response.ok, response.text
 
@@ -400,7 +398,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
 
         assert response.status_code == 201, response.text
 
@@ -410,7 +408,7 @@ class TestE2EMefEline:
         time.sleep(10)
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["current_path"]
@@ -428,7 +426,7 @@ class TestE2EMefEline:
         cookie = int(f"0xaa{evc_id}", 16)
 
         stored_flows = f'{KYTOS_API}/flow_manager/v2/stored_flows/?cookie_range={cookie}&cookie_range={cookie}&state=installed'
-        response = requests.get(stored_flows)
+        response = kytos_api.get(stored_flows)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data
@@ -441,7 +439,7 @@ class TestE2EMefEline:
         # EVC should be enabled but not active
 
         api_url = KYTOS_API + "/mef_eline/v2/evc/"
-        response = requests.get(api_url + evc_id)
+        response = kytos_api.get(api_url + evc_id)
         data = response.json()
 
         assert data["enabled"]
@@ -452,7 +450,7 @@ class TestE2EMefEline:
         # Check that all related flows have been removed
 
         stored_flows = f'{KYTOS_API}/flow_manager/v2/stored_flows/?cookie_range={cookie}&cookie_range={cookie}&state=installed'
-        response = requests.get(stored_flows)
+        response = kytos_api.get(stored_flows)
         assert response.status_code == 200, response.text
         data = response.json()
         assert not data
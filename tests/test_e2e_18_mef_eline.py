@@ -1,38 +1,31 @@
-import requests
 import time
 from datetime import datetime, timedelta, UTC, timezone
 
-
-from .helpers import NetworkTest
+from .helpers import KYTOS_API_PORT, kytos_api, network_pool
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api' % (CONTROLLER, KYTOS_API_PORT)
 
 TIME_FMT = "%Y-%m-%dT%H:%M:%S+0000"
 
 class TestE2EMefEline:
     net = None
+    topo_name = "ring"
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="ring")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def setup_method(self, method):
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     def teardown_method(self, method):
-        for link in self.net.net.links:
-            self.net.net.configLinkStatus(
-                link.intf1.node.name,
-                link.intf2.node.name,
-                "up"
-            )
+        self.net.config_all_links_up()
 
     def get_mef_eline_flow_number(self, circuit_id=None):
         masks = ['ffffffffffffff', '00000000000000']
@@ -40,7 +33,7 @@ class TestE2EMefEline:
             masks = [circuit_id, circuit_id]
         cookies = [int(f"0xaa{mask}", 16) for mask in masks]
         api_url = f'{KYTOS_API}/kytos/flow_manager/v2/stored_flows/?cookie_range={cookies[0]}&cookie_range={cookies[1]}&state=installed'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         flows = response.json()
         total_flows_prev = 0
         for flow_list in flows.values():
@@ -49,7 +42,7 @@ class TestE2EMefEline:
 
     def assert_tag_used_by_interface(self, interface_id, tag_type, value):
         api_url = KYTOS_API + "/kytos/topology/v3/interfaces/tag_ranges"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -68,7 +61,7 @@ class TestE2EMefEline:
 
     def assert_tag_not_used_by_interface(self, interface_id, tag_type, value):
         api_url = KYTOS_API + "/kytos/topology/v3/interfaces/tag_ranges"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -105,7 +98,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
 
@@ -116,7 +109,7 @@ class TestE2EMefEline:
 
         # Config disable new uni_a
         api_url = KYTOS_API + "/kytos/topology/v3/interfaces/00:00:00:00:00:00:00:01:2/disable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         # Try to patch to new uni_a
@@ -130,7 +123,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         
         assert response.status_code == 200, response.text
 
@@ -148,7 +141,7 @@ class TestE2EMefEline:
         )
 
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         assert response.status_code == 200, response.text
 
@@ -176,7 +169,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
 
@@ -187,7 +180,7 @@ class TestE2EMefEline:
 
         # Config disable new uni_z
         api_url = KYTOS_API + "/kytos/topology/v3/interfaces/00:00:00:00:00:00:00:01:2/disable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         # Try to patch to new uni_z
@@ -201,7 +194,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         
         assert response.status_code == 200, response.text
 
@@ -219,7 +212,7 @@ class TestE2EMefEline:
         )
 
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
 
         data = response.json()
@@ -246,7 +239,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
 
@@ -254,7 +247,7 @@ class TestE2EMefEline:
 
         # Disable current uni_a
         api_url = KYTOS_API + "/kytos/topology/v3/interfaces/00:00:00:00:00:00:00:01:1/disable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         # Wait for events to be sent out
@@ -262,7 +255,7 @@ class TestE2EMefEline:
 
         # Check that evc is deactivated.
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         
         assert response.status_code == 200, response.text
 
@@ -292,7 +285,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
 
@@ -306,7 +299,7 @@ class TestE2EMefEline:
 
         # Check that evc is deactivated.
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         
         assert response.status_code == 200, response.text
 
@@ -336,7 +329,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = f"{KYTOS_API}/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
 
@@ -352,14 +345,14 @@ class TestE2EMefEline:
             "force": True,
         }
         api_URL = f'{KYTOS_API}/kytos/maintenance/v1/'
-        response = requests.post(api_URL, json=payload)
+        response = kytos_api.post(api_URL, json=payload)
         assert response.status_code == 201, response.text
 
         time.sleep(7)
 
         # Check that evc is deactivated.
         api_url = f"{KYTOS_API}/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         
         assert response.status_code == 200, response.text
 
@@ -392,7 +385,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         evc_id = data["circuit_id"]
@@ -412,7 +405,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
@@ -429,7 +422,7 @@ class TestE2EMefEline:
         )
 
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data["uni_z"]["interface_id"] != "00:00:00:00:00:00:00:01:2"
@@ -461,7 +454,7 @@ class TestE2EMefEline:
             "dynamic_backup_path": True,
         }
         api_url = KYTOS_API + "/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         evc_id = data["circuit_id"]
@@ -488,7 +481,7 @@ class TestE2EMefEline:
             }
         }
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.patch(api_url, json=payload)
+        response = kytos_api.patch(api_url, json=payload)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
@@ -505,7 +498,7 @@ class TestE2EMefEline:
         )
 
         api_url = KYTOS_API + f"/kytos/mef_eline/v2/evc/{evc_id}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data["uni_a"]["interface_id"] != "00:00:00:00:00:00:00:01:1"
@@ -3,12 +3,19 @@ import os
 import time
 import re
 
-import requests
-
-from tests.helpers import NetworkTest
+from tests.helpers import (
+    KYTOS_API_PORT,
+    all_of,
+    dump_flow_table,
+    flows_count,
+    flows_with_cookie,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 # BasicFlows
 # Each should have at least 3 flows, considering topology 'ring':
@@ -19,6 +26,7 @@ BASIC_FLOWS = 3
 
 class TestE2EFlowManager:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         """
@@ -27,16 +35,15 @@ class TestE2EFlowManager:
         # Start the controller setting an environment in
         # which all elements are disabled in a clean setting
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_005_install_flow(self):
         """Tests if, after kytos restart, a flow installed
@@ -64,27 +71,27 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_with_cookie(s1, cookie, 1))
 
         # restart controller keeping configuration
         self.net.start_controller(enable_all=True, del_flows=True)
         self.net.wait_switches_connect()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        # specially because we used "del_flows=True"
-        time.sleep(15)
+        # wait for flow_manager to install the flow again, as the
+        # switch flows were deleted (del_flows=True)
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
 
         # Make sure that the flow that was sent is on /v2/stored_flows
         dpid = "00:00:00:00:00:00:00:01"
-        response = requests.get(
+        response = kytos_api.get(
             f"{KYTOS_API}/flow_manager/v2/stored_flows?state=installed&dpid={dpid}"
         )
         assert response.status_code == 200, response.text
@@ -100,9 +107,9 @@ class TestE2EFlowManager:
                 assert stored_flow["flow"][key] == value, stored_flow
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_010_install_flow_and_retrieve_it_back(self):
         """Tests the flow status through the
@@ -131,28 +138,28 @@ class TestE2EFlowManager:
 
         # It installs the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/' + switch_id
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        sw = self.net.net.get("s1")
+        wait_until(flows_count(sw, BASIC_FLOWS + 1))
 
         # restart controller keeping configuration
         self.net.start_controller(enable_all=True, del_flows=True)
         self.net.wait_switches_connect()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        # specially because we used "del_flows=True"
-        time.sleep(15)
+        # wait for flow_manager to install the flow again, as the
+        # switch flows were deleted (del_flows=True)
+        wait_until(flows_count(sw, BASIC_FLOWS + 1))
 
         sw = self.net.net.get("s1")
-        flows_sw = sw.dpctl("dump-flows")
-        assert len(flows_sw.splitlines()) == BASIC_FLOWS + 1, flows_sw
-        assert 'actions=output:2' in flows_sw
+        flows_sw = dump_flow_table(sw)
+        assert len(flows_sw) == BASIC_FLOWS + 1, str(flows_sw)
+        assert flows_sw.find(actions="output:2"), str(flows_sw)
 
         stored_flows = f'{KYTOS_API}/flow_manager/v2/stored_flows/?dpids={switch_id}'
-        response = requests.get(stored_flows)
+        response = kytos_api.get(stored_flows)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data[switch_id]) == BASIC_FLOWS + 1
@@ -201,21 +208,21 @@ class TestE2EFlowManager:
 
         # It installs the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/' + switch_id
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
-
         sw = self.net.net.get("s1")
-        flows_sw = sw.dpctl("dump-flows")
-        assert len(flows_sw.splitlines()) == BASIC_FLOWS + 1, flows_sw
-        assert 'actions=output:2' in flows_sw
-        assert 'cookie=0x65' in flows_sw
-        assert 'cookie=0x64' not in flows_sw
+        wait_until(flows_with_cookie(sw, cookie2, 1))
+
+        flows_sw = dump_flow_table(sw)
+        assert len(flows_sw) == BASIC_FLOWS + 1, str(flows_sw)
+        assert flows_sw.find(actions="output:2"), str(flows_sw)
+        assert flows_sw.find(cookie=0x65), str(flows_sw)
+        assert not flows_sw.find(cookie=0x64), str(flows_sw)
 
         stored_flows = f'{KYTOS_API}/flow_manager/v2/stored_flows/?dpids={switch_id}&cookie_range={cookie1}&cookie_range={cookie2}'
-        response = requests.get(stored_flows)
+        response = kytos_api.get(stored_flows)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data[switch_id]) == 1
@@ -248,29 +255,29 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
+        switches = self.net.net.get('s1', 's2', 's3')
+        wait_until(all_of(*(flows_count(sw, BASIC_FLOWS + 1) for sw in switches)))
 
         # restart controller keeping configuration
         self.net.start_controller(enable_all=True, del_flows=True)
         self.net.wait_switches_connect()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        # specially because we used "del_flows=True"
-        time.sleep(15)
+        # wait for flow_manager to install the flow again, as the
+        # switch flows were deleted (del_flows=True)
+        wait_until(all_of(*(flows_count(sw, BASIC_FLOWS + 1) for sw in switches)))
 
         for sw_name in ['s1', 's2', 's3']:
             sw = self.net.net.get(sw_name)
-            flows_sw = sw.dpctl('dump-flows')
-            assert len(flows_sw.splitlines()) == BASIC_FLOWS + 1, flows_sw
-            assert 'actions=output:2' in flows_sw
+            flows_sw = dump_flow_table(sw)
+            assert len(flows_sw) == BASIC_FLOWS + 1, str(flows_sw)
+            assert flows_sw.find(actions="output:2"), str(flows_sw)
 
     def test_016_install_invalid_flow_cookie_overflowed(self):
         """Test try to install an overflowed cookie value."""
@@ -292,8 +299,8 @@ class TestE2EFlowManager:
           ]
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
         data = response.json()
         assert "FlowMod.cookie" in data["description"]
@@ -349,23 +356,23 @@ class TestE2EFlowManager:
 
         # It installs the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/' + switch_id
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        sw = self.net.net.get("s1")
+        wait_until(flows_with_cookie(sw, "0x[123]", 3))
 
         # restart controller keeping configuration
         self.net.start_controller(enable_all=True, del_flows=True)
         self.net.wait_switches_connect()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        # specially because we used "del_flows=True"
-        time.sleep(15)
+        # wait for flow_manager to install the flows again, as the
+        # switch flows were deleted (del_flows=True)
+        wait_until(flows_with_cookie(sw, "0x[123]", 3))
 
         stored_flows = f'{KYTOS_API}/flow_manager/v2/stored_flows/?dpids={switch_id}&cookie_range=1&cookie_range=3'
-        response = requests.get(stored_flows)
+        response = kytos_api.get(stored_flows)
         assert response.status_code == 200, response.text
         data = response.json()
         data = data[switch_id]
@@ -396,22 +403,23 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be deleted
-        time.sleep(10)
+        wait_until(flows_count(s1, BASIC_FLOWS))
 
         # restart controller keeping configuration
         self.net.start_controller(enable_all=True, del_flows=True)
@@ -423,9 +431,9 @@ class TestE2EFlowManager:
         time.sleep(15)
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
-        assert 'actions=output:2' not in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
+        assert not flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_025_delete_flows(self):
         """Tests if, after kytos restart, a flow deleted
@@ -451,22 +459,23 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        switches = self.net.net.get('s1', 's2', 's3')
+        wait_until(all_of(*(flows_count(sw, BASIC_FLOWS + 1) for sw in switches)))
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be deleted
-        time.sleep(10)
+        wait_until(all_of(*(flows_count(sw, BASIC_FLOWS) for sw in switches)))
 
         # restart controller keeping configuration
         self.net.start_controller(enable_all=True, del_flows=True)
@@ -478,7 +487,7 @@ class TestE2EFlowManager:
         time.sleep(15)
 
         # Make sure that flows are soft deleted on /v2/stored_flows
-        response = requests.get(
+        response = kytos_api.get(
             f"{KYTOS_API}/flow_manager/v2/stored_flows?state=deleted"
         )
         assert response.status_code == 200, response.text
@@ -493,7 +502,7 @@ class TestE2EFlowManager:
                 assert flow_entry[key] == value, flow_entry
 
         # Make sure that flows are deleted on /v2/flows
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         for i in range(1, 4):
@@ -503,9 +512,9 @@ class TestE2EFlowManager:
 
         for sw_name in ['s1', 's2', 's3']:
             sw = self.net.net.get(sw_name)
-            flows_sw = sw.dpctl('dump-flows')
-            assert len(flows_sw.splitlines()) == BASIC_FLOWS, flows_sw
-            assert 'actions=output:2' not in flows_sw, flows_sw
+            flows_sw = dump_flow_table(sw)
+            assert len(flows_sw) == BASIC_FLOWS, str(flows_sw)
+            assert not flows_sw.find(actions="output:2"), str(flows_sw)
 
     def test_026_delete_flows_cookie_mask_range(self):
         """Test deleting flows with cookie range mask and persistence."""""
@@ -543,12 +552,13 @@ class TestE2EFlowManager:
 
         dpid = "00:00:00:00:00:00:00:01"
         api_url = f"{KYTOS_API}/flow_manager/v2/flows/{dpid}"
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         # wait for the flows to be installed
-        time.sleep(10)
+        sw = self.net.net.get("s1")
+        wait_until(flows_with_cookie(sw, "0xaa.*", 2))
 
         # it's expected to match all 0xaa cookie prefix
         delete_payload = {
@@ -562,14 +572,14 @@ class TestE2EFlowManager:
 
         # delete the flows
         api_url = f"{KYTOS_API}/flow_manager/v2/flows/{dpid}"
-        response = requests.delete(api_url, data=json.dumps(delete_payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(delete_payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flows to be deleted
-        time.sleep(10)
+        wait_until(flows_with_cookie(sw, "0xaa.*", 0))
 
         # restart controller keeping configuration
         self.net.start_controller(enable_all=True, del_flows=True)
@@ -581,7 +591,7 @@ class TestE2EFlowManager:
         time.sleep(15)
 
         # Make sure that flows are soft deleted on /v2/stored_flows
-        response = requests.get(
+        response = kytos_api.get(
             f"{KYTOS_API}/flow_manager/v2/stored_flows?state=deleted"
         )
         assert response.status_code == 200, response.text
@@ -596,15 +606,15 @@ class TestE2EFlowManager:
                 assert flow_entry[i]["flow"][key] == value, flow_entry[i]
 
         # Make sure that flows are deleted on /v2/flows
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert dpid in data
         assert len(data[dpid]["flows"]) == BASIC_FLOWS, data[dpid]
 
         sw = self.net.net.get("s1")
-        flows_sw = sw.dpctl("dump-flows")
-        assert len(flows_sw.splitlines()) == BASIC_FLOWS, flows_sw
+        flows_sw = dump_flow_table(sw)
+        assert len(flows_sw) == BASIC_FLOWS, str(flows_sw)
 
     def test_027_delete_flows_cookie_mask_range_any(self):
         """Test deleting flows with cookie range mask any."""""
@@ -655,12 +665,13 @@ class TestE2EFlowManager:
 
         dpid = "00:00:00:00:00:00:00:01"
         api_url = f"{KYTOS_API}/flow_manager/v2/flows/{dpid}"
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         # wait for the flows to be installed
-        time.sleep(10)
+        sw = self.net.net.get("s1")
+        wait_until(flows_count(sw, BASIC_FLOWS + 3))
 
         # cookie mask all 0's means match any
         delete_payload = {
@@ -674,17 +685,17 @@ class TestE2EFlowManager:
 
         # delete the flows
         api_url = f"{KYTOS_API}/flow_manager/v2/flows/{dpid}"
-        response = requests.delete(api_url, data=json.dumps(delete_payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(delete_payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flows to be deleted
-        time.sleep(10)
+        wait_until(flows_count(sw, 0))
 
         # Make sure that flows are soft deleted on /v2/stored_flows
-        response = requests.get(
+        response = kytos_api.get(
             f"{KYTOS_API}/flow_manager/v2/stored_flows?state=deleted"
         )
         assert response.status_code == 200, response.text
@@ -693,15 +704,15 @@ class TestE2EFlowManager:
         assert len(data[dpid]) == len(payload["flows"]) + BASIC_FLOWS
 
         # Make sure that flows are deleted on /v2/flows
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert dpid in data
         assert len(data[dpid]["flows"]) == 0, data[dpid]
 
         sw = self.net.net.get("s1")
-        flows_sw = sw.dpctl("dump-flows")
-        assert flows_sw.splitlines() == [], flows_sw
+        flows_sw = dump_flow_table(sw)
+        assert len(flows_sw) == 0, str(flows_sw)
 
     def test_028_delete_flows_cookie_mask_range_partial(self):
         """Test deleting flows with cookie range mask partial match."""""
@@ -739,12 +750,13 @@ class TestE2EFlowManager:
 
         dpid = "00:00:00:00:00:00:00:01"
         api_url = f"{KYTOS_API}/flow_manager/v2/flows/{dpid}"
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         # wait for the flows to be installed
-        time.sleep(10)
+        sw = self.net.net.get("s1")
+        wait_until(flows_count(sw, BASIC_FLOWS + 2))
 
         # it's expected to match [0xaa00000000000000, 0xaa00000000000001]
         delete_payload = {
@@ -758,16 +770,16 @@ class TestE2EFlowManager:
 
         # delete the flow
         api_url = f"{KYTOS_API}/flow_manager/v2/flows/{dpid}"
-        response = requests.delete(api_url, data=json.dumps(delete_payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(delete_payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
         # wait for the flow to be deleted
-        time.sleep(10)
+        wait_until(flows_count(sw, BASIC_FLOWS + 1))
 
         # Make sure that only one flow got soft deleted on /v2/stored_flows
-        response = requests.get(
+        response = kytos_api.get(
             f"{KYTOS_API}/flow_manager/v2/stored_flows?state=deleted"
         )
         assert response.status_code == 200, response.text
@@ -781,7 +793,7 @@ class TestE2EFlowManager:
             assert flow_entry[0]["flow"][key] == value, flow_entry[0]
 
         # Make sure that only one flow got deleted on /v2/flows
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert dpid in data
@@ -789,9 +801,9 @@ class TestE2EFlowManager:
 
         # Make sure that only one flow got deleted
         sw = self.net.net.get("s1")
-        flows_sw = sw.dpctl("dump-flows")
-        assert len(flows_sw.splitlines()) == BASIC_FLOWS + 1, flows_sw
-        assert 'dl_vlan=101' in flows_sw
+        flows_sw = dump_flow_table(sw)
+        assert len(flows_sw) == BASIC_FLOWS + 1, str(flows_sw)
+        assert flows_sw.find(dl_vlan="101"), str(flows_sw)
 
     def modify_match(self, restart_kytos=False):
         """Tests if after a match is modified outside
@@ -817,13 +829,13 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
-
         s1 = self.net.net.get('s1')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
+
         s1.dpctl('del-flows', 'in_port=1')
         s1.dpctl('add-flow', 'idle_timeout=360,hard_timeout=1200,priority=10,'
                              'dl_vlan=324,actions=output:1')
@@ -834,14 +846,16 @@ class TestE2EFlowManager:
         else:
             self.net.reconnect_switches()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        time.sleep(15)
+        # wait for the consistency check to restore the flow
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 1),
+            flows_count(s1, 1, pattern="in_port=1"),
+        ))
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'in_port=1' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(in_port="1"), str(flows_s1)
 
     def test_030_modify_match(self):
         self.modify_match()
@@ -872,25 +886,25 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_with_cookie(s1, 0x99, 1))
 
         # Verify the flow
-        s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert len(re.findall("cookie=0x99.*in_port=1 .*output:2", flows_s1)) == 1, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert len(flows_s1.find(cookie=0x99, in_port="1", actions="output:2")) == 1, str(flows_s1)
 
         # Modify the actions and verify its modification
         # we use output:7 which is a port not in use, to avoid further
         # problems with loop detection and mismatch links
         s1.dpctl('mod-flows', 'actions=output:7')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert 'actions=output:2' not in flows_s1
-        assert 'actions=output:7' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert not flows_s1.find(actions="output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:7"), str(flows_s1)
 
         if restart_kytos:
             # restart controller keeping configuration
@@ -899,16 +913,18 @@ class TestE2EFlowManager:
         else:
             self.net.reconnect_switches()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        time.sleep(15)
+        # wait for the consistency check to restore the actions
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 1),
+            flows_count(s1, 0, pattern="actions=output:7"),
+        ))
 
         # Check that the flow keeps the original setting
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:7' not in flows_s1
-        assert len(re.findall("cookie=0x99.*in_port=1 .*output:2", flows_s1)) == 1, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert not flows_s1.find(actions="output:7"), str(flows_s1)
+        assert len(flows_s1.find(cookie=0x99, in_port="1", actions="output:2")) == 1, str(flows_s1)
 
     def test_040_replace_action_flow(self):
         self.replace_action_flow()
@@ -935,17 +951,17 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
 
         # Verify the flow
-        s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'in_port=1' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(in_port="1"), str(flows_s1)
 
         s1.dpctl('add-flow', 'in_port=1,idle_timeout=360,hard_timeout=1200,priority=10,actions=strip_vlan,output:2')
 
@@ -956,14 +972,16 @@ class TestE2EFlowManager:
         else:
             self.net.reconnect_switches()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        time.sleep(15)
+        # wait for the consistency check to restore the actions
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 1),
+            flows_count(s1, 0, pattern="actions=pop_vlan,"),
+        ))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=strip_vlan,' not in flows_s1
-        assert 'actions=output:2' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert not flows_s1.find(actions="pop_vlan,output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_050_add_action_flow(self):
         self.add_action_flow()
@@ -984,13 +1002,12 @@ class TestE2EFlowManager:
         else:
             self.net.reconnect_switches()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        time.sleep(15)
+        # wait for the consistency check to remove the flow
+        wait_until(flows_count(s1, BASIC_FLOWS))
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
 
     def test_060_flow_another_table(self):
         self.flow_another_table()
@@ -1012,13 +1029,12 @@ class TestE2EFlowManager:
         else:
             self.net.reconnect_switches()
 
-        # STATS_INTERVAL is set to 7 seconds, we should wait at least
-        # two cycles to account for possible Overlapping requests
-        time.sleep(15)
+        # wait for the consistency check to remove the flow
+        wait_until(flows_count(s1, BASIC_FLOWS))
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
 
     def test_070_flow_table_0(self):
         self.flow_table_0()
@@ -1028,7 +1044,7 @@ class TestE2EFlowManager:
 
     def test_080_retrieve_flows(self):
         api_url = KYTOS_API + '/flow_manager/v2/stored_flows'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == 3
@@ -1049,7 +1065,7 @@ class TestE2EFlowManager:
                 "flows": [{"cookie": 12297829382473034410, "priority": 20000},]},
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows_by_switch'
-        response = requests.post(api_url, data=json.dumps(payload),
+        response = kytos_api.post(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 404, response.text
 
@@ -1061,7 +1077,7 @@ class TestE2EFlowManager:
             "flows": [{"cookie": 12297829382473034410, "priority": 20000}],
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.post(api_url, data=json.dumps(payload),
+        response = kytos_api.post(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 404, response.text
  
@@ -1083,12 +1099,12 @@ class TestE2EFlowManager:
                 ]},
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows_by_switch'
-        response = requests.post(api_url, data=json.dumps(payload),
+        response = kytos_api.post(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         stored_url = KYTOS_API + '/flow_manager/v2/stored_flows'
-        response = requests.get(stored_url)
+        response = kytos_api.get(stored_url)
         data_flows = response.json()
         sw1_flows = data_flows["00:00:00:00:00:00:00:01"]
         sw2_flows = data_flows["00:00:00:00:00:00:00:02"]
@@ -1102,15 +1118,19 @@ class TestE2EFlowManager:
             for flow in sw_flows[BASIC_FLOWS: BASIC_FLOWS + length]:
                 assert flow["state"] in {"installed", "pending"}
 
-        time.sleep(5)
-
         s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 3, flows_s3
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 1),
+            flows_count(s2, BASIC_FLOWS + 2),
+            flows_count(s3, BASIC_FLOWS + 3),
+        ))
+
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 3, str(flows_s3)
 
         payload = {
             "00:00:00:00:00:00:00:03": {
@@ -1124,12 +1144,12 @@ class TestE2EFlowManager:
             }
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows_by_switch'
-        response = requests.delete(api_url, data=json.dumps(payload),
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         stored_url = KYTOS_API + '/flow_manager/v2/stored_flows'
-        response = requests.get(stored_url)
+        response = kytos_api.get(stored_url)
         data_flows = response.json()
         sw1_flows = data_flows["00:00:00:00:00:00:00:01"]
         sw2_flows = data_flows["00:00:00:00:00:00:00:02"]
@@ -1143,14 +1163,14 @@ class TestE2EFlowManager:
             for flow in sw_flows[BASIC_FLOWS: BASIC_FLOWS + length]:
                 assert flow["state"] == "deleted"
 
-        time.sleep(5)
+        wait_until(all_of(*(flows_count(sw, BASIC_FLOWS) for sw in (s1, s2, s3))))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS, str(flows_s3)
 
     def test_100_install_delete_flows_in_switch_list(self):
         """Install and delete through /v2/flows and a list of
@@ -1163,37 +1183,40 @@ class TestE2EFlowManager:
             ]
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.post(api_url, data=json.dumps(payload),
+        response = kytos_api.post(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
-        time.sleep(5)
-
         s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS, flows_s3
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 2),
+            flows_count(s2, BASIC_FLOWS + 2),
+        ))
+
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS, str(flows_s3)
 
         payload = {
             "switches": ["00:00:00:00:00:00:00:01", "00:00:00:00:00:00:00:02"],
             "flows": [{"cookie": 12297829382473034410, "cookie_mask": 18446744073709551615}]
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.delete(api_url, data=json.dumps(payload),
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
-        time.sleep(5)
+        wait_until(all_of(flows_count(s1, BASIC_FLOWS), flows_count(s2, BASIC_FLOWS)))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS, str(flows_s3)
 
     def test_105_mismatch_miss_flow(self):
         """Install miss flow and try to delete it with a mismatched
@@ -1208,15 +1231,15 @@ class TestE2EFlowManager:
             }]
         }}
         api_url = KYTOS_API + '/flow_manager/v2/flows_by_switch/?force=true'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
-        time.sleep(5)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
+
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
 
         payload = {"00:00:00:00:00:00:00:01": {
             "flows": [{
@@ -1224,8 +1247,8 @@ class TestE2EFlowManager:
                 "match": {"dl_src": "ee:ee:ee:ee:ee:01"}
             }],
         }}
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         # Restart kytos
@@ -1233,8 +1256,8 @@ class TestE2EFlowManager:
         self.net.wait_switches_connect()
 
         # Previously installed flow should not be deleted
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
 
     def test_110_install_delete_flows_by_switch_diff_cookie(self):
         """Install and delete via flows_by_switch API request.
@@ -1256,12 +1279,12 @@ class TestE2EFlowManager:
                 ]},
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows_by_switch'
-        response = requests.post(api_url, data=json.dumps(payload),
+        response = kytos_api.post(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         stored_url = KYTOS_API + '/flow_manager/v2/stored_flows'
-        response = requests.get(stored_url)
+        response = kytos_api.get(stored_url)
         data_flows = response.json()
         sw1_flows = data_flows["00:00:00:00:00:00:00:01"]
         sw2_flows = data_flows["00:00:00:00:00:00:00:02"]
@@ -1275,15 +1298,19 @@ class TestE2EFlowManager:
             for flow in sw_flows[BASIC_FLOWS: BASIC_FLOWS + length]:
                 assert flow["state"] in {"installed", "pending"}
 
-        time.sleep(5)
-
         s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 3, flows_s3
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 1),
+            flows_count(s2, BASIC_FLOWS + 2),
+            flows_count(s3, BASIC_FLOWS + 3),
+        ))
+
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 3, str(flows_s3)
 
         payload = {
             "00:00:00:00:00:00:00:03": {
@@ -1297,12 +1324,12 @@ class TestE2EFlowManager:
             }
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows_by_switch'
-        response = requests.delete(api_url, data=json.dumps(payload),
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
                       headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
 
         stored_url = KYTOS_API + '/flow_manager/v2/stored_flows'
-        response = requests.get(stored_url)
+        response = kytos_api.get(stored_url)
         data_flows = response.json()
         sw1_flows = data_flows["00:00:00:00:00:00:00:01"]
         sw2_flows = data_flows["00:00:00:00:00:00:00:02"]
@@ -1316,14 +1343,14 @@ class TestE2EFlowManager:
             for flow in sw_flows[BASIC_FLOWS: BASIC_FLOWS + length]:
                 assert flow["state"] == "deleted", flow
 
-        time.sleep(5)
+        wait_until(all_of(*(flows_count(sw, BASIC_FLOWS) for sw in (s1, s2, s3))))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS, str(flows_s3)
 
     def test_120_install_and_delete_ipv6_flow(self):
         """Tests if, after kytos restart, a flow deleted
@@ -1360,16 +1387,16 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, json=payload)
+        kytos_api.post(api_url, json=payload)
 
         # wait for the flow to be installed and flow_manager's MIN veridict timer
         time.sleep(16)
 
         # make sure the flows were installed
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert '2001:db8:0:100' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert flows_s1.find(table=3, ipv6_dst="2001:db8:0:100::1"), str(flows_s1)
 
         # del flows from table 3 and wait for consistency check to reinstall
         # them. STATS_INTERVAL is 7 sec, so we wait at least 2 cycles
@@ -1377,9 +1404,9 @@ class TestE2EFlowManager:
         time.sleep(15)
 
         # make sure consistency check will push the flows back
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert '2001:db8:0:100' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert flows_s1.find(table=3, ipv6_dst="2001:db8:0:100::1"), str(flows_s1)
 
         if os.path.exists("/var/log/syslog"):
             with open("/var/log/syslog", "r") as f:
@@ -1390,15 +1417,15 @@ class TestE2EFlowManager:
         payload["flows"][0]["cookie_mask"] = 18446744073709551615
         payload["flows"][1]["cookie_mask"] = 18446744073709551615
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.delete(api_url, json=payload)
+        response = kytos_api.delete(api_url, json=payload)
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be deleted
-        time.sleep(10)
+        wait_until(flows_count(s1, BASIC_FLOWS))
 
         # make sure flows were deleted
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS, flows_s1
-        assert '2001:db8:0:100' not in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS, str(flows_s1)
+        assert not flows_s1.find(table=3, ipv6_dst="2001:db8:0:100::1"), str(flows_s1)
@@ -1,13 +1,18 @@
 import json
-import re
 import time
 
-import requests
-
-from tests.helpers import NetworkTest
+from tests.helpers import (
+    KYTOS_API_PORT,
+    all_of,
+    dump_flow_table,
+    flows_count,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 # BasicFlows
 # Each should have at least 3 flows, considering topology 'ring':
@@ -18,6 +23,7 @@ BASIC_FLOWS = 3
 
 class TestE2EFlowManager:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         """
@@ -26,16 +32,15 @@ class TestE2EFlowManager:
         # Start the controller setting an environment in
         # which all elements are disabled in a clean setting
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_030_restart_kytos_should_preserve_flows(self):
         """Test if, after kytos restart, the flows are preserved on the switch
@@ -60,27 +65,23 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_count(s1, 1, pattern='dl_vlan=999'))
 
         # make sure flow was installed and get initial time duration
-        s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        flows_s1 = s1.dpctl('dump-flows')
-        initial_duration = 0
-        for flow in flows_s1.splitlines():
-            match = re.search("duration=([0-9.]+).*dl_vlan=999", flow)
-            if match:
-                initial_duration = float(match.group(1))
-                break
-        assert initial_duration > 0, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        flows = flows_s1.find(dl_vlan="999")
+        assert flows, str(flows_s1)
+        initial_duration = flows[0].counters["duration"]
+        assert initial_duration > 0, str(flows_s1)
 
         # restart controller keeping configuration
         t1 = time.time()
@@ -92,15 +93,12 @@ class TestE2EFlowManager:
         time.sleep(20)
         initial_duration += 20
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        duration  = 0
-        for flow in flows_s1.splitlines():
-            match = re.search("duration=([0-9.]+).*dl_vlan=999", flow)
-            if match:
-                duration = float(match.group(1))
-                break
-        assert duration >= int(initial_duration + delta), flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        flows = flows_s1.find(dl_vlan="999")
+        assert flows, str(flows_s1)
+        duration = flows[0].counters["duration"]
+        assert duration >= int(initial_duration + delta), str(flows_s1)
 
     def test_031_on_switch_restart_kytos_should_recreate_flows(self):
         """Test if, after kytos restart, the flows are preserved on the switch 
@@ -125,28 +123,31 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_count(s1, 1, pattern='dl_vlan=999'))
 
         # OVS does not have a way to actually restart the switch
         # so to simulate that, we just delete all flows
-        s1 = self.net.net.get('s1')
         s1.dpctl('del-flows')
         # reconnect to trigger and speed up consistency check after the handshake
         self.net.reconnect_switches()
 
         # wait for the flow to be installed
-        time.sleep(10)
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 1),
+            flows_count(s1, 1, pattern='dl_vlan=999'),
+        ))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'dl_vlan=999' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(dl_vlan="999"), str(flows_s1)
 
     def test_032_on_switch_reconnection_should_recreate_untagged_any_flows(self):
         """Test if, after kytos restart, deserialize properly"""
@@ -183,28 +184,28 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
 
         # OVS does not have a way to actually restart the switch
         # so to simulate that, we just delete all flows
-        s1 = self.net.net.get('s1')
         s1.dpctl('del-flows')
         # reconnect to trigger and speed up consistency check after the handshake
         self.net.reconnect_switches()
 
         # wait for the flow to be installed
-        time.sleep(10)
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
         # 4096/4096
-        assert 'vlan_tci=0x1000/0x1000' in flows_s1
+        assert flows_s1.find(vlan_tci="0x1000/0x1000"), str(flows_s1)
         # 0
-        assert 'vlan_tci=0x0000/0x1fff' in flows_s1
+        assert flows_s1.find(vlan_tci="0x0000/0x1fff"), str(flows_s1)
@@ -1,33 +1,30 @@
 import json
 import pytest
-import requests
-from tests.helpers import NetworkTest
-import time
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2EFlowManager:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         """
         It is called at the beginning of every class method execution
         """
-        # Start the controller setting an environment in
-        # which all elements are disabled in a clean setting
-        self.net.restart_kytos_clean()
-        time.sleep(10)
+        # Get back to a clean setting with all elements enabled, without
+        # restarting the controller when possible
+        self.net.soft_reset()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_005_install_flow_on_non_existent_switch_should_fail(self):
         """Tests if the flow installation process on an invalid
@@ -53,8 +50,8 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:05'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 404, response.text
 
     def test_010_install_flow_should_fail(self):
@@ -64,8 +61,8 @@ class TestE2EFlowManager:
         payload = {}
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_015_install_flow_should_fail(self):
@@ -78,8 +75,8 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_020_install_flow_should_fail(self):
@@ -95,8 +92,8 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_025_retrieve_flow_from_non_existent_switch_should_fail(self):
@@ -107,7 +104,7 @@ class TestE2EFlowManager:
 
         # It tries to get a flow that does not exist
         api_url = KYTOS_API + '/flow_manager/v2/flows/' + switch_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 404, response.text
 
     def test_030_install_flows_should_fail(self):
@@ -117,8 +114,8 @@ class TestE2EFlowManager:
         payload = {}
 
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_035_install_flows_should_fail(self):
@@ -131,8 +128,8 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_040_install_flows_should_fail(self):
@@ -148,8 +145,8 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_045_delete_flow_on_non_existent_switch_should_fail(self):
@@ -177,8 +174,8 @@ class TestE2EFlowManager:
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:05'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 404, response.text
 
     def test_050_delete_flow_should_fail(self):
@@ -189,8 +186,8 @@ class TestE2EFlowManager:
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_055_delete_flow_should_fail(self):
@@ -204,8 +201,8 @@ class TestE2EFlowManager:
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_060_delete_flow_should_fail(self):
@@ -222,8 +219,8 @@ class TestE2EFlowManager:
 
         # Deletes the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_065_delete_flows_should_fail(self):
@@ -234,8 +231,8 @@ class TestE2EFlowManager:
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_070_delete_flows_should_fail(self):
@@ -249,8 +246,8 @@ class TestE2EFlowManager:
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_075_delete_flows_should_fail(self):
@@ -267,6 +264,6 @@ class TestE2EFlowManager:
 
         # delete the flow
         api_url = KYTOS_API + '/flow_manager/v2/flows'
-        response = requests.delete(api_url, data=json.dumps(payload),
-                                   headers={'Content-type': 'application/json'})
+        response = kytos_api.delete(api_url, data=json.dumps(payload),
+                                    headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
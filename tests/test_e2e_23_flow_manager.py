@@ -2,13 +2,20 @@ import json
 import time
 
 import pytest
-import requests
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from tests.helpers import NetworkTest
+from tests.helpers import (
+    KYTOS_API_PORT,
+    all_of,
+    dump_flow_table,
+    flows_count,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 # BasicFlows
 # Each should have at least 3 flows, considering topology 'ring':
@@ -18,24 +25,23 @@ BASIC_FLOWS = 3
 
 class TestE2EFlowManager:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         """
         It is called at the beginning of every class method execution
         """
-        # Start the controller setting an environment in
-        # which all elements are disabled in a clean setting
-        self.net.restart_kytos_clean()
-        time.sleep(10)
+        # Get back to a clean setting with all elements enabled, without
+        # restarting the controller when possible
+        self.net.soft_reset()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_005_install_flow(self):
         """
@@ -89,20 +95,20 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 3))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         payload2 = {
             "flows": [
@@ -117,19 +123,22 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        wait_until(all_of(
+            flows_count(s1, BASIC_FLOWS + 3),
+            flows_count(s1, 0, pattern='actions=output:2'),
+        ))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
 
-        assert 'actions=output:3' in flows_s1
-        assert 'actions=output:4' in flows_s1
-        assert 'actions=output:2' not in flows_s1
+        assert flows_s1.find(actions="output:3"), str(flows_s1)
+        assert flows_s1.find(actions="output:4"), str(flows_s1)
+        assert not flows_s1.find(actions="output:2"), str(flows_s1)
 
-        assert 'actions=drop' in flows_s1
+        assert flows_s1.find(actions="drop"), str(flows_s1)
 
     def test_010_install_flow(self):
         """Tests the inclusion of multiple flows with
@@ -181,20 +190,20 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 3))
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert 'actions=output:2' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         payload2 = {
             "flows": [
@@ -208,18 +217,18 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        wait_until(flows_count(s1, BASIC_FLOWS + 4))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 4, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 4, str(flows_s1)
 
-        assert 'actions=output:2' in flows_s1
-        assert 'actions=output:3' in flows_s1
-        assert 'actions=output:4' in flows_s1
-        assert 'actions=drop' in flows_s1
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:3"), str(flows_s1)
+        assert flows_s1.find(actions="output:4"), str(flows_s1)
+        assert flows_s1.find(actions="drop"), str(flows_s1)
 
     def test_015_install_flow(self):
         """
@@ -272,20 +281,20 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data = response.json()
         assert 'FlowMod Messages Sent' in data['response']
 
         # wait for the flow to be installed
-        time.sleep(10)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 3))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         payload2 = {
             "flows": [
@@ -302,19 +311,19 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(10)
+        wait_until(flows_count(s1, BASIC_FLOWS + 4))
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 4, flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 4, str(flows_s1)
 
-        assert 'actions=output:2' in flows_s1
-        assert 'actions=output:3' in flows_s1
-        assert 'actions=output:4' in flows_s1
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:3"), str(flows_s1)
+        assert flows_s1.find(actions="output:4"), str(flows_s1)
 
-        assert 'actions=output:5' in flows_s1
+        assert flows_s1.find(actions="output:5"), str(flows_s1)
 
     def test_020_install_flow(self):
         """
@@ -354,17 +363,17 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         payload2 = {
             "flows": [
@@ -404,21 +413,21 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
+        wait_until(flows_count(s1, BASIC_FLOWS + 4))
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 4, flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 4, str(flows_s1)
 
-        assert 'actions=output:2' in flows_s1
-        assert 'actions=output:3' in flows_s1
-        assert 'in_port=3' in flows_s1
-        assert 'actions=set_field:4496->vlan_vid,output:1' in flows_s1
-        assert 'in_port=4' in flows_s1
-        assert 'actions=output:1' in flows_s1
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:3"), str(flows_s1)
+        assert flows_s1.find(in_port="3"), str(flows_s1)
+        assert flows_s1.find(actions="set_field:4496->vlan_vid,output:1"), str(flows_s1)
+        assert flows_s1.find(in_port="4"), str(flows_s1)
+        assert flows_s1.find(actions="output:1"), str(flows_s1)
 
     def test_025_install_flow(self):
         """
@@ -458,18 +467,18 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert 'actions=output:2' in flows_s1
-        assert 'actions=output:3' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:3"), str(flows_s1)
 
         payload2 = {
             "flows": [
@@ -495,19 +504,19 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload2),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload2),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
+        wait_until(flows_count(s1, BASIC_FLOWS + 3))
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert 'actions=output:2' in flows_s1
-        assert 'actions=output:3' in flows_s1
-        assert 'in_port=3' in flows_s1
-        assert 'actions=set_field:4496->vlan_vid,output:1' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:3"), str(flows_s1)
+        assert flows_s1.find(in_port="3"), str(flows_s1)
+        assert flows_s1.find(actions="set_field:4496->vlan_vid,output:1"), str(flows_s1)
 
         payload3 = {
             "flows": [
@@ -529,17 +538,17 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload3), headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload3), headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
+        wait_until(flows_count(s1, BASIC_FLOWS + 4))
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 4, flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 4, str(flows_s1)
 
-        assert 'in_port=4' in flows_s1
-        assert 'actions=output:1' in flows_s1
+        assert flows_s1.find(in_port="4"), str(flows_s1)
+        assert flows_s1.find(actions="output:1"), str(flows_s1)
 
     def test_030_install_flow(self):
         """
@@ -605,17 +614,17 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_035_install_flow(self):
         """
@@ -642,41 +651,41 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
-        # wait for the flow to be installed
+        # the same flow again, give it time to (wrongly) add a duplicate
         time.sleep(15)
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
-        # wait for the flow to be installed
+        # the same flow again, give it time to (wrongly) add a duplicate
         time.sleep(15)
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_040_install_flow(self):
         """
@@ -746,17 +755,17 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_045_install_flow(self):
         """
@@ -784,41 +793,41 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
-        # wait for the flow to be installed
+        # the same flow again, give it time to (wrongly) add a duplicate
         time.sleep(15)
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
-        # wait for the flow to be installed
+        # the same flow again, give it time to (wrongly) add a duplicate
         time.sleep(15)
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_050_install_flow(self):
         """
@@ -860,17 +869,17 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_055_install_flow(self):
         """
@@ -898,17 +907,17 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 1))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 1, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 1, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
         payload1 = {
             "flows": [
@@ -930,16 +939,16 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload1),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload1),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert 'actions=output:2' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
 
     def test_060_install_flow(self):
         """
@@ -982,18 +991,18 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 2))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert 'actions=output:2' in flows_s1
-        assert 'actions=output:3' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert flows_s1.find(actions="output:2"), str(flows_s1)
+        assert flows_s1.find(actions="output:3"), str(flows_s1)
 
         payload1 = {
             "flows": [
@@ -1004,16 +1013,16 @@ class TestE2EFlowManager:
         }
 
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        requests.post(api_url, data=json.dumps(payload1),
-                      headers={'Content-type': 'application/json'})
+        kytos_api.post(api_url, data=json.dumps(payload1),
+                       headers={'Content-type': 'application/json'})
 
         # wait for the flow to be installed
-        time.sleep(15)
+        wait_until(flows_count(s1, BASIC_FLOWS + 3))
 
-        flows_s1 = s1.dpctl('dump-flows')
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 3, flows_s1
-        assert 'actions=drop' in flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 3, str(flows_s1)
+        assert flows_s1.find(actions="drop"), str(flows_s1)
 
     def test_065_install_flow(self):
         """
@@ -1037,8 +1046,8 @@ class TestE2EFlowManager:
                 }]
               }]
             }
-            return requests.post(api_url, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+            return kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
 
         with ThreadPoolExecutor(max_workers=100) as executor:
             futures = [
@@ -1049,12 +1058,12 @@ class TestE2EFlowManager:
                 assert response.status_code == 202, response.text
 
         # wait for the flow to be installed
-        time.sleep(10)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
+        wait_until(flows_count(s1, BASIC_FLOWS + 100))
+
+        flows_s1 = dump_flow_table(s1)
 
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 100, flows_s1
+        assert len(flows_s1) == BASIC_FLOWS + 100, str(flows_s1)
 
     def create_flow(self, vlan_id):
         payload = {
@@ -1071,8 +1080,8 @@ class TestE2EFlowManager:
             }]
         }
         api_url = KYTOS_API + '/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, data=json.dumps(payload),
-                                 headers = {'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload),
+                                  headers = {'Content-type': 'application/json'})
 
         assert response.status_code == 202, response.text
         data = response.json()
@@ -1094,8 +1103,8 @@ class TestE2EFlowManager:
             thread.join()
 
         # wait for the flow to be installed
-        time.sleep(10)
-
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 100, flows_s1
+        wait_until(flows_count(s1, BASIC_FLOWS + 100))
+
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == BASIC_FLOWS + 100, str(flows_s1)
@@ -1,20 +1,21 @@
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import time
 import pytest
 import os
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2EOfLLDP:
     net = None
+    topo_name = "ring"
+    # some tests add and delete links, the next class needs a new network
+    rebuild_network = True
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
         cls.net.restart_kytos_clean()
         cls.net.wait_switches_connect()
         # disable ipv6 router solicitation to avoid interfere with stats
@@ -27,7 +28,7 @@ class TestE2EOfLLDP:
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net, rebuild=cls.rebuild_network)
 
     def get_iface_stats_rx_pkt(self, host):
         rx_pkts = host.cmd("ip -s link show dev %s | grep RX: -A 1 | tail -n1 | awk '{print $2}'" % (host.intfNames()[0]))
@@ -35,26 +36,26 @@ class TestE2EOfLLDP:
 
     def enable_all_interfaces(self):
         api_url = KYTOS_API + '/topology/v3/switches/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         switches = data.get("switches", {})
         for sw in switches.keys():
-            response = requests.post(KYTOS_API + '/topology/v3/switches/%s/enable' % sw)
-            response = requests.post(KYTOS_API + '/topology/v3/interfaces/switch/%s/enable' % sw)
+            response = kytos_api.post(KYTOS_API + '/topology/v3/switches/%s/enable' % sw)
+            response = kytos_api.post(KYTOS_API + '/topology/v3/interfaces/switch/%s/enable' % sw)
 
     @staticmethod
     def disable_all_of_lldp():
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         all_interfaces = data.get("interfaces", [])
-        response = requests.post(api_url+'disable/', json={"interfaces": all_interfaces})
+        response = kytos_api.post(api_url+'disable/', json={"interfaces": all_interfaces})
         assert response.status_code == 200, response.text
 
     def test_001_list_interfaces_with_lldp(self):
         """ List interfaces with OF LLDP. """
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert "interfaces" in data
@@ -139,11 +140,11 @@ class TestE2EOfLLDP:
         payload["interfaces"].extend(extra_intfs)
 
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/disable/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 200, response.text
 
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert set(data["interfaces"]) == set(expected_interfaces)
 
@@ -172,7 +173,7 @@ class TestE2EOfLLDP:
         time.sleep(10)
 
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert set(data["interfaces"]) == set(expected_interfaces)
 
@@ -194,11 +195,11 @@ class TestE2EOfLLDP:
         ]
 
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/enable/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 200, response.text
 
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert set(data["interfaces"]) == set(expected_interfaces)
 
@@ -215,7 +216,7 @@ class TestE2EOfLLDP:
         time.sleep(10)
 
         api_url = KYTOS_API + '/of_lldp/v1/interfaces/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert set(data["interfaces"]) == set(expected_interfaces)
 
@@ -226,7 +227,7 @@ class TestE2EOfLLDP:
 
         default_polling_time = 3
         api_url = KYTOS_API + '/of_lldp/v1/polling_time'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert "polling_time" in data
@@ -242,10 +243,10 @@ class TestE2EOfLLDP:
         delta_pps = rx_stats_h11_2 - rx_stats_h11
 
         api_url = KYTOS_API + '/of_lldp/v1/polling_time'
-        response = requests.post(api_url, json={"polling_time": 1})
+        response = kytos_api.post(api_url, json={"polling_time": 1})
         assert response.status_code == 200, response.text
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data["polling_time"] == 1
 
@@ -275,7 +276,7 @@ class TestE2EOfLLDP:
         new_intf_s2 = "00:00:00:00:00:00:00:02:4"
 
         api_url = KYTOS_API + "/of_lldp/v1/interfaces/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         intfs_before = set(response.json()["interfaces"])
         assert new_intf_s1 not in intfs_before
@@ -284,12 +285,12 @@ class TestE2EOfLLDP:
         # Add a new link between s1 (port 5) and s2 (port 4)
         S1, S2 = self.net.net.get("s1", "s2")
         self.net.net.addLink(S1, S2, port1=5, port2=4)
-        S1.attach("s1-eth5")
-        S2.attach("s2-eth4")
+        S1.attach(f"{S1.name}-eth5")
+        S2.attach(f"{S2.name}-eth4")
         try:
             time.sleep(5)
 
-            response = requests.get(api_url)
+            response = kytos_api.get(api_url)
             assert response.status_code == 200, response.text
             intfs_after = set(response.json()["interfaces"])
             assert new_intf_s1 in intfs_after, f"{intfs_after}"
@@ -298,17 +299,17 @@ class TestE2EOfLLDP:
             # Assert VLAN 3799 is NOT in available_tags
             expected_available = [[1, 3798], [3800, 4094]]
             topo_url = KYTOS_API + "/topology/v3/interfaces/tag_ranges"
-            response = requests.get(topo_url)
+            response = kytos_api.get(topo_url)
             assert response.status_code == 200, response.text
             data = response.json()
             for intf_id in (new_intf_s1, new_intf_s2):
                 actual = data[intf_id]["available_tags"]["vlan"]
                 assert actual == expected_available, f"{intf_id} available_tags: {actual}"
         finally:
-            S1.detach("s1-eth5")
-            S2.detach("s2-eth4")
+            S1.detach(f"{S1.name}-eth5")
+            S2.detach(f"{S2.name}-eth4")
             for link in self.net.net.linksBetween(S1, S2):
-                if link.intf1.name == "s1-eth5" or link.intf2.name == "s1-eth5":
+                if link.intf1.name == f"{S1.name}-eth5" or link.intf2.name == f"{S1.name}-eth5":
                     self.net.net.delLink(link)
                     break
 
@@ -320,7 +321,7 @@ class TestE2EOfLLDP:
         time.sleep(10)
 
         api_url = KYTOS_API + '/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         switches = response.json().get("switches", {})
         assert switches, "no switches found in topology"
@@ -330,7 +331,7 @@ class TestE2EOfLLDP:
 
         def has_lldp_flow(dpid):
             stored_url = f"{KYTOS_API}/flow_manager/v2/stored_flows/?dpid={dpid}"
-            stored = requests.get(stored_url)
+            stored = kytos_api.get(stored_url)
             assert stored.status_code == 200, stored.text
             flows = stored.json().get(dpid, [])
             return any(
@@ -348,7 +349,7 @@ class TestE2EOfLLDP:
             assert has_lldp_flow(dpid), f"missing LLDP flow on {dpid}"
 
         tags_url = KYTOS_API + "/topology/v3/interfaces/tag_ranges"
-        response = requests.get(tags_url)
+        response = kytos_api.get(tags_url)
         assert response.status_code == 200, response.text
         data = response.json()
         for intf_id, intf_data in data.items():
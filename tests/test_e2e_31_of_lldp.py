@@ -1,10 +1,9 @@
 import json
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, dump_flow_table, kytos_api, network_pool
 import time
 
 CONTROLLER = "127.0.0.1"
-KYTOS_API = f"http://{CONTROLLER}:8181/api/kytos"
+KYTOS_API = f"http://{CONTROLLER}:{KYTOS_API_PORT}/api/kytos"
 
 # BasicFlows
 # Each should have at least 3 flows, considering topology 'ring4':
@@ -15,22 +14,22 @@ BASIC_FLOWS = 3
 
 class TestE2EOfLLDP:
     net = None
+    topo_name = "ring"
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def setup_method(self, method):
         """
         It is called at the beginning of every class method execution
         """
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     def restart(self, clean_config=False, enable_all=True, wait_for=10):
         self.net.start_controller(clean_config=clean_config, enable_all=enable_all)
@@ -39,7 +38,7 @@ class TestE2EOfLLDP:
         time.sleep(wait_for)
 
     def enable_link_liveness(self, interface_ids):
-        response = requests.post(
+        response = kytos_api.post(
             KYTOS_API + "/of_lldp/v1/liveness/enable/",
             json={"interfaces": interface_ids},
         )
@@ -47,7 +46,7 @@ class TestE2EOfLLDP:
         return response
 
     def disable_link_liveness(self, interface_ids):
-        response = requests.post(
+        response = kytos_api.post(
             KYTOS_API + "/of_lldp/v1/liveness/disable/",
             json={"interfaces": interface_ids},
         )
@@ -56,7 +55,7 @@ class TestE2EOfLLDP:
 
     def set_polling_time(self, interval: int) -> None:
         """Set LLDP polling time"""
-        response = requests.post(
+        response = kytos_api.post(
             KYTOS_API + "/of_lldp/v1/polling_time/",
             json={"polling_time": interval},
         )
@@ -87,7 +86,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ is all set
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         for entry in data["interfaces"]:
             assert entry["id"] in interface_ids, entry
@@ -95,7 +94,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/pair is all set
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/pair"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data["pairs"], data
         live_intf_links = {}
@@ -110,7 +109,7 @@ class TestE2EOfLLDP:
 
         # Assert link metadata has liveness_status "up"
         api_url = f"{KYTOS_API}/topology/v3/links"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data["links"]
@@ -131,7 +130,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ is still all set
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         for entry in data["interfaces"]:
             assert entry["id"] in interface_ids, entry
@@ -156,7 +155,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ is enabled
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         for entry in data["interfaces"]:
             assert entry["id"] in interface_ids, entry
@@ -166,7 +165,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ is disabled
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data["interfaces"] == []
 
@@ -175,7 +174,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ is still disabled
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data["interfaces"] == []
 
@@ -195,7 +194,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ is enabled
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         for entry in data["interfaces"]:
             assert entry["id"] in interface_ids, entry
@@ -212,13 +211,13 @@ class TestE2EOfLLDP:
         # Wait just so hellos are missed
         time.sleep(15)
         s2 = self.net.net.get('s2')
-        flows_s2 = s2.dpctl("dump-flows")
+        flows_s2 = dump_flow_table(s2)
         # Expects 2x LLDP flow entries
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 1, flows_s2
+        assert len(flows_s2) == BASIC_FLOWS + 1, str(flows_s2)
 
         # Assert GET liveness/ is enabled and down
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/?interface_id={interface_ids[1]}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data["interfaces"], data["interfaces"]
         assert data["interfaces"][0]["id"] == interface_ids[1], data["interfaces"]
@@ -226,7 +225,7 @@ class TestE2EOfLLDP:
 
         # Assert link metadata has liveness_status "down"
         api_url = f"{KYTOS_API}/topology/v3/links"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data["links"]
@@ -241,13 +240,13 @@ class TestE2EOfLLDP:
         # Wait just so hellos are received again
         time.sleep(10)
         s2 = self.net.net.get('s2')
-        flows_s2 = s2.dpctl("dump-flows")
+        flows_s2 = dump_flow_table(s2)
         # Expects 1x LLDP flow entry
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
 
         # Assert GET liveness/ is enabled and up
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/?interface_id={interface_ids[1]}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert data["interfaces"], data["interfaces"]
         assert data["interfaces"][0]["id"] == interface_ids[1], data["interfaces"]
@@ -255,7 +254,7 @@ class TestE2EOfLLDP:
 
         # Assert link metadata has liveness_status "up"
         api_url = f"{KYTOS_API}/topology/v3/links"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data["links"]
@@ -274,7 +273,7 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ entries are in init state
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         for entry in data["interfaces"]:
             assert entry["id"] in interface_ids, entry
@@ -282,7 +281,7 @@ class TestE2EOfLLDP:
 
         # Disable the intf for deletion
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}/disable/'
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         # Deactivate the interface for deletion
@@ -291,7 +290,7 @@ class TestE2EOfLLDP:
         time.sleep(5)
 
         api_url = f'{KYTOS_API}/topology/v3/interfaces/{intf_id}'
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
         # Restart the controller maintaining config
@@ -299,6 +298,6 @@ class TestE2EOfLLDP:
 
         # Assert GET liveness/ don't have any enabled interfaces
         api_url = f"{KYTOS_API}/of_lldp/v1/liveness/"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data = response.json()
         assert not data["interfaces"]
@@ -1,24 +1,23 @@
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import time
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2EOfLLDPLoopDetection:
     net = None
+    topo_name = "looped"
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name='looped')
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
         cls.net.restart_kytos_clean()
         time.sleep(10)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def restart(self, _clean_config=False, _enable_all=False):
 
@@ -39,7 +38,7 @@ class TestE2EOfLLDPLoopDetection:
 
         # GET topology with the interface ensuring that it's disabled
         api_url = KYTOS_API + '/topology/v3/interfaces' 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert 'looped' in data['interfaces'][interface_id]['metadata']
@@ -52,7 +51,7 @@ class TestE2EOfLLDPLoopDetection:
 
         # GET topology with the interfaces ensuring that they are enabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data['interfaces'][interface_id4]['enabled']
@@ -62,7 +61,7 @@ class TestE2EOfLLDPLoopDetection:
 
         # GET topology with the interface ensuring that they are enabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         # [4,5] is an ignored loop
@@ -78,7 +77,7 @@ class TestE2EOfLLDPLoopDetection:
 
         # GET topology with the interfaces ensuring that they are enabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data['interfaces'][interface_id4]['enabled']
@@ -88,14 +87,14 @@ class TestE2EOfLLDPLoopDetection:
 
         # Reconfigure the ignored loops
         api_url = KYTOS_API + '/topology/v3/switches/%s/metadata' % switch
-        response = requests.post(api_url, json={"ignored_loops": []})
+        response = kytos_api.post(api_url, json={"ignored_loops": []})
         assert response.status_code == 201, response.text
 
         self.restart()
 
         # GET topology with the interface ensuring that they are enabled
         api_url = KYTOS_API + '/topology/v3/interfaces'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         # [4,5] is an ignored loop, it was reconfigured
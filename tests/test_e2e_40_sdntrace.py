@@ -1,34 +1,32 @@
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, evc_active, kytos_api, network_pool, wait_until
 import time
 import random
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api' % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2ESDNTrace:
     net = None
+    topo_name = "linear10"
     circuit = None
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name='linear10')
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def setup_method(self, method):
         """
         It is called at the beginning of each method execution
         """
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
         circuit_id = self.create_evc(400)
-        time.sleep(10)
-        self.circuit = self.wait_until_evc_is_active(circuit_id)
+        self.circuit = wait_until(evc_active(circuit_id), timeout=120)
 
 
     @staticmethod
@@ -46,33 +44,11 @@ class TestE2ESDNTrace:
                 "tag": {"tag_type": "vlan", "value": vlan_id}
             }
         }
-        api_url = KYTOS_API + '/kytos/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
-        assert response.status_code == 201, response.text
-        data = response.json()
-        return data['circuit_id']
+        return kytos_api.create_evc(payload)['circuit_id']
 
     @staticmethod
     def get_evc(circuit_id):
-        api_url = KYTOS_API + '/kytos/mef_eline/v2/evc/'
-        response = requests.get(api_url+circuit_id)
-        assert response.status_code == 200, response.text
-        data = response.json()
-        return data
-
-    @classmethod
-    def wait_until_evc_is_active(
-        cls, evc_id: str, wait_secs=6, i=0, max_i=20
-    ) -> dict:
-        """Wait until evc is active."""
-        evc = cls.get_evc(evc_id)
-        if evc["active"]:
-            return evc
-        time.sleep(wait_secs)
-        if i < max_i:
-            return cls.wait_until_evc_is_active(evc_id, wait_secs, i + 1, max_i)
-        else:
-            raise ValueError(f"TimeoutError: {evc_id} didn't get active. {evc}")
+        return kytos_api.get_evc(circuit_id)
 
     def test_001_run_sdntrace_cp(self):
         """Run SDNTrace-CP (Control Plane)."""
@@ -84,7 +60,7 @@ class TestE2ESDNTrace:
             }
         }
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/trace'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         assert "result" in data, data
@@ -115,7 +91,7 @@ class TestE2ESDNTrace:
             }
         }
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/trace'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         assert "result" in data
@@ -144,7 +120,7 @@ class TestE2ESDNTrace:
         while wait_count < timeout:
             try:
                 api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-                response = requests.get(f"{api_url}/{trace_id}")
+                response = kytos_api.get(f"{api_url}/{trace_id}")
                 data = response.json()
                 assert data["result"][-1]["reason"] == "done"
                 break
@@ -184,7 +160,7 @@ class TestE2ESDNTrace:
         }
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         assert "result" in data, data
@@ -231,7 +207,7 @@ class TestE2ESDNTrace:
         }
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         assert "result" in data, data
@@ -270,7 +246,7 @@ class TestE2ESDNTrace:
         }
 
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:05'
-        response = requests.delete(api_url, json=delete_flow)
+        response = kytos_api.delete(api_url, json=delete_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -282,7 +258,7 @@ class TestE2ESDNTrace:
             }
         }
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/trace'
-        response = requests.put(api_url, json=payload_1)
+        response = kytos_api.put(api_url, json=payload_1)
         data = response.json()
         # only 4 steps are expected: starting, 1->2, 2->3, 3->4
         assert len(data["result"]) == 4, str(data)
@@ -330,7 +306,7 @@ class TestE2ESDNTrace:
         }
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=payload_2)
+        response = kytos_api.put(api_url, json=payload_2)
         assert response.status_code == 200, response.text
         data = response.json()
         result = self.wait_sdntrace_result(data["result"]["trace_id"])
@@ -353,13 +329,13 @@ class TestE2ESDNTrace:
         # 4. redeploy evc and check again
         circuit_id = self.circuit['id']
         api_url = KYTOS_API + '/kytos/mef_eline/v2/evc'
-        response = requests.patch(f"{api_url}/{circuit_id}/redeploy")
+        response = kytos_api.patch(f"{api_url}/{circuit_id}/redeploy")
         assert response.status_code == 202, response.text
         time.sleep(10)
-        self.circuit = self.wait_until_evc_is_active(circuit_id)
+        self.circuit = wait_until(evc_active(circuit_id), timeout=120)
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/trace'
-        response = requests.put(api_url, json=payload_1)
+        response = kytos_api.put(api_url, json=payload_1)
         data = response.json()
         assert len(data["result"]) == 10, data
         expected = [
@@ -377,7 +353,7 @@ class TestE2ESDNTrace:
         assert expected == actual, f"Expected {expected}. Actual: {actual}"
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=payload_2)
+        response = kytos_api.put(api_url, json=payload_2)
         assert response.status_code == 200, response.text
         data = response.json()
         result = self.wait_sdntrace_result(data["result"]["trace_id"])
@@ -446,7 +422,7 @@ class TestE2ESDNTrace:
                 ]
                 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"] 
@@ -488,7 +464,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
        # Add a flow in S2: in_port = 2, out_port = 3
@@ -509,7 +485,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
         # Add a flow in S3: in_port = 2, "no action"
@@ -524,7 +500,7 @@ class TestE2ESDNTrace:
                 ]
             }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:03'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -543,7 +519,7 @@ class TestE2ESDNTrace:
                 ]
                 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"] 
@@ -570,12 +546,12 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
         # Add a flow in S2: 
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -594,7 +570,7 @@ class TestE2ESDNTrace:
                 ]
                 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"] 
@@ -624,7 +600,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
         payload = [
@@ -642,7 +618,7 @@ class TestE2ESDNTrace:
                 ]
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"] 
@@ -683,7 +659,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -719,12 +695,12 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"] 
@@ -767,7 +743,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -786,7 +762,7 @@ class TestE2ESDNTrace:
                 ]
                 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"]
@@ -810,7 +786,7 @@ class TestE2ESDNTrace:
         ]
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"]
@@ -821,7 +797,7 @@ class TestE2ESDNTrace:
         assert list_results[0][-1]["type"] == "last"
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=payload[0])
+        response = kytos_api.put(api_url, json=payload[0])
         assert response.status_code == 200, response.text
         data = response.json()
         assert "result" in data, data
@@ -855,7 +831,7 @@ class TestE2ESDNTrace:
                 ]
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"]
@@ -865,7 +841,7 @@ class TestE2ESDNTrace:
         assert list_results[0][-1]["type"] == "last"
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=payload[0])
+        response = kytos_api.put(api_url, json=payload[0])
         assert response.status_code == 200, response.text
         data = response.json()
         assert "result" in data, data
@@ -895,7 +871,7 @@ class TestE2ESDNTrace:
                     }               ]
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 400, response.text
 
         # Wrong data type (dpid should be string):
@@ -903,7 +879,7 @@ class TestE2ESDNTrace:
         payload[0]['trace']['switch']['dpid'] = 1
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 400, response.text
 
         # Wrong dl_vlan (should be integer):
@@ -911,14 +887,14 @@ class TestE2ESDNTrace:
         payload[0]['trace']['eth']['dl_vlan'] = "10"
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 400, response.text
 
         # dl_vlan out of range (should be in [1, 4095]):
         payload[0]['trace']['eth']['dl_vlan'] = 4096
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 400, response.text
  
         # Wrong dl_type (should be integer):
@@ -926,14 +902,14 @@ class TestE2ESDNTrace:
         payload[0]['trace']['eth']['dl_type'] = "1"
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 400, response.text
  
         # Valid request:
         payload[0]['trace']['eth']['dl_type'] = 1
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200
 
     def test_085_test_evcs_terminating_on_nnis(cls):
@@ -952,7 +928,7 @@ class TestE2ESDNTrace:
                 }
             }
         api_url = KYTOS_API + '/kytos/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
 
         time.sleep(5)
@@ -977,7 +953,7 @@ class TestE2ESDNTrace:
                 ]
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         results = response.json()['result']
         data = results[0][0]
@@ -1017,7 +993,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
        
@@ -1036,7 +1012,7 @@ class TestE2ESDNTrace:
                 ]
                 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()["result"][0][0]
         
@@ -1071,7 +1047,7 @@ class TestE2ESDNTrace:
         ]
 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()["result"]
 
@@ -1095,7 +1071,7 @@ class TestE2ESDNTrace:
         }}
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=trace_payload)
+        response = kytos_api.put(api_url, json=trace_payload)
         assert response.status_code == 200, response.text
         data = response.json()
         result = cls.wait_sdntrace_result(data["result"]["trace_id"])
@@ -1115,7 +1091,7 @@ class TestE2ESDNTrace:
             }]
         }]}
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json=flow_payload)
+        response = kytos_api.post(api_url, json=flow_payload)
         assert response.status_code == 202, response.text
 
         flow_payload = {"flows": [{
@@ -1131,12 +1107,12 @@ class TestE2ESDNTrace:
             }]
         }]}
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.post(api_url, json=flow_payload)
+        response = kytos_api.post(api_url, json=flow_payload)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=trace_payload)
+        response = kytos_api.put(api_url, json=trace_payload)
         assert response.status_code == 200, response.text
         data = response.json()
         result = cls.wait_sdntrace_result(data["result"]["trace_id"])
@@ -1156,7 +1132,7 @@ class TestE2ESDNTrace:
         }}
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=trace_payload)
+        response = kytos_api.put(api_url, json=trace_payload)
         assert response.status_code == 200, response.text
         data = response.json()
         result = cls.wait_sdntrace_result(data["result"]["trace_id"])
@@ -1176,7 +1152,7 @@ class TestE2ESDNTrace:
             }]
         }]}
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url, json=flow_payload)
+        response = kytos_api.post(api_url, json=flow_payload)
         assert response.status_code == 202, response.text
 
         flow_payload = {"flows": [{
@@ -1192,12 +1168,12 @@ class TestE2ESDNTrace:
             }]
         }]}
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:02'
-        response = requests.post(api_url, json=flow_payload)
+        response = kytos_api.post(api_url, json=flow_payload)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
         api_url = KYTOS_API + '/amlight/sdntrace/v1/trace'
-        response = requests.put(api_url, json=trace_payload)
+        response = kytos_api.put(api_url, json=trace_payload)
         assert response.status_code == 200, response.text
         data = response.json()
         result = cls.wait_sdntrace_result(data["result"]["trace_id"])
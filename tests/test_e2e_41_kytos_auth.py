@@ -1,8 +1,7 @@
 import os
 import time
 import shutil
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import mock
 # make sure the correct args will be passed to kytosd
 # (it may be an issue if you run pytest with -v)
@@ -10,11 +9,12 @@ with mock.patch('sys.argv', ["kytosd"]):
     from kytos.core.auth import UserController
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2EKytosAuth:
     net = None
+    topo_name = "ring"
 
     def setup_method(self, method):
         """
@@ -36,33 +36,32 @@ class TestE2EKytosAuth:
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def get_token(self):
         api_url = KYTOS_API + '/core/auth/login/'
-        answer = requests.get(api_url, auth=(self.username, self.password))
+        answer = kytos_api.get(api_url, auth=(self.username, self.password))
 
         return answer.json()['token']
 
     def test_authenticate_user(self):
         api_url = KYTOS_API + '/core/auth/login/'
-        answer = requests.get(api_url, auth=(self.username, self.password))
+        answer = kytos_api.get(api_url, auth=(self.username, self.password))
         assert answer.status_code == 200
 
         #Error: Unauthorized
         wrong_password = "wrong_password"
-        answer_fail = requests.get(api_url, auth=(self.username, wrong_password))
+        answer_fail = kytos_api.get(api_url, auth=(self.username, wrong_password))
         assert answer_fail.status_code == 401
         assert answer_fail.json()["description"] == "Incorrect password"
 
         #Error: NoTFound
         wrong_username = "wrong_username"
-        fail_answer = requests.get(api_url, auth=(wrong_username, self.password))
+        fail_answer = kytos_api.get(api_url, auth=(wrong_username, self.password))
         assert fail_answer.status_code == 404
         assert fail_answer.json()["description"] == f"User {wrong_username} not found"
 
@@ -74,7 +73,7 @@ class TestE2EKytosAuth:
         }
         self.user_controller.create_user(new_data)
         api_url = KYTOS_API + '/core/auth/users/'
-        answer = requests.get(api_url, headers=self.auth_header)
+        answer = kytos_api.get(api_url, headers=self.auth_header)
         data = answer.json()["users"]
         assert len(data) > 1
         assert list == type(data)
@@ -90,19 +89,19 @@ class TestE2EKytosAuth:
 
         #Error: "Token not sent"
         wrong_header = {"Authorization": "Bearer wrong"}
-        answer_fail = requests.get(api_url, headers=wrong_header)
+        answer_fail = kytos_api.get(api_url, headers=wrong_header)
         assert answer_fail.status_code == 401
 
     def test_list_user(self):
         api_url = KYTOS_API + '/core/auth/users/' + self.username
-        answer = requests.get(api_url, headers=self.auth_header)
+        answer = kytos_api.get(api_url, headers=self.auth_header)
         data = answer.json()
         assert self.username == data["username"]
         assert self.email == data["email"]
 
         #Error: NotFound
         api_url = KYTOS_API + '/core/auth/users/' + "non_exist"
-        answer_fail = requests.get(api_url, headers=self.auth_header)
+        answer_fail = kytos_api.get(api_url, headers=self.auth_header)
         assert answer_fail.status_code == 404
 
     def test_create_user(self):
@@ -112,8 +111,8 @@ class TestE2EKytosAuth:
             "password": "SecondUser123",
             "email": "second@kytos.io"
         }
-        answer = requests.post(api_url, json=user_data,
-                               headers=self.auth_header)
+        answer = kytos_api.post(api_url, json=user_data,
+                                headers=self.auth_header)
         assert answer.status_code == 201
         assert answer.json() == "User successfully created"
         user = self.user_controller.get_user(user_data["username"])
@@ -121,8 +120,8 @@ class TestE2EKytosAuth:
         assert user["email"] == user_data["email"]
         
         #Error: DuplicateKeyError - Conflict
-        fail_answer = requests.post(api_url, json=user_data,
-                                    headers=self.auth_header)
+        fail_answer = kytos_api.post(api_url, json=user_data,
+                                     headers=self.auth_header)
         assert fail_answer.status_code == 409
 
         wrong_data = {
@@ -131,13 +130,13 @@ class TestE2EKytosAuth:
             "email": "wrong_email"
         }
         #Error: ValidationError - BadRequest
-        answer_fail = requests.post(api_url, json=wrong_data,
-                                    headers=self.auth_header)
+        answer_fail = kytos_api.post(api_url, json=wrong_data,
+                                     headers=self.auth_header)
         assert answer_fail.status_code == 400
 
     def test_delete_user(self):
         api_url = KYTOS_API + '/core/auth/users/' + self.username
-        answer = requests.delete(api_url, headers=self.auth_header)
+        answer = kytos_api.delete(api_url, headers=self.auth_header)
         assert answer.status_code == 200
         assert answer.json() == f"User {self.username} deleted succesfully"
         new_data = self.user_controller.get_user(self.username)
@@ -146,48 +145,48 @@ class TestE2EKytosAuth:
 
         #Error: NotFound
         api_url = KYTOS_API + '/core/auth/users/' + "non_exist"
-        answer = requests.delete(api_url, headers=self.auth_header)
+        answer = kytos_api.delete(api_url, headers=self.auth_header)
         assert answer.status_code == 404
 
     def test_update_user_username(self):
         api_url = KYTOS_API + '/core/auth/users/' + self.username
         new_username = {"username": "NewUsername"}
-        answer = requests.patch(api_url, json=new_username,
-                                headers=self.auth_header)
+        answer = kytos_api.patch(api_url, json=new_username,
+                                 headers=self.auth_header)
         assert answer.status_code == 200
 
         api_url = KYTOS_API + '/core/auth/login/'
-        new_answer = requests.get(api_url, auth=(new_username["username"], self.password))
+        new_answer = kytos_api.get(api_url, auth=(new_username["username"], self.password))
         assert new_answer.status_code == 200
 
     def test_update_user_password(self):
         api_url = KYTOS_API + '/core/auth/users/' + self.username
         new_password = {"password": "NewPassword456"}
-        answer = requests.patch(api_url, json=new_password,
-                                headers=self.auth_header)
+        answer = kytos_api.patch(api_url, json=new_password,
+                                 headers=self.auth_header)
         assert answer.status_code == 200
 
         api_url = KYTOS_API + '/core/auth/login/'
-        answer = requests.get(api_url, auth=(self.username, new_password["password"]))
+        answer = kytos_api.get(api_url, auth=(self.username, new_password["password"]))
         assert answer.status_code == 200
 
     def test_update_user_email(self):
         new_email = {"email": "changed@kytos.io"}
         api_url = KYTOS_API + '/core/auth/users/' + self.username
-        answer = requests.patch(api_url, json=new_email,
-                                headers=self.auth_header)
+        answer = kytos_api.patch(api_url, json=new_email,
+                                 headers=self.auth_header)
         assert answer.status_code == 200
         updated_data = self.user_controller.get_user(self.username)
         assert updated_data["email"] == new_email["email"]
 
         #Error: NotFound
         api_url = KYTOS_API + '/core/auth/users/' + "non_exist"
-        answer = requests.patch(api_url, json=new_email,
-                                headers=self.auth_header)
+        answer = kytos_api.patch(api_url, json=new_email,
+                                 headers=self.auth_header)
         assert answer.status_code == 404
 
         #Error: ValidationError - BadRequest
         wrong_email = {"email": "wrong_email"}
-        answer = requests.patch(api_url, json=wrong_email,
-                                headers=self.auth_header)
+        answer = kytos_api.patch(api_url, json=wrong_email,
+                                 headers=self.auth_header)
         assert answer.status_code == 400
@@ -1,30 +1,29 @@
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import time
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api' % (CONTROLLER, KYTOS_API_PORT)
 
 
 class TestE2ESDNTrace:
     net = None
+    topo_name = "amlight_looped"
     circuit = None
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name='amlight_looped')
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def setup_method(self, method):
         """
         It is called at the beginning of each method execution
         """
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     def test_001_run_sdntrace_with_goto_table_intra(cls):
         """Run SDNTrace-CP for instruction type goto_table for the intra case:
@@ -167,7 +166,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:11'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -189,7 +188,7 @@ class TestE2ESDNTrace:
         ]
                 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"]
@@ -319,7 +318,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:11'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -417,7 +416,7 @@ class TestE2ESDNTrace:
             ]
         }
         api_url = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:18'
-        response = requests.post(api_url, json = payload_stored_flow)
+        response = kytos_api.post(api_url, json = payload_stored_flow)
         assert response.status_code == 202, response.text
         time.sleep(10)
 
@@ -439,7 +438,7 @@ class TestE2ESDNTrace:
         ]
                 
         api_url = KYTOS_API + '/amlight/sdntrace_cp/v1/traces'
-        response = requests.put(api_url, json=payload)
+        response = kytos_api.put(api_url, json=payload)
         assert response.status_code == 200, response.text
         data = response.json()
         list_results = data["result"]
@@ -2,12 +2,10 @@ import json
 import time
 from datetime import datetime, timedelta, UTC, timezone
 
-import requests
-
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, dump_flow_table, kytos_api, network_pool
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 
 TIME_FMT = "%Y-%m-%dT%H:%M:%S+0000"
 
@@ -20,26 +18,22 @@ BASIC_FLOWS = 3
 
 class TestE2EMaintenance:
     net = None
+    topo_name = "ring"
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="ring")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
         cls.net.restart_kytos_clean()
         cls.net.wait_switches_connect()
         time.sleep(10)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     @staticmethod
     def get_evc(circuit_id):
-        api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.get(api_url+circuit_id)
-        assert response.status_code == 200, response.text
-        data = response.json()
-        return data
+        return kytos_api.get_evc(circuit_id)
 
     @staticmethod
     def create_circuit(vlan_id):
@@ -69,7 +63,7 @@ class TestE2EMaintenance:
             ],
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(api_url, json=payload)
+        response = kytos_api.post(api_url, json=payload)
         assert response.status_code == 201, response.text
         data = response.json()
         return data["circuit_id"]
@@ -89,7 +83,7 @@ class TestE2EMaintenance:
 
         # Gets the maintenance schemas
         api_url = KYTOS_API + '/maintenance/v1/'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         json_data = response.json()
         assert json_data == []
@@ -134,12 +128,12 @@ class TestE2EMaintenance:
 
         # Initially, it should only have these flows
         s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 2, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 2, str(flows_s3)
 
         # Sets up the maintenance window information
         mw_start_delay = 10
@@ -157,7 +151,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'mw_id' in data
@@ -199,12 +193,12 @@ class TestE2EMaintenance:
 
         # Eventually these flows are expected over the original path again
         s1, s2, s3 = self.net.net.get('s1', 's2', 's3')
-        flows_s1 = s1.dpctl('dump-flows')
-        flows_s2 = s2.dpctl('dump-flows')
-        flows_s3 = s3.dpctl('dump-flows')
-        assert len(flows_s1.splitlines()) == BASIC_FLOWS + 2, flows_s1
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
-        assert len(flows_s3.splitlines()) == BASIC_FLOWS + 2, flows_s3
+        flows_s1 = dump_flow_table(s1)
+        flows_s2 = dump_flow_table(s2)
+        flows_s3 = dump_flow_table(s3)
+        assert len(flows_s1) == BASIC_FLOWS + 2, str(flows_s1)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
+        assert len(flows_s3) == BASIC_FLOWS + 2, str(flows_s3)
 
         # Cleans up
         h11.cmd('ip link del vlan100')
@@ -237,7 +231,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_020_create_mw_on_switch_should_fail_items_empty(self):
@@ -265,7 +259,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_025_create_mw_on_switch_should_fail_no_items_field_on_payload(self):
@@ -292,7 +286,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_030_create_mw_on_switch_should_fail_payload_empty(self):
@@ -309,7 +303,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_035_create_mw_on_switch_and_patch_new_end(self):
@@ -341,7 +335,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'mw_id' in data
@@ -352,7 +346,7 @@ class TestE2EMaintenance:
 
         # Gets the maintenance schema
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         json_data = response.json()
         assert json_data['id'] == mw_id
@@ -370,12 +364,12 @@ class TestE2EMaintenance:
 
         # Updates the maintenance window information
         mw_api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        request = requests.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
+        request = kytos_api.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
         assert request.status_code == 200
 
         # Gets the maintenance window schema
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         json_data = response.json()
         assert json_data['end'] == new_time.strftime(TIME_FMT)
 
@@ -384,9 +378,9 @@ class TestE2EMaintenance:
 
         # Verifies the flow behavior during the maintenance
         s2 = self.net.net.get('s2')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert 'dl_vlan=100' not in flows_s2
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert not flows_s2.find(dl_vlan="100"), str(flows_s2)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
 
         # Checks connectivity during maintenance
         h11, h3 = self.net.net.get('h11', 'h3')
@@ -403,8 +397,8 @@ class TestE2EMaintenance:
         time.sleep(mw_duration + mw_new_end_time + 5)
 
         # Verifies the flows behavior after the maintenance
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s2) == BASIC_FLOWS + 2
         result = h11.cmd('ping -c1 100.0.0.2')
         assert ', 0% packet loss,' in result
 
@@ -439,7 +433,7 @@ class TestE2EMaintenance:
         }
 
         mw_api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        request = requests.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
+        request = kytos_api.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
         assert request.status_code == 404
 
     def test_045_patch_mw_on_switch_should_fail_wrong_payload_on_dates(self):
@@ -468,7 +462,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -487,12 +481,12 @@ class TestE2EMaintenance:
 
         # Updates the maintenance window information
         mw_api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        request = requests.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
+        request = kytos_api.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
         assert request.status_code == 400
 
         # Deletes the maintenance by its id
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        requests.delete(api_url)
+        kytos_api.delete(api_url)
 
     def test_050_patch_mw_on_switch_should_fail_wrong_payload_items_empty(self):
         """
@@ -519,7 +513,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -536,12 +530,12 @@ class TestE2EMaintenance:
 
         # Updates the maintenance window information
         mw_api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        request = requests.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
+        request = kytos_api.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
         assert request.status_code == 400
 
         # Deletes the maintenance by its id
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        requests.delete(api_url)
+        kytos_api.delete(api_url)
 
     def test_055_patch_mw_on_switch_should_fail_empty_payload(self):
         """
@@ -570,7 +564,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -581,12 +575,12 @@ class TestE2EMaintenance:
 
         # Updates the maintenance window information
         mw_api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        request = requests.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
+        request = kytos_api.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
         assert request.status_code == 400
 
         # Deletes the maintenance by its id
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        requests.delete(api_url)
+        kytos_api.delete(api_url)
 
     def test_060_patch_mw_on_switch_should_fail_on_running_mw(self):
         """
@@ -616,7 +610,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'mw_id' in data
@@ -627,7 +621,7 @@ class TestE2EMaintenance:
 
         # Gets the maintenance schema
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         json_data = response.json()
         assert json_data['id'] == mw_id
@@ -647,7 +641,7 @@ class TestE2EMaintenance:
 
         # Updates a running maintenance
         mw_api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        request = requests.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
+        request = kytos_api.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
         assert request.status_code == 400
 
     def test_065_patch_mw_on_switch_new_start_delaying_mw(self):
@@ -678,7 +672,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'mw_id' in data
@@ -689,7 +683,7 @@ class TestE2EMaintenance:
 
         # Gets the maintenance schema
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         json_data = response.json()
         assert json_data['id'] == mw_id
@@ -706,12 +700,12 @@ class TestE2EMaintenance:
 
         # Updates the maintenance window information
         mw_api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        request = requests.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
+        request = kytos_api.patch(mw_api_url, data=json.dumps(payload1), headers={'Content-type': 'application/json'})
         assert request.status_code == 200
 
         # Gets the maintenance window schema
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         json_data = response.json()
         assert json_data['start'] == new_start.strftime(TIME_FMT)
 
@@ -730,8 +724,8 @@ class TestE2EMaintenance:
 
         # Verifies the flow at the initial MW time
         # (no maintenance at that time, it has been delayed)
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
         result = h11.cmd('ping -c1 100.0.0.2')
         assert ', 0% packet loss,' in result
 
@@ -739,9 +733,9 @@ class TestE2EMaintenance:
         time.sleep(mw_start_delay + 5)
 
         # Verifies the flow during maintenance time
-        flows_s2 = s2.dpctl('dump-flows')
-        assert 'dl_vlan=100' not in flows_s2
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert not flows_s2.find(dl_vlan="100"), str(flows_s2)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
         result = h11.cmd('ping -c1 100.0.0.2')
         assert ', 0% packet loss,' in result
 
@@ -749,8 +743,8 @@ class TestE2EMaintenance:
         time.sleep(mw_duration)
 
         # Verifies the flow behavior after the maintenance window
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s2) == BASIC_FLOWS + 2
         result = h11.cmd('ping -c1 100.0.0.2')
         assert ', 0% packet loss,' in result
 
@@ -787,7 +781,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         json_data = response.json()
         mw_id = json_data["mw_id"]
 
@@ -796,7 +790,7 @@ class TestE2EMaintenance:
 
         # Deletes running maintenance by its id
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        delete_response = requests.delete(api_url)
+        delete_response = kytos_api.delete(api_url)
         assert delete_response.status_code == 400
 
     def test_075_delete_future_mw_on_switch(self):
@@ -826,17 +820,17 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         json_data = response.json()
         mw_id = json_data["mw_id"]
 
         # Deletes the maintenance by its id
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        delete_response = requests.delete(api_url)
+        delete_response = kytos_api.delete(api_url)
         assert delete_response.status_code == 200
 
         # Gets the maintenance window schema
-        req = requests.get(api_url)
+        req = kytos_api.get(api_url)
         assert req.status_code == 404
 
         # Waits for the time in which the MW should start (but it is deleted)
@@ -853,8 +847,8 @@ class TestE2EMaintenance:
 
         # Verifies the flow behavior
         # (no maintenance at that time, it has been deleted)
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
         result = h11.cmd('ping -c1 100.0.0.2')
         assert ', 0% packet loss,' in result
 
@@ -874,7 +868,7 @@ class TestE2EMaintenance:
 
         # Deletes the maintenance by its id
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        delete_response = requests.delete(api_url)
+        delete_response = kytos_api.delete(api_url)
         assert delete_response.status_code == 404
 
     def test_085_end_running_mw_on_switch(self):
@@ -898,7 +892,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -906,7 +900,7 @@ class TestE2EMaintenance:
 
         # Gets the maintenance schema
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         json_data = response.json()
         assert json_data['id'] == mw_id
@@ -916,9 +910,9 @@ class TestE2EMaintenance:
 
         # Verifies the flow behavior during the maintenance
         s2 = self.net.net.get('s2')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert 'dl_vlan=100' not in flows_s2
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS
+        flows_s2 = dump_flow_table(s2)
+        assert not flows_s2.find(dl_vlan="100"), str(flows_s2)
+        assert len(flows_s2) == BASIC_FLOWS
 
         # Checks connectivity during maintenance
         h11, h3 = self.net.net.get('h11', 'h3')
@@ -933,15 +927,15 @@ class TestE2EMaintenance:
 
         # Ends the maintenance window information
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/end'
-        end_response = requests.patch(api_url)
+        end_response = kytos_api.patch(api_url)
         assert end_response.status_code == 200
 
         # Waits just a couple of seconds to give kytos enough time to restore the flows
         time.sleep(5)
 
         # Verifies the flow behavior and connectivity after ending the maintenance
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
         result = h11.cmd('ping -c1 100.0.0.2')
         assert ', 0% packet loss,' in result
 
@@ -961,7 +955,7 @@ class TestE2EMaintenance:
 
         # Ends an unknown maintenance
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/end'
-        end_response = requests.patch(api_url)
+        end_response = kytos_api.patch(api_url)
         assert end_response.status_code == 404
 
     def test_095_end_not_running_mw_on_switch_should_fail(self):
@@ -991,18 +985,18 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1/'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         json_data = response.json()
         mw_id = json_data["mw_id"]
 
         # Ends a not running maintenance
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/end'
-        end_response = requests.patch(api_url)
+        end_response = kytos_api.patch(api_url)
         assert end_response.status_code == 400
 
         # Deletes the maintenance by its id
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        requests.delete(api_url)
+        kytos_api.delete(api_url)
 
     def test_100_extend_running_mw_on_switch(self):
 
@@ -1027,7 +1021,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -1035,7 +1029,7 @@ class TestE2EMaintenance:
 
         # Gets the maintenance schema
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         json_data = response.json()
         assert json_data['id'] == mw_id
@@ -1045,9 +1039,9 @@ class TestE2EMaintenance:
 
         # Verifies the flow behavior during the maintenance
         s2 = self.net.net.get('s2')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert 'dl_vlan=100' not in flows_s2
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert not flows_s2.find(dl_vlan="100"), str(flows_s2)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
 
         # Checks connectivity during maintenance
         h11, h3 = self.net.net.get('h11', 'h3')
@@ -1064,7 +1058,7 @@ class TestE2EMaintenance:
 
         # extend the maintenance window information
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/extend'
-        response = requests.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         # Waits to the time that the MW should be ended but instead will be running (extended)
@@ -1072,9 +1066,9 @@ class TestE2EMaintenance:
 
         # Verifies the flow behavior during the maintenance
         s2 = self.net.net.get('s2')
-        flows_s2 = s2.dpctl('dump-flows')
-        assert 'dl_vlan=100' not in flows_s2
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert not flows_s2.find(dl_vlan="100"), str(flows_s2)
+        assert len(flows_s2) == BASIC_FLOWS, str(flows_s2)
 
         # Checks connectivity during maintenance
         h11, h3 = self.net.net.get('h11', 'h3')
@@ -1091,8 +1085,8 @@ class TestE2EMaintenance:
         time.sleep(mw_extension*60)
 
         # Verifies the flows behavior after the maintenance
-        flows_s2 = s2.dpctl('dump-flows')
-        assert len(flows_s2.splitlines()) == BASIC_FLOWS + 2, flows_s2
+        flows_s2 = dump_flow_table(s2)
+        assert len(flows_s2) == BASIC_FLOWS + 2, str(flows_s2)
         result = h11.cmd('ping -c1 100.0.0.2')
         assert ', 0% packet loss,' in result
 
@@ -1122,7 +1116,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -1132,7 +1126,7 @@ class TestE2EMaintenance:
 
         # extend the maintenance window information
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/extend'
-        response = requests.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_110_extend_unknown_mw_on_switch_should_fail(self):
@@ -1145,7 +1139,7 @@ class TestE2EMaintenance:
 
         # extend the maintenance window information
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/extend'
-        response = requests.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
         assert response.status_code == 404, response.text
 
     def test_115_extend_running_mw_on_switch_under_unknown_tag_should_fail(self):
@@ -1170,7 +1164,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -1183,7 +1177,7 @@ class TestE2EMaintenance:
 
         # extend the maintenance window information
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/extend'
-        response = requests.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_120_extend_ended_mw_on_switch_should_fail(self):
@@ -1208,7 +1202,7 @@ class TestE2EMaintenance:
 
         # Creates a new maintenance window
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
 
         # Extracts the maintenance window id from the JSON structure
@@ -1221,7 +1215,7 @@ class TestE2EMaintenance:
 
         # extend the maintenance window information
         api_url = KYTOS_API + '/maintenance/v1/' + mw_id + '/extend'
-        response = requests.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_url, data=json.dumps(payload2), headers={'Content-type': 'application/json'})
         assert response.status_code == 400, response.text
 
     def test_125_multiple_payload_item_filtering(self):
@@ -1241,12 +1235,12 @@ class TestE2EMaintenance:
             ],
         }
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 201, data
         assert "mw_id" in data
         api_url = KYTOS_API + f'/maintenance/v1/{data["mw_id"]}'
-        response = requests.get(api_url, headers={'Content-type': 'application/json'})
+        response = kytos_api.get(api_url, headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 200, data
         assert data["start"] == start.strftime(TIME_FMT)
@@ -1275,12 +1269,12 @@ class TestE2EMaintenance:
             ],
         }
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 201, data
         assert "mw_id" in data
         api_url = KYTOS_API + f'/maintenance/v1/{data["mw_id"]}'
-        response = requests.get(api_url, headers={'Content-type': 'application/json'})
+        response = kytos_api.get(api_url, headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 200, data
         assert data["start"] == start.strftime(TIME_FMT)
@@ -1303,12 +1297,12 @@ class TestE2EMaintenance:
             ],
         }
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 201, data
         assert "mw_id" in data
         api_url = KYTOS_API + f'/maintenance/v1/{data["mw_id"]}'
-        response = requests.get(api_url, headers={'Content-type': 'application/json'})
+        response = kytos_api.get(api_url, headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 200, data
         assert data["start"] == start.strftime(TIME_FMT)
@@ -1331,12 +1325,12 @@ class TestE2EMaintenance:
             ],
         }
         api_url = KYTOS_API + '/maintenance/v1'
-        response = requests.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 201, data
         assert "mw_id" in data
         api_url = KYTOS_API + f'/maintenance/v1/{data["mw_id"]}'
-        response = requests.get(api_url, headers={'Content-type': 'application/json'})
+        response = kytos_api.get(api_url, headers={'Content-type': 'application/json'})
         data = response.json()
         assert response.status_code == 200, data
         assert data["start"] == start.strftime(TIME_FMT)
@@ -1356,21 +1350,21 @@ class TestE2EMaintenance:
             "switches": [switch_id],
             "force": True,
         }
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 201, data
         
         # Time conflict with first request
         payload["start"] = (now + timedelta(seconds=30)).strftime(TIME_FMT)
         payload["end"] = (now + timedelta(seconds=80)).strftime(TIME_FMT)
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 400, data
 
         # No time confict
         payload["start"] = (now + timedelta(seconds=110)).strftime(TIME_FMT)
         payload['end'] = (now + timedelta(seconds=200)).strftime(TIME_FMT)
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 201, data
 
@@ -1387,28 +1381,28 @@ class TestE2EMaintenance:
             "switches": ["00:00:00:00:00:00:00:01"],
             "force": True,
         }
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 201, data
 
         # Fail, interferes with MW1, start is after
         payload["start"] = (now + timedelta(seconds=50)).strftime(TIME_FMT)
         payload["end"] = None
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 400, data
 
         # Fail, interferes with MW1, start is before but no end time
         payload["start"] = (now + timedelta(seconds=10)).strftime(TIME_FMT)
         payload["end"] = None
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 400, data
 
         # Base line with no end time, MW2
         payload["start"] = (now + timedelta(seconds=200)).strftime(TIME_FMT)
         payload["end"] = None
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 201, data
         MW_id = data["mw_id"]
@@ -1416,19 +1410,19 @@ class TestE2EMaintenance:
         # Fail, interferes with MW2, start is after
         payload["start"] = (now + timedelta(seconds=400)).strftime(TIME_FMT)
         payload["end"] = None
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 400, data
 
         # Fail, interferes with MW2, start is before but has end time
         payload["start"] = (now + timedelta(seconds=150)).strftime(TIME_FMT)
         payload["end"] = (now + timedelta(hours=2)).strftime(TIME_FMT)
-        response = requests.post(api_url, data=json.dumps(payload))
+        response = kytos_api.post(api_url, data=json.dumps(payload))
         data = response.json()
         assert response.status_code == 400, data
 
         # Assert unreachable time stamp
-        response = requests.get(api_url+f"/{MW_id}")
+        response = kytos_api.get(api_url+f"/{MW_id}")
         assert response.status_code == 200, response.text
         data = response.json()
         unreachable = datetime.max.replace(tzinfo=timezone.utc, microsecond=0)
@@ -1454,13 +1448,13 @@ class TestE2EMaintenance:
             "force": True,
         }
         api_URL = f'{KYTOS_API}/maintenance/v1/'
-        response = requests.post(api_URL, data=json.dumps(payload))
+        response = kytos_api.post(api_URL, data=json.dumps(payload))
         assert response.status_code == 201, response.text
         data = response.json()
         mw_id = data["mw_id"]
 
         api_URL = f'{KYTOS_API}/maintenance/v1/{mw_id}'
-        response = requests.get(api_URL)
+        response = kytos_api.get(api_URL)
         assert response.status_code == 200, response.text
         mw_data_before = response.json()
         time.sleep(mw_start_delay + 5)
@@ -1472,11 +1466,11 @@ class TestE2EMaintenance:
             "days": mw_extension_days,
         }
         api_URL = f'{KYTOS_API}/maintenance/v1/{mw_id}/extend'
-        response = requests.patch(api_URL, data=json.dumps(payload), headers={'Content-type': 'application/json'})
+        response = kytos_api.patch(api_URL, data=json.dumps(payload), headers={'Content-type': 'application/json'})
         assert response.status_code == 200, response.text
 
         api_URL = f'{KYTOS_API}/maintenance/v1/{mw_id}'
-        response = requests.get(api_URL)
+        response = kytos_api.get(api_URL)
         assert response.status_code == 200, response.text
         mw_data_after = response.json()
     
@@ -1,30 +1,28 @@
 import time
-import re
 
-from tests.helpers import NetworkTest
-import requests
+from tests.helpers import KYTOS_API_PORT, dump_flow_table, kytos_api, network_pool
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = f'http://{CONTROLLER}:8181/api/kytos'
+KYTOS_API = f'http://{CONTROLLER}:{KYTOS_API_PORT}/api/kytos'
 OF_MULTI_TABLE_API = '/of_multi_table/v1/pipeline'
 
 BASIC_FLOWS = 3
 
 class TestE2EOfMultiTable:
+    topo_name = "ring"
 
     def setup_method(self, method):
         """Called at the beginning of each class method"""
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def restart(self, _clean_config=False, _enable_all=True):
         self.net.start_controller(clean_config=_clean_config, enable_all=_enable_all)
@@ -98,7 +96,7 @@ class TestE2EOfMultiTable:
 
         # Add circuit
         api_url = f"{KYTOS_API}/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=evc)
+        response = kytos_api.post(api_url, json=evc)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -106,86 +104,83 @@ class TestE2EOfMultiTable:
 
         # Add pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline)
+        response = kytos_api.post(api_url, json=pipeline)
         data = response.json()
         assert response.status_code == 201, response.text
         assert 'id' in data
 
         # Enabled pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data['id']}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
         # Get pipeline dictionary
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data['id']}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         pipeline_data = response.json()
         assert response.status_code == 200, response.text
         assert pipeline_data["status"] == "enabled"
 
         # Assert installed flows
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows').splitlines()
+        flows_s1 = dump_flow_table(s1)
         assert len(flows_s1) == 8, str(flows_s1)
         expected_flows = [
             # of_multi_table: 3 flows (tables 1, 2 and 3)
-            (r"cookie=0xad00000000000001.*table=0.*priority=0 actions=goto_table:1", 1),
-            (r"cookie=0xad00000000000001.*table=1.*priority=0 actions=goto_table:2", 1),
-            (r"cookie=0xad00000000000001.*table=2.*priority=0 actions=goto_table:3", 1),
+            (dict(cookie=0xad00000000000001, table=0, priority=0, actions="goto_table:1"), 1),
+            (dict(cookie=0xad00000000000001, table=1, priority=0, actions="goto_table:2"), 1),
+            (dict(cookie=0xad00000000000001, table=2, priority=0, actions="goto_table:3"), 1),
             # coloring: 2 flows (table 1)
-            (r"cookie=0xac00000000000001.*table=1.*dl_src=ee:ee:ee:.*actions=CONTROLLER:65535", 2),
+            (dict(cookie=0xac00000000000001, table=1, actions="CONTROLLER:65535"), 2),
             # of_lldp: 1 flow (table 1)
-            (r"cookie=0xab00000000000001.*table=1.*dl_vlan=3799.*actions=CONTROLLER:65535", 1),
+            (dict(cookie=0xab00000000000001, table=1, dl_vlan="3799", actions="CONTROLLER:65535"), 1),
             # mef_eline: 2 flows (table 2 and 3)
-            (r"cookie=0xaa.*table=2.*dl_vlan=100 actions=output:2", 1),
-            (r"cookie=0xaa.*table=3.*actions=push_vlan:0x8100,set_field:4196->vlan_vid,output:1", 1),
+            (dict(cookie_prefix=0xaa, table=2, dl_vlan="100", actions="output:2"), 1),
+            (dict(cookie_prefix=0xaa, table=3, actions="push_vlan:0x8100,set_field:4196->vlan_vid,output:1"), 1),
         ]
-        for pattern, matches in expected_flows:
-            assert sum(
-                len(re.findall(pattern, flow)) for flow in flows_s1
-            ) == matches, f"{matches=} {pattern=} {flows_s1=}"
+        for query, matches in expected_flows:
+            assert len(flows_s1.find(**query)) == matches, \
+                f"{matches=} {query=}\n{flows_s1}"
 
         self.net.start_controller(clean_config=False)
         self.net.wait_switches_connect()
         time.sleep(10)
 
         # Assert installed flows
-        flows_s1 = s1.dpctl('dump-flows').splitlines()
+        flows_s1 = dump_flow_table(s1)
         assert len(flows_s1) == 8, str(flows_s1)
-        for pattern, matches in expected_flows:
-            assert sum(
-                len(re.findall(pattern, flow)) for flow in flows_s1
-            ) == matches, f"{matches=} {pattern=} {flows_s1=}"
+        for query, matches in expected_flows:
+            assert len(flows_s1.find(**query)) == matches, \
+                f"{matches=} {query=}\n{flows_s1}"
 
         # Return to default pipeline
         # Disabled pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data['id']}/disable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
         # of_lldp and coloring have same priority and
         # order is not deterministic
-        flows_s1 = s1.dpctl('dump-flows').splitlines()
+        flows_s1 = dump_flow_table(s1)
         assert len(flows_s1) == 5, str(flows_s1)
         expected_flows_single_table = [
             # coloring: 2 flows
-            (r"cookie=0xac00000000000001.*table=0.*dl_src=ee:ee:ee:.*actions=CONTROLLER:65535", 2),
+            (dict(cookie=0xac00000000000001, table=0, actions="CONTROLLER:65535"), 2),
             # of_lldp: 1 flow (table 1)
-            (r"cookie=0xab00000000000001.*table=0.*dl_vlan=3799.*actions=CONTROLLER:65535", 1),
+            (dict(cookie=0xab00000000000001, table=0, dl_vlan="3799", actions="CONTROLLER:65535"), 1),
             # mef_eline: 2 flows
-            (r"cookie=0xaa.*table=0.*dl_vlan=100 actions=output:2", 1),
-            (r"cookie=0xaa.*table=0.*actions=push_vlan:0x8100,set_field:4196->vlan_vid,output:1", 1),
+            (dict(cookie_prefix=0xaa, table=0, dl_vlan="100", actions="output:2"), 1),
+            (dict(cookie_prefix=0xaa, table=0, actions="push_vlan:0x8100,set_field:4196->vlan_vid,output:1"), 1),
         ]
-        for pattern, matches in expected_flows_single_table:
-            assert sum(
-                len(re.findall(pattern, flow)) for flow in flows_s1
-            ) == matches, f"{matches=} {pattern=} {flows_s1=}"
+        for query, matches in expected_flows_single_table:
+            assert len(flows_s1.find(**query)) == matches, \
+                f"{matches=} {query=}\n{flows_s1}"
 
         # Delete disabled pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data['id']}"
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 200, response.text
 
     def test_010_delete_miss_flow(self):
@@ -218,20 +213,20 @@ class TestE2EOfMultiTable:
 
         # Add pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline)
+        response = kytos_api.post(api_url, json=pipeline)
         data = response.json()
         assert response.status_code == 201, response.text
         assert 'id' in data
 
         # Enabled pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data['id']}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows')
-        assert 'actions=goto_table:1' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert flows_s1.find(table=0, actions="goto_table:1"), str(flows_s1)
 
         # Delete all flows from switch 1
         s1.dpctl('del-flows')
@@ -239,8 +234,8 @@ class TestE2EOfMultiTable:
 
         time.sleep(10)
 
-        flows_s1 = s1.dpctl('dump-flows')
-        assert 'actions=goto_table:1' in flows_s1
+        flows_s1 = dump_flow_table(s1)
+        assert flows_s1.find(table=0, actions="goto_table:1"), str(flows_s1)
 
     def test_015_mef_eline_pipelined(self):
         "Test if mef_eline flows can communicate through tables"
@@ -284,7 +279,7 @@ class TestE2EOfMultiTable:
 
         # Add circuit
         api_url = f"{KYTOS_API}/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=evc)
+        response = kytos_api.post(api_url, json=evc)
         assert response.status_code == 201, response.text
         data = response.json()
         assert 'circuit_id' in data
@@ -301,21 +296,20 @@ class TestE2EOfMultiTable:
         assert ', 0% packet loss,' in result
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows').splitlines()
-        assert len(flows_s1) == 6, flows_s1
-        for flow in flows_s1:   
-            assert 'table=0' in flow
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == 6, str(flows_s1)
+        assert len(flows_s1.find(table=0)) == 6, str(flows_s1)
 
         # Add pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline)
+        response = kytos_api.post(api_url, json=pipeline)
         data = response.json()
         assert response.status_code == 201, response.text
         assert 'id' in data
 
         # Enabled pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data['id']}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
@@ -330,14 +324,11 @@ class TestE2EOfMultiTable:
         assert ', 0% packet loss,' in result
 
         s1 = self.net.net.get('s1')
-        flows_s1 = s1.dpctl('dump-flows').splitlines()
-        assert len(flows_s1) == 7, flows_s1
-        assert 'table=1' in flows_s1[4]
-        assert 'in_port=1,dl_vlan=100' in flows_s1[4]
-        assert 'table=1' in flows_s1[5]
-        assert 'in_port=3,dl_vlan=1 ' in flows_s1[5]
-        assert 'table=1' in flows_s1[6]
-        assert 'in_port=4,dl_vlan=1 ' in flows_s1[6]
+        flows_s1 = dump_flow_table(s1)
+        assert len(flows_s1) == 7, str(flows_s1)
+        assert flows_s1.find(table=1, in_port="1", dl_vlan="100"), str(flows_s1)
+        assert flows_s1.find(table=1, in_port="3", dl_vlan="1"), str(flows_s1)
+        assert flows_s1.find(table=1, in_port="4", dl_vlan="1"), str(flows_s1)
 
     def test_020_install_multiple_pipelines(test):
         """Test changing pipeline status"""
@@ -378,47 +369,47 @@ class TestE2EOfMultiTable:
                 
         # Add pipelines
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline1)
+        response = kytos_api.post(api_url, json=pipeline1)
         data1 = response.json()
         assert response.status_code == 201, response.text
         assert 'id' in response.json()
 
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline2)
+        response = kytos_api.post(api_url, json=pipeline2)
         data2 = response.json()
         assert response.status_code == 201, response.text
         assert 'id' in response.json()
 
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline3)
+        response = kytos_api.post(api_url, json=pipeline3)
         data3 = response.json()
         assert response.status_code == 201, response.text
         assert 'id' in response.json()
 
         # Enabled pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data1['id']}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
         # Try to enable another pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data2['id']}/enable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
         time.sleep(10)
 
         # Try to delete an enabled pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data2['id']}"
-        response = requests.delete(api_url)
+        response = kytos_api.delete(api_url)
         assert response.status_code == 409, response.text
 
         # Try to disable an already disable pipeline
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}/{data3['id']}/disable"
-        response = requests.post(api_url)
+        response = kytos_api.post(api_url)
         assert response.status_code == 200, response.text
 
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
 
         for pipeline in response.json()['pipelines']:
             if pipeline['id'] == data2['id']:
@@ -437,7 +428,7 @@ class TestE2EOfMultiTable:
         }
 
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline1)
+        response = kytos_api.post(api_url, json=pipeline1)
         assert response.status_code == 400, response.text
 
         # Invalid: Duplicated table group from napp
@@ -459,7 +450,7 @@ class TestE2EOfMultiTable:
         }
 
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline2)
+        response = kytos_api.post(api_url, json=pipeline2)
         assert response.status_code == 400, response.text
 
         # Invalid: goto_table value is lower than table_id
@@ -480,5 +471,5 @@ class TestE2EOfMultiTable:
 
 
         api_url = f"{KYTOS_API}{OF_MULTI_TABLE_API}"
-        response = requests.post(api_url, json=pipeline3)
+        response = kytos_api.post(api_url, json=pipeline3)
         assert response.status_code == 400, response.text
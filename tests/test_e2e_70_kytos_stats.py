@@ -2,14 +2,21 @@ import time
 import json
 import pytest
 
-from tests.helpers import NetworkTest
-import requests
+from tests.helpers import (
+    KYTOS_API_PORT,
+    flows_count,
+    flows_with_cookie,
+    kytos_api,
+    network_pool,
+    wait_until,
+)
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api' % (CONTROLLER, KYTOS_API_PORT)
 KYTOS_STATS = KYTOS_API + '/amlight/kytos_stats/v1'
 
 class TestE2EKytosStats:
+    topo_name = "ring"
     
     def setup_method(self, method):
         """Called at the beginning of each class method"""
@@ -18,8 +25,7 @@ class TestE2EKytosStats:
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
         # disable ipv6 router solicitation to avoid interfere with stats
         for host in cls.net.net.hosts:
             host.cmd("echo 0 | tee /proc/sys/net/ipv6/conf/*/router_solicitations")
@@ -29,20 +35,20 @@ class TestE2EKytosStats:
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def test_005_flow_stats(self):
         """Test flow_stats"""
  
         api_url = KYTOS_STATS + '/flow/stats?dpid=00:00:00:00:00:00:00:01'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == 1
         assert '00:00:00:00:00:00:00:01' in data, str(data)
 
         api_url = KYTOS_STATS + '/flow/stats?dpid=00:00:00:00:00:00:00:01&dpid=00:00:00:00:00:00:00:02'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == 2
@@ -50,12 +56,12 @@ class TestE2EKytosStats:
         assert '00:00:00:00:00:00:00:02' in data, str(data)
 
         api_url = KYTOS_STATS + '/flow/stats'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
 
         api_url = KYTOS_API + '/kytos/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data_topp = response.json()
         assert len(data) == len(data_topp['switches'])
 
@@ -63,14 +69,14 @@ class TestE2EKytosStats:
         """Test table_stats""" 
 
         api_url = KYTOS_STATS + '/table/stats?dpid=00:00:00:00:00:00:00:01' 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == 1
         assert '00:00:00:00:00:00:00:01' in data, str(data)
 
         api_url = KYTOS_STATS + '/table/stats?dpid=00:00:00:00:00:00:00:01&dpid=00:00:00:00:00:00:00:02' 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == 2
@@ -78,12 +84,12 @@ class TestE2EKytosStats:
         assert '00:00:00:00:00:00:00:02' in data, str(data)
 
         api_url = KYTOS_API + '/kytos/topology/v3/switches'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         data_topp = response.json()
         topo_switches = data_topp['switches']
 
         api_url = KYTOS_STATS + '/table/stats?table=0'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == len(topo_switches)
@@ -92,7 +98,7 @@ class TestE2EKytosStats:
             assert '0' in data[sw], str(data)
 
         api_url = KYTOS_STATS + '/table/stats?table=0&table=1'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == len(topo_switches)
@@ -102,7 +108,7 @@ class TestE2EKytosStats:
             assert '1' in data[sw], str(data)
 
         api_url = KYTOS_STATS + '/table/stats?dpid=00:00:00:00:00:00:00:01&table=0'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == 1
@@ -110,7 +116,7 @@ class TestE2EKytosStats:
         assert '0' in data['00:00:00:00:00:00:00:01'], str(data)
 
         api_url = KYTOS_STATS + '/table/stats'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == len(topo_switches)
@@ -148,14 +154,15 @@ class TestE2EKytosStats:
         }
 
         api_url_flow_manager = KYTOS_API + f'/kytos/flow_manager/v2/flows/{sw}'
-        response = requests.post(api_url_flow_manager, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url_flow_manager, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data_flow = response.json()
         assert 'FlowMod Messages Sent' in data_flow['response']
 
         # wait the flow to be installed
-        time.sleep(5)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_with_cookie(s1, cookie, 2))
 
         # send N packets, each one containing 1500 bytes
         # (14 ether hdr + 40 ipv6 + 8 icmp + 1438 payload)
@@ -167,7 +174,7 @@ class TestE2EKytosStats:
         time.sleep(10)
 
         api_url = KYTOS_STATS + f'/flow/stats?dpid={sw}'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data_flow = response.json()[sw]
         for flow_id, flow in data_flow.items():
@@ -180,7 +187,7 @@ class TestE2EKytosStats:
             pytest.fail(f"Flow not found: {data_flow}")
         
         api_url = KYTOS_STATS + f'/packet_count/{flow_id}' 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data['flow_id'] == flow_id
@@ -220,14 +227,15 @@ class TestE2EKytosStats:
         }
 
         api_url_flow_manager = KYTOS_API + f'/kytos/flow_manager/v2/flows/{sw}'
-        response = requests.post(api_url_flow_manager, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url_flow_manager, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data_flow = response.json()
         assert 'FlowMod Messages Sent' in data_flow['response']
 
         # wait the flow to be installed
-        time.sleep(5)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_with_cookie(s1, cookie, 2))
 
         # send N packets, each one containing 1500 bytes
         # (14 ether hdr + 40 ipv6 + 8 icmp + 1438 payload)
@@ -239,7 +247,7 @@ class TestE2EKytosStats:
         time.sleep(10)
 
         api_url = KYTOS_STATS + f'/flow/stats?dpid={sw}'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data_flow = response.json()[sw]
         for flow_id, flow in data_flow.items():
@@ -252,7 +260,7 @@ class TestE2EKytosStats:
             pytest.fail(f"Flow not found: {data_flow}")
         
         api_url = KYTOS_STATS + f'/bytes_count/{flow_id}' 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         assert data['flow_id'] == flow_id
@@ -265,12 +273,12 @@ class TestE2EKytosStats:
         time.sleep(10)
 
         api_url = KYTOS_STATS + '/flow/stats?dpid=00:00:00:00:00:00:00:01'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data_flow = response.json()['00:00:00:00:00:00:00:01']
 
         api_url = KYTOS_STATS + '/packet_count/per_flow/00:00:00:00:00:00:00:01' 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         tolerance = 0.01
@@ -287,12 +295,12 @@ class TestE2EKytosStats:
         time.sleep(10)
 
         api_url = KYTOS_STATS + '/flow/stats?dpid=00:00:00:00:00:00:00:01'  
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data_flow = response.json()['00:00:00:00:00:00:00:01']
 
         api_url = KYTOS_STATS + '/bytes_count/per_flow/00:00:00:00:00:00:00:01' 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
         for info_flow in data:
@@ -308,7 +316,7 @@ class TestE2EKytosStats:
         """ 
 
         api_url = KYTOS_STATS + '/table/stats?table=0'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
 
@@ -316,15 +324,15 @@ class TestE2EKytosStats:
         payload = {"flows": [{"match": {"in_port": 1}}]}
 
         api_url_flow_manager = KYTOS_API + '/kytos/flow_manager/v2/flows/00:00:00:00:00:00:00:01'
-        response = requests.post(api_url_flow_manager, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url_flow_manager, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data_flow = response.json()
         assert 'FlowMod Messages Sent' in data_flow['response']
 
         time.sleep(15)
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data_1 = response.json()
         increase_active_count = False
@@ -347,7 +355,7 @@ class TestE2EKytosStats:
         """ 
 
         api_url = KYTOS_STATS + '/table/stats?table=1'
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
 
@@ -355,15 +363,15 @@ class TestE2EKytosStats:
         payload = {"flows": [{"table_id": 1, "match": {"in_port": 1}}]}
         sw = "00:00:00:00:00:00:00:01"
         api_url_flow_manager = KYTOS_API + f'/kytos/flow_manager/v2/flows/{sw}'
-        response = requests.post(api_url_flow_manager, data=json.dumps(payload),
-                                 headers={'Content-type': 'application/json'})
+        response = kytos_api.post(api_url_flow_manager, data=json.dumps(payload),
+                                  headers={'Content-type': 'application/json'})
         assert response.status_code == 202, response.text
         data_flow = response.json()
         assert 'FlowMod Messages Sent' in data_flow['response']
 
         time.sleep(15)
 
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data_1 = response.json()
 
@@ -387,7 +395,7 @@ class TestE2EKytosStats:
         }
 
         api_url_flow_manager = KYTOS_API + f"/kytos/flow_manager/v2/flows/{sw}"
-        response = requests.post(
+        response = kytos_api.post(
             api_url_flow_manager,
             data=json.dumps(payload),
             headers={"Content-type": "application/json"},
@@ -397,7 +405,8 @@ class TestE2EKytosStats:
         assert "FlowMod Messages Sent" in data_flow["response"]
 
         # wait the flow to be installed
-        time.sleep(10)
+        s1 = self.net.net.get('s1')
+        wait_until(flows_count(s1, 2, pattern='in_port=(1 actions=output:2|2 actions=output:1)'))
 
         # set hosts IP and perform a ping
         h11, h12 = self.net.net.get('h11', 'h12')
@@ -415,7 +424,7 @@ class TestE2EKytosStats:
         time.sleep(20)
         port = "1"
         api_url = f"{KYTOS_STATS}/port/stats?dpid={sw}&port={port}"
-        response = requests.get(api_url)
+        response = kytos_api.get(api_url)
         assert response.status_code == 200, response.text
         data = response.json()
 
@@ -1,15 +1,15 @@
 import json
-import requests
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 import tests.helpers
 import time
 import pytest
 
 CONTROLLER = "127.0.0.1"
-KYTOS_API = "http://%s:8181/api/kytos" % CONTROLLER
+KYTOS_API = "http://%s:%d/api/kytos" % (CONTROLLER, KYTOS_API_PORT)
 
 class TestE2EPathfinder:
     net = None
+    topo_name = "multi"
 
     def setup_method(self, method):
         """
@@ -20,16 +20,15 @@ class TestE2EPathfinder:
         # Start the controller setting an environment in
         # which all elements are disabled in a clean setting
         self.net.restart_kytos_clean()
-        time.sleep(10)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER, topo_name="multi")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def restart(self, _clean_config=False, _enable_all=False):
         # Start the controller setting an environment in which the setting is
@@ -68,7 +67,7 @@ class TestE2EPathfinder:
 
         for link_id, metadata in links_metadata.items():
             api_url = f"{KYTOS_API}/topology/v3/links/{link_id}/metadata"
-            response = requests.post(
+            response = kytos_api.post(
                 api_url,
                 data=json.dumps(metadata),
                 headers={"Content-type": "application/json"},
@@ -113,7 +112,7 @@ class TestE2EPathfinder:
             "parameter": "hop",
         }
 
-        response = requests.post(api_url, json=post_body)
+        response = kytos_api.post(api_url, json=post_body)
         assert response.status_code == 200, response.text
         data = response.json()
         assert (
@@ -182,7 +181,7 @@ class TestE2EPathfinder:
             "parameter": attribute,
         }
 
-        response = requests.post(api_url, json=post_body)
+        response = kytos_api.post(api_url, json=post_body)
         assert response.status_code == 200, response.text
         data = response.json()
         assert (
@@ -242,7 +241,7 @@ class TestE2EPathfinder:
             },
         ]
 
-        response = requests.post(api_url, json=post_body)
+        response = kytos_api.post(api_url, json=post_body)
         assert response.status_code == 200, response.text
         data = response.json()
         assert (
@@ -299,7 +298,7 @@ class TestE2EPathfinder:
                 "cost": 11,
             },
         ]
-        response = requests.post(api_url, json=post_body)
+        response = kytos_api.post(api_url, json=post_body)
         assert response.status_code == 200, response.text
         data = response.json()
         assert (
@@ -4,20 +4,20 @@ import json
 import asyncio
 
 import pytest
-import requests
 from aiokafka import AIOKafkaConsumer
 from aiokafka.admin import AIOKafkaAdminClient, NewTopic
 
-from tests.helpers import NetworkTest
+from tests.helpers import KYTOS_API_PORT, kytos_api, network_pool
 
 CONTROLLER = '127.0.0.1'
-KYTOS_API = 'http://%s:8181/api/kytos' % CONTROLLER
+KYTOS_API = 'http://%s:%d/api/kytos' % (CONTROLLER, KYTOS_API_PORT)
 KAFKA_TOPIC = "event_logs"
 TIMEOUT = 1000
 KAFKA_ADDRESSES = os.environ.get("KAFKA_HOST_ADDR").split(',')
 
 class TestE2EKafkaEvents:
     net = None
+    topo_name = "ring"
     admin = None
 
     def setup_method(self, method):
@@ -33,12 +33,11 @@ class TestE2EKafkaEvents:
 
     @classmethod
     def setup_class(cls):
-        cls.net = NetworkTest(CONTROLLER)
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     async def check_for_assignments(self, consumer, max_tries=4, sleep_interval=0.5):
         """Check the consumer for assignments."""
@@ -85,7 +84,7 @@ class TestE2EKafkaEvents:
             }
         }
         api_url = KYTOS_API + '/mef_eline/v2/evc/'
-        response = requests.post(
+        response = kytos_api.post(
             api_url,
             data=json.dumps(payload),
             headers={'Content-type': 'application/json'},
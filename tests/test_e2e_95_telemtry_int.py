@@ -1,17 +1,15 @@
 """End-to-end tests for telemetry_int Napp."""
 
 import os
-import re
 import time
 from pathlib import Path
 
 import pytest
-import requests
 
-from .helpers import NetworkTest
+from .helpers import KYTOS_API_PORT, kytos_api, network_pool
 
 CONTROLLER = "127.0.0.1"
-KYTOS_API = f"http://{CONTROLLER}:8181/api"
+KYTOS_API = f"http://{CONTROLLER}:{KYTOS_API_PORT}/api"
 SCRIPTS_DIR = str(Path(__file__).resolve().parents[1] / "scripts")
 
 
@@ -39,6 +37,7 @@ class TestE2ETelemtryINT:
     """End-to-end tests for telemetry_int."""
 
     net = None
+    topo_name = "amlight_intlab"
 
     def setup_method(self, method):  # pylint: disable=unused-argument
         """
@@ -48,18 +47,17 @@ class TestE2ETelemtryINT:
         # the link state to up (for all links)
         self.net.config_all_links_up()
         self.net.restart_kytos_clean()
-        time.sleep(5)
+        self.net.wait_kytos_converged()
 
     @classmethod
     def setup_class(cls):
         """Called once before all test methods within a class are run."""
-        cls.net = NetworkTest(CONTROLLER, topo_name="amlight_intlab")
-        cls.net.start(start_controller=False)
+        cls.net = network_pool.acquire(CONTROLLER, topo_name=cls.topo_name)
 
     @classmethod
     def teardown_class(cls):
         """Called once after all tests in the class have finished for cleanup."""
-        cls.net.stop()
+        network_pool.release(cls.net)
 
     def create_evc(
         self,
@@ -80,7 +78,7 @@ class TestE2ETelemtryINT:
         }
         payload.update(kwargs)
         api_url = KYTOS_API + "/kytos/mef_eline/v2/evc/"
-        response = requests.post(api_url, json=payload, timeout=5)
+        response = kytos_api.post(api_url, json=payload, timeout=5)
         assert response.status_code == 201, response.text
         data = response.json()
         return data["circuit_id"]
@@ -98,7 +96,7 @@ class TestE2ETelemtryINT:
     def validate_evc_paths(self, evc_id, expected_current, expected_failover):
         """Validate EVC paths (current and failover) with the expected values."""
         # get evc data
-        response = requests.get(
+        response = kytos_api.get(
             f"{KYTOS_API}/kytos/mef_eline/v2/evc/{evc_id}", timeout=5
         )
         evc = response.json()
@@ -116,9 +114,14 @@ class TestE2ETelemtryINT:
         Validates flows length multiple switches.
         expected_counts: list[tuples] (switch_obj, expected_int)
         """
+        tables = self.net.dump_all_flows([switch for switch, _ in expected_counts])
+        # mef_eline (0xaa) and telemetry_int (0xa8) flows of the EVC
+        cookies = [prefix << 56 | int(evc_id, 16) for prefix in (0xaa, 0xa8)]
         for switch, count in expected_counts:
-            flows = switch.dpctl("dump-flows").splitlines()
-            flows = [flow for flow in flows if re.search(rf"cookie=0xa.{evc_id}", flow)]
+            flows = [
+                flow for cookie in cookies
+                for flow in tables[switch.name].find(cookie=cookie)
+            ]
             assert len(flows) == count, f"Wrong flows length for {switch}: {flows}"
 
     def validate_traffic(self, src, dst):
@@ -224,7 +227,7 @@ class TestE2ETelemtryINT:
 
         # enable INT
         api_url = KYTOS_API + "/kytos/telemetry_int/v1/evc/enable"
-        response = requests.post(api_url, json={"evc_ids": [evc_id]}, timeout=5)
+        response = kytos_api.post(api_url, json={"evc_ids": [evc_id]}, timeout=5)
         assert response.status_code == 201, response.text
 
         time.sleep(15)
@@ -0,0 +1,104 @@
+"""Unit tests of the dump-flows parser and index of tests/flow_table.py.
+
+They need neither Mininet nor a switch.
+"""
+import pytest
+
+from tests.flow_table import OFP_DEFAULT_PRIORITY, Flow, FlowTable
+
+DUMP = """\
+OFPST_FLOW reply (OF1.3) (xid=0x2):
+ cookie=0xab00000000000001, duration=5.021s, table=0, n_packets=10, n_bytes=600, send_flow_rem priority=50000,dl_vlan=3799,dl_type=0x88cc actions=CONTROLLER:65535
+ cookie=0xaa00000000000064, duration=4.5s, table=0, n_packets=0, n_bytes=0, priority=20000,in_port=1,dl_vlan=100 actions=set_field:4196->vlan_vid,output:2
+ cookie=0xaa00000000000064, duration=4.5s, table=0, n_packets=0, n_bytes=0, priority=20000,in_port=2,dl_vlan=100 actions=output:1
+ cookie=0xaa000000000000c8, duration=1.2s, table=1, n_packets=3, n_bytes=180, priority=20000,ip,in_port=1,nw_dst=10.0.0.2 actions=output:3
+ cookie=0x0, duration=9.3s, table=2, n_packets=0, n_bytes=0, actions=drop
+"""
+
+
+@pytest.fixture
+def table():
+    return FlowTable.parse(DUMP)
+
+
+def test_parse_flow():
+    flow = Flow.parse(
+        " cookie=0xaa00000000000064, duration=4.500s, table=3, n_packets=7,"
+        " n_bytes=420, idle_age=2, priority=20000,ip,in_port=1,dl_vlan=100"
+        " actions=pop_vlan,output:2"
+    )
+    assert flow.table == 3
+    assert flow.cookie == 0xaa00000000000064
+    assert flow.priority == 20000
+    assert flow.match == {"ip": None, "in_port": "1", "dl_vlan": "100"}
+    assert flow.actions == "pop_vlan,output:2"
+    assert flow.counters == {
+        "duration": 4.5, "n_packets": 7, "n_bytes": 420, "idle_age": 2,
+    }
+    assert str(flow) == flow.text
+    assert not flow.text.startswith(" ")
+
+
+def test_parse_flow_flags_and_defaults():
+    """Flags are separated by a space instead of a comma, and the table,
+    cookie and priority have defaults when not printed."""
+    flow = Flow.parse(
+        "duration=1s, n_packets=0, n_bytes=0, send_flow_rem reset_counts"
+        " dl_type=0x88cc actions=CONTROLLER:65535"
+    )
+    assert (flow.table, flow.cookie, flow.priority) == (0, 0, OFP_DEFAULT_PRIORITY)
+    assert flow.match == {"dl_type": "0x88cc"}
+
+
+def test_parse_flow_masked_cookie():
+    flow = Flow.parse("cookie=0xaa00000000000001/0xff00000000000000, actions=drop")
+    assert flow.cookie == 0xaa00000000000001
+    assert flow.match == {}
+
+
+def test_parse_flow_without_actions():
+    with pytest.raises(ValueError):
+        Flow.parse("cookie=0x0, table=0, priority=1")
+
+
+def test_parse_table(table):
+    assert len(table) == 5
+    assert [flow.table for flow in table] == [0, 0, 0, 1, 2]
+    assert table.cookies() == {
+        0xab00000000000001: 1, 0xaa00000000000064: 2,
+        0xaa000000000000c8: 1, 0: 1,
+    }
+    assert str(table).splitlines()[0].startswith("cookie=0xab00000000000001,")
+
+
+def test_find_by_indexes(table):
+    assert len(table.find(cookie=0xaa00000000000064)) == 2
+    assert len(table.find(cookie_prefix=0xaa)) == 3
+    assert len(table.find(cookie_prefix=0xaa, table=0)) == 2
+    assert len(table.find(table=0, priority=20000)) == 2
+    assert table.find(priority=OFP_DEFAULT_PRIORITY)[0].actions == "drop"
+    assert table.find(cookie=0x1234) == []
+    assert table.find(table=9) == []
+
+
+def test_find_checks_all_the_arguments(table):
+    """The candidates come from the smallest index, the other arguments
+    are still checked on them."""
+    assert table.find(cookie=0xab00000000000001, table=1) == []
+    assert table.find(cookie_prefix=0xab, priority=20000) == []
+    flows = table.find(table=0, priority=20000, cookie_prefix=0xaa)
+    assert [flow.match["in_port"] for flow in flows] == ["1", "2"]
+
+
+def test_find_by_match_and_actions(table):
+    flow, = table.find(in_port="1", dl_vlan="100")
+    assert flow.actions == "set_field:4196->vlan_vid,output:2"
+    assert table.find(actions="output:1")[0].match["in_port"] == "2"
+    assert len(table.find(ip=None)) == 1
+    assert table.find(dl_vlan="101") == []
+    # a field the flow doesn't match on is not a None value
+    assert table.find(ip=None, in_port="2") == []
+
+
+def test_find_without_arguments(table):
+    assert table.find() == table.flows
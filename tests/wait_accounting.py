@@ -0,0 +1,229 @@
+"""Pytest plugin accounting where the wall time of each test goes.
+
+It wraps time.sleep, the requests calls, the switch CLI (Node.cmd and the
+dpctl/vsctl of the switch classes) and the NetworkTest wait helpers, and
+splits the time of each test (setup and teardown included) in:
+
+- sleep: idle time in time.sleep
+- api: time waiting for HTTP requests (the controller API)
+- cli: time waiting for switch commands
+- other: everything else, i.e. the real work and assertions
+
+Nested calls are accounted only once, in the innermost category (e.g. the
+sleeps done by a wait helper count as sleep and its requests as api), and
+the wait helpers are reported apart with their total duration. Only the
+calls made from the main thread are accounted.
+
+Enable it with ``--wait-accounting=<file.json>`` (or the WAIT_ACCOUNTING
+environment variable). With pytest-xdist, the file and the summary are
+written by the controller process with the results of all the workers.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+CATEGORIES = ("sleep", "api", "cli")
+SWITCH_CLI_METHODS = ("cmd", "dpctl", "vsctl")
+
+
+class Account:
+    """Time spent by a single test."""
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.begin = time.monotonic()
+        self.total = 0
+        self.categories = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.waits = defaultdict(float)
+        self.sleeps = defaultdict(float)
+
+    def finish(self):
+        self.total = time.monotonic() - self.begin
+
+    def as_dict(self):
+        other = self.total - sum(self.categories.values())
+        return {
+            "nodeid": self.nodeid,
+            "total": round(self.total, 3),
+            **{name: round(self.categories[name], 3) for name in CATEGORIES},
+            "other": round(max(other, 0), 3),
+            "calls": dict(self.calls),
+            "waits": {k: round(v, 3) for k, v in self.waits.items()},
+            "sleeps": {k: round(v, 3) for k, v in self.sleeps.items()},
+        }
+
+
+class WaitAccounting:
+    """Wrap the blocking calls and account them to the running test."""
+
+    def __init__(self, path):
+        self.path = path
+        self.results = []
+        self.current = None
+        self.stack = []
+        self.originals = []
+
+    def patch(self, owner, name, wrapper_factory):
+        original = owner.__dict__.get(name)
+        if original is None:
+            return
+        self.originals.append((owner, name, original))
+        setattr(owner, name, wrapper_factory(original))
+
+    def unpatch(self):
+        for owner, name, original in reversed(self.originals):
+            setattr(owner, name, original)
+        self.originals.clear()
+
+    def account(self, category, original):
+        """Wrapper accounting the exclusive time of original in category."""
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            if self.current is None or \
+                    threading.current_thread() is not threading.main_thread():
+                return original(*args, **kwargs)
+            entry = [category, 0.0]
+            self.stack.append(entry)
+            begin = time.monotonic()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = time.monotonic() - begin
+                self.stack.pop()
+                if self.current is not None:
+                    self.current.categories[category] += elapsed - entry[1]
+                    self.current.calls[category] += 1
+                    if category == "sleep":
+                        self.current.sleeps[self.caller()] += elapsed
+                if self.stack:
+                    self.stack[-1][1] += elapsed
+        return wrapper
+
+    def account_wait(self, name, original):
+        """Wrapper accounting the total time of the wait helper name."""
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            if self.current is None or \
+                    threading.current_thread() is not threading.main_thread():
+                return original(*args, **kwargs)
+            begin = time.monotonic()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                if self.current is not None:
+                    self.current.waits[name] += time.monotonic() - begin
+        return wrapper
+
+    def account_wait_until(self, seconds):
+        if self.current is not None and \
+                threading.current_thread() is threading.main_thread():
+            self.current.waits["wait_until"] += seconds
+
+    @staticmethod
+    def caller():
+        """Location of the time.sleep call, skipping the wrappers."""
+        frame = sys._getframe(2)
+        while frame and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        if frame is None:
+            return "unknown"
+        return f"{os.path.relpath(frame.f_code.co_filename)}:{frame.f_lineno}"
+
+    def install(self):
+        self.patch(time, "sleep", functools.partial(self.account, "sleep"))
+        try:
+            import requests
+            from mininet.node import Node
+            from tests import helpers
+        except ImportError:
+            return
+        self.patch(requests.Session, "request",
+                   functools.partial(self.account, "api"))
+        self.patch(Node, "cmd", functools.partial(self.account, "cli"))
+        switch_classes = {helpers.OVSSwitch}
+        if helpers.HAS_NOVISWITCH:
+            switch_classes.add(helpers.NoviSwitch)
+        if helpers.HAS_P4OFSWITCH:
+            switch_classes.add(helpers.P4OfSwitch)
+        for cls in switch_classes:
+            for name in SWITCH_CLI_METHODS:
+                if name != "cmd":
+                    self.patch(cls, name, functools.partial(self.account, "cli"))
+        for name, value in list(vars(helpers.NetworkTest).items()):
+            if name.startswith("wait_") and callable(value):
+                self.patch(helpers.NetworkTest, name, functools.partial(
+                    self.account_wait, f"NetworkTest.{name}"
+                ))
+        # the suites import wait_until by name, so it calls back instead
+        self.originals.append((helpers, "wait_until_hook", helpers.wait_until_hook))
+        helpers.wait_until_hook = self.account_wait_until
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.current = Account(item.nodeid)
+        self.stack.clear()
+        try:
+            yield
+        finally:
+            self.current.finish()
+            self.results.append(self.current.as_dict())
+            self.current = None
+
+    def pytest_unconfigure(self, config):
+        self.unpatch()
+
+    def pytest_sessionfinish(self, session):
+        # with pytest-xdist, the workers send their results to the
+        # controller (see pytest_testnodedown), which writes all of them
+        if hasattr(session.config, "workeroutput"):
+            session.config.workeroutput["wait_accounting"] = self.results
+            return
+        totals = {
+            name: round(sum(res[name] for res in self.results), 3)
+            for name in ("total",) + CATEGORIES + ("other",)
+        }
+        with open(self.path, "w") as f:
+            json.dump({"totals": totals, "tests": self.results}, f, indent=2)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collect the results of a pytest-xdist worker."""
+        output = getattr(node, "workeroutput", {})
+        self.results.extend(output.get("wait_accounting", []))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        write = terminalreporter.write_line
+        terminalreporter.section("wait accounting", sep="-", bold=True)
+        write(f"{'total':>8} {'sleep':>8} {'api':>8} {'cli':>8} {'other':>8}  test")
+        for res in sorted(self.results, key=lambda r: r["sleep"], reverse=True):
+            write(
+                f"{res['total']:8.2f} {res['sleep']:8.2f} {res['api']:8.2f}"
+                f" {res['cli']:8.2f} {res['other']:8.2f}  {res['nodeid']}"
+            )
+
+        sleeps = defaultdict(float)
+        waits = defaultdict(float)
+        for res in self.results:
+            for location, seconds in res["sleeps"].items():
+                sleeps[location] += seconds
+            for name, seconds in res["waits"].items():
+                waits[name] += seconds
+        write("")
+        write("time.sleep by location:")
+        for location, seconds in sorted(sleeps.items(), key=lambda i: -i[1]):
+            write(f"{seconds:10.2f}s  {location}")
+        if waits:
+            write("")
+            write("wait helpers:")
+        for name, seconds in sorted(waits.items(), key=lambda i: -i[1]):
+            write(f"{seconds:10.2f}s  {name}")
+        write(f"wait accounting written to {self.path}")